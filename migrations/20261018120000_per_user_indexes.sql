@@ -0,0 +1,17 @@
+-- +goose NO TRANSACTION
+-- +goose Up
+CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS categories_user_id_name_key
+ON categories (user_id, name);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS notes_user_id_updated_at_idx
+ON notes (user_id, updated_at);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS notes_categories_category_id_idx
+ON notes_categories (category_id);
+
+-- +goose Down
+DROP INDEX CONCURRENTLY IF EXISTS notes_categories_category_id_idx;
+
+DROP INDEX CONCURRENTLY IF EXISTS notes_user_id_updated_at_idx;
+
+DROP INDEX CONCURRENTLY IF EXISTS categories_user_id_name_key;
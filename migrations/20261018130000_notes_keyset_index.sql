@@ -0,0 +1,12 @@
+-- +goose NO TRANSACTION
+-- +goose Up
+CREATE INDEX CONCURRENTLY IF NOT EXISTS notes_user_id_updated_at_id_idx
+ON notes (user_id, updated_at, id);
+
+DROP INDEX CONCURRENTLY IF EXISTS notes_user_id_updated_at_idx;
+
+-- +goose Down
+CREATE INDEX CONCURRENTLY IF NOT EXISTS notes_user_id_updated_at_idx
+ON notes (user_id, updated_at);
+
+DROP INDEX CONCURRENTLY IF EXISTS notes_user_id_updated_at_id_idx;
@@ -0,0 +1,72 @@
+-- +goose NO TRANSACTION
+-- +goose Up
+CREATE EXTENSION IF NOT EXISTS btree_gin;
+
+-- A STORED generated column would rewrite notes under an ACCESS EXCLUSIVE
+-- lock. Instead add a nullable column (a catalog-only change), keep it up to
+-- date with a trigger and backfill existing rows in committed batches, so
+-- reads and writes continue while the migration runs.
+ALTER TABLE notes ADD COLUMN IF NOT EXISTS search TSVECTOR;
+
+-- +goose StatementBegin
+CREATE OR REPLACE FUNCTION note_search(title TEXT, content TEXT)
+RETURNS TSVECTOR AS $$
+    SELECT
+        setweight(to_tsvector('simple', title), 'A') ||
+        setweight(to_tsvector('simple', coalesce(content, '')), 'B');
+$$ LANGUAGE sql IMMUTABLE;
+-- +goose StatementEnd
+
+-- +goose StatementBegin
+CREATE OR REPLACE FUNCTION record_note_search() RETURNS TRIGGER AS $$
+BEGIN
+    NEW.search := note_search(NEW.title::TEXT, NEW.content);
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+-- +goose StatementEnd
+
+CREATE OR REPLACE TRIGGER notes_record_search
+BEFORE INSERT OR UPDATE OF title, content ON notes
+FOR EACH ROW EXECUTE FUNCTION record_note_search();
+
+-- Rows written from here on are covered by the trigger. Walk the primary key
+-- and commit after every batch so no lock is held for the whole table.
+-- +goose StatementBegin
+DO $$
+DECLARE
+    last_id UUID := '00000000-0000-0000-0000-000000000000';
+BEGIN
+    LOOP
+        WITH batch AS (
+            SELECT id FROM notes
+            WHERE id > last_id
+            ORDER BY id
+            LIMIT 1000
+        ), backfill AS (
+            UPDATE notes
+            SET search = note_search(notes.title::TEXT, notes.content)
+            FROM batch
+            WHERE notes.id = batch.id AND notes.search IS NULL
+        )
+        SELECT id INTO last_id FROM batch ORDER BY id DESC LIMIT 1;
+        EXIT WHEN NOT FOUND;
+        COMMIT;
+    END LOOP;
+END;
+$$;
+-- +goose StatementEnd
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS notes_user_id_search_idx
+ON notes USING GIN (user_id, search);
+
+-- +goose Down
+DROP INDEX CONCURRENTLY IF EXISTS notes_user_id_search_idx;
+
+DROP TRIGGER IF EXISTS notes_record_search ON notes;
+
+DROP FUNCTION IF EXISTS record_note_search();
+
+DROP FUNCTION IF EXISTS note_search(TEXT, TEXT);
+
+ALTER TABLE notes DROP COLUMN IF EXISTS search;
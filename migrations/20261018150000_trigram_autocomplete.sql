@@ -0,0 +1,14 @@
+-- +goose NO TRANSACTION
+-- +goose Up
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS notes_user_id_title_trgm_idx
+ON notes USING GIN (user_id, lower(title::TEXT) gin_trgm_ops);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS categories_user_id_name_trgm_idx
+ON categories USING GIN (user_id, lower(name::TEXT) gin_trgm_ops);
+
+-- +goose Down
+DROP INDEX CONCURRENTLY IF EXISTS categories_user_id_name_trgm_idx;
+
+DROP INDEX CONCURRENTLY IF EXISTS notes_user_id_title_trgm_idx;
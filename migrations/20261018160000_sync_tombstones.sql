@@ -0,0 +1,49 @@
+-- +goose NO TRANSACTION
+-- +goose Up
+CREATE TABLE IF NOT EXISTS tombstones (
+    entity VARCHAR(32) NOT NULL,
+    id UUID NOT NULL,
+    user_id UUID NOT NULL,
+    deleted_at TIMESTAMP WITH TIME ZONE NOT NULL,
+    PRIMARY KEY (entity, id),
+    FOREIGN KEY (user_id) REFERENCES users (id) ON DELETE CASCADE
+);
+
+CREATE INDEX IF NOT EXISTS tombstones_user_id_entity_deleted_at_id_idx
+ON tombstones (user_id, entity, deleted_at, id);
+
+-- Rows deleted along with their user get no tombstone: nobody is left to
+-- sync them, and the user row they would reference is already gone.
+-- +goose StatementBegin
+CREATE OR REPLACE FUNCTION record_tombstone() RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO tombstones (entity, id, user_id, deleted_at)
+    SELECT TG_TABLE_NAME, OLD.id, OLD.user_id, now()
+    WHERE EXISTS (SELECT 1 FROM users WHERE id = OLD.user_id)
+    ON CONFLICT (entity, id) DO UPDATE SET deleted_at = EXCLUDED.deleted_at;
+    RETURN OLD;
+END;
+$$ LANGUAGE plpgsql;
+-- +goose StatementEnd
+
+CREATE OR REPLACE TRIGGER notes_record_tombstone
+AFTER DELETE ON notes
+FOR EACH ROW EXECUTE FUNCTION record_tombstone();
+
+CREATE OR REPLACE TRIGGER categories_record_tombstone
+AFTER DELETE ON categories
+FOR EACH ROW EXECUTE FUNCTION record_tombstone();
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS categories_user_id_updated_at_id_idx
+ON categories (user_id, updated_at, id);
+
+-- +goose Down
+DROP INDEX CONCURRENTLY IF EXISTS categories_user_id_updated_at_id_idx;
+
+DROP TRIGGER IF EXISTS categories_record_tombstone ON categories;
+
+DROP TRIGGER IF EXISTS notes_record_tombstone ON notes;
+
+DROP FUNCTION IF EXISTS record_tombstone();
+
+DROP TABLE IF EXISTS tombstones;
@@ -0,0 +1,77 @@
+-- +goose NO TRANSACTION
+-- +goose Up
+ALTER TABLE notes
+ADD COLUMN IF NOT EXISTS change_id BIGINT NOT NULL DEFAULT 0;
+
+ALTER TABLE categories
+ADD COLUMN IF NOT EXISTS change_id BIGINT NOT NULL DEFAULT 0;
+
+ALTER TABLE tombstones
+ADD COLUMN IF NOT EXISTS change_id BIGINT NOT NULL DEFAULT 0;
+
+-- Every write stamps its row with the id of the writing transaction. Sync
+-- pages through changes by it instead of updated_at, which clients control
+-- (imports) and which is taken long before the write commits: no change
+-- below the oldest running transaction (pg_snapshot_xmin) can still appear.
+-- +goose StatementBegin
+CREATE OR REPLACE FUNCTION record_change() RETURNS TRIGGER AS $$
+BEGIN
+    NEW.change_id := pg_current_xact_id()::TEXT::BIGINT;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+-- +goose StatementEnd
+
+CREATE OR REPLACE TRIGGER notes_record_change
+BEFORE INSERT OR UPDATE ON notes
+FOR EACH ROW EXECUTE FUNCTION record_change();
+
+CREATE OR REPLACE TRIGGER categories_record_change
+BEFORE INSERT OR UPDATE ON categories
+FOR EACH ROW EXECUTE FUNCTION record_change();
+
+CREATE OR REPLACE TRIGGER tombstones_record_change
+BEFORE INSERT OR UPDATE ON tombstones
+FOR EACH ROW EXECUTE FUNCTION record_change();
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS notes_user_id_change_id_id_idx
+ON notes (user_id, change_id, id);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS categories_user_id_change_id_id_idx
+ON categories (user_id, change_id, id);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS
+tombstones_user_id_entity_change_id_id_idx
+ON tombstones (user_id, entity, change_id, id);
+
+DROP INDEX CONCURRENTLY IF EXISTS categories_user_id_updated_at_id_idx;
+
+DROP INDEX CONCURRENTLY IF EXISTS tombstones_user_id_entity_deleted_at_id_idx;
+
+-- +goose Down
+CREATE INDEX CONCURRENTLY IF NOT EXISTS
+tombstones_user_id_entity_deleted_at_id_idx
+ON tombstones (user_id, entity, deleted_at, id);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS categories_user_id_updated_at_id_idx
+ON categories (user_id, updated_at, id);
+
+DROP INDEX CONCURRENTLY IF EXISTS tombstones_user_id_entity_change_id_id_idx;
+
+DROP INDEX CONCURRENTLY IF EXISTS categories_user_id_change_id_id_idx;
+
+DROP INDEX CONCURRENTLY IF EXISTS notes_user_id_change_id_id_idx;
+
+DROP TRIGGER IF EXISTS tombstones_record_change ON tombstones;
+
+DROP TRIGGER IF EXISTS categories_record_change ON categories;
+
+DROP TRIGGER IF EXISTS notes_record_change ON notes;
+
+DROP FUNCTION IF EXISTS record_change();
+
+ALTER TABLE tombstones DROP COLUMN IF EXISTS change_id;
+
+ALTER TABLE categories DROP COLUMN IF EXISTS change_id;
+
+ALTER TABLE notes DROP COLUMN IF EXISTS change_id;
@@ -4,7 +4,14 @@ from fastapi_lifespan_manager import LifespanManager
 from src.auth.drivers.rest.exception_handlers import (
     exception_handlers as auth_exception_handlers,
 )
+from src.auth.drivers.rest.internal_router import (
+    router as auth_internal_router,
+)
+from src.auth.drivers.rest.lifespans import lifespans as auth_lifespans
 from src.auth.drivers.rest.router import router as auth_router
+from src.common.drivers.rest.internal_router import (
+    router as common_internal_router,
+)
 from src.common.drivers.rest.lifespans import lifespans as common_lifespans
 from src.common.drivers.rest.router import router as common_router
 from src.common.types import ExceptionHandlerEntry
@@ -20,11 +27,14 @@ exception_handlers: list[ExceptionHandlerEntry] = [
 
 lifespans = [
     *common_lifespans,
+    *auth_lifespans,
 ]
 
 routers = [
     auth_router,
+    auth_internal_router,
     common_router,
+    common_internal_router,
     core_router,
 ]
 
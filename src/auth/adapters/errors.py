@@ -3,7 +3,13 @@ from src.common.adapters.errors import ExternalError
 
 class HashingError(ExternalError):
     def __init__(self, error: Exception) -> None:
+        super().__init__(error)
         self.error = error
 
     def __str__(self) -> str:
         return str(self.error)
+
+
+class PasswordHasherBusyError(ExternalError):
+    def __init__(self, msg: str = "Password hasher is busy") -> None:
+        super().__init__(msg)
@@ -0,0 +1,80 @@
+import asyncio
+import time
+from collections.abc import Callable
+from concurrent.futures import Executor
+from functools import partial
+from typing import TypeVar
+
+from pydantic import BaseModel
+
+from src.auth.adapters.errors import PasswordHasherBusyError
+from src.auth.ports.async_password_hasher import AsyncPasswordHasher
+from src.auth.ports.password_hasher import PasswordHasher
+
+T = TypeVar("T")
+
+
+class ExecutorPasswordHasherStats(BaseModel):
+    pending: int
+    peak_pending: int
+    max_pending: int
+    completed: int
+    rejected: int
+    total_seconds: float
+
+
+class ExecutorPasswordHasher(AsyncPasswordHasher):
+    def __init__(
+        self,
+        password_hasher: PasswordHasher,
+        executor: Executor,
+        *,
+        max_pending: int,
+    ) -> None:
+        self._password_hasher = password_hasher
+        self._executor = executor
+        self._max_pending = max_pending
+        self._pending = 0
+        self._peak_pending = 0
+        self._completed = 0
+        self._rejected = 0
+        self._total_seconds = 0.0
+
+    async def _run(self, func: Callable[[], T]) -> T:
+        if self._pending >= self._max_pending:
+            self._rejected += 1
+            raise PasswordHasherBusyError()
+
+        self._pending += 1
+        self._peak_pending = max(self._peak_pending, self._pending)
+        start = time.perf_counter()
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, func)
+        finally:
+            self._pending -= 1
+            self._completed += 1
+            self._total_seconds += time.perf_counter() - start
+
+    async def verify(self, hash_: str, password: str) -> bool:
+        return await self._run(
+            partial(self._password_hasher.verify, hash_, password),
+        )
+
+    async def hash(self, password: str) -> str:
+        return await self._run(
+            partial(self._password_hasher.hash, password),
+        )
+
+    async def needs_rehash(self, hash_: str) -> bool:
+        return self._password_hasher.needs_rehash(hash_)
+
+    def stats(self) -> ExecutorPasswordHasherStats:
+        return ExecutorPasswordHasherStats(
+            pending=self._pending,
+            peak_pending=self._peak_pending,
+            max_pending=self._max_pending,
+            completed=self._completed,
+            rejected=self._rejected,
+            total_seconds=self._total_seconds,
+        )
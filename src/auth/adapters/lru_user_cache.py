@@ -0,0 +1,19 @@
+from uuid import UUID
+
+from src.auth.domain.entities import User
+from src.auth.ports.user_cache import UserCache
+from src.common.lru_cache import LruCache
+
+
+class LruUserCache(UserCache):
+    def __init__(self, cache: LruCache[UUID, User]) -> None:
+        self._cache = cache
+
+    def get(self, user_id: UUID) -> User | None:
+        return self._cache.get(user_id)
+
+    def set(self, user: User) -> None:
+        self._cache.set(user.id, user)
+
+    def invalidate(self, user_id: UUID) -> None:
+        self._cache.delete(user_id)
@@ -1,12 +1,25 @@
+import hashlib
+from datetime import UTC, datetime
+
 import jwt
 
 from src.auth.ports.jwt_manager import JwtManager, TokenPayload
+from src.common.lru_cache import LruCache
 
 
 class PyJwtManager(JwtManager):
-    def __init__(self, secret_key: str, algorithm: str) -> None:
+    def __init__(
+        self,
+        secret_key: str,
+        algorithm: str,
+        *,
+        cache: LruCache[bytes, TokenPayload] | None = None,
+    ) -> None:
         self._secret_key = secret_key
         self._algorithm = algorithm
+        self._cache = (
+            LruCache[bytes, TokenPayload](0) if cache is None else cache
+        )
 
     def encode(self, payload: TokenPayload) -> str:
         claims = payload.model_dump(exclude_none=True)
@@ -17,6 +30,17 @@ class PyJwtManager(JwtManager):
         )
 
     def decode(self, token: str) -> TokenPayload | None:
+        key = hashlib.sha256(token.encode()).digest()
+        now = datetime.now(UTC)
+
+        cached_payload = self._cache.get(key)
+        if cached_payload is not None:
+            if cached_payload.nbf <= now < cached_payload.exp:
+                return cached_payload
+
+            self._cache.delete(key)
+            return None
+
         try:
             payload = jwt.decode(
                 token,
@@ -26,4 +50,8 @@ class PyJwtManager(JwtManager):
         except jwt.exceptions.PyJWTError:
             return None
 
-        return TokenPayload.model_validate(payload)
+        token_payload = TokenPayload.model_validate(payload)
+        ttl = (token_payload.exp - now).total_seconds()
+        self._cache.set(key, token_payload, ttl=ttl)
+
+        return token_payload
@@ -1,17 +1,39 @@
+from datetime import datetime
 from uuid import UUID
 
-from psycopg import errors
+from psycopg import AsyncConnection, errors, sql
+from psycopg.rows import DictRow
+from psycopg_pool import AsyncConnectionPool
 
 from src.auth.domain.entities import User
-from src.auth.ports.repositories.user_repository import UserRepository
+from src.auth.ports.repositories.user_repository import (
+    UserChanges,
+    UserRepository,
+)
 from src.common.adapters.errors import DatabaseError
+from src.common.adapters.postgres.model_row import columns
 from src.common.adapters.postgres.postgres_repository import PostgresRepository
+from src.common.adapters.postgres.query_recorder import instrumented
+from src.common.lru_cache import LruCache
+
+USER_COLUMNS = columns(User)
 
 
 class PostgresUserRepository(PostgresRepository, UserRepository):
+    def __init__(
+        self,
+        pool: AsyncConnectionPool[AsyncConnection[DictRow]],
+        replica_pool: AsyncConnectionPool[AsyncConnection[DictRow]]
+        | None = None,
+        recent_writes: LruCache[UUID, bool] | None = None,
+    ) -> None:
+        super().__init__(pool, replica_pool)
+        self._recent_writes = recent_writes
+
+    @instrumented
     async def create(self, user: User) -> None:
         try:
-            await self._query(
+            await self._execute(
                 """
                 INSERT INTO users (
                     id,
@@ -36,39 +58,80 @@ class PostgresUserRepository(PostgresRepository, UserRepository):
         except errors.Error as error:
             raise DatabaseError(error) from error
 
-    async def find_by_email(self, email: str) -> User | None:
+        self._mark_written(user.id)
+
+    @instrumented
+    async def create_if_not_exists(self, user: User) -> bool:
         try:
-            cursor = await self._query(
-                "SELECT * FROM users WHERE email = %s;",
-                [email],
+            row = await self._fetch_one(
+                """
+                INSERT INTO users (
+                    id,
+                    email,
+                    password,
+                    first_name,
+                    last_name,
+                    updated_at,
+                    created_at
+                ) VALUES (
+                    %(id)s,
+                    %(email)s,
+                    %(password)s,
+                    %(first_name)s,
+                    %(last_name)s,
+                    %(updated_at)s,
+                    %(created_at)s
+                )
+                ON CONFLICT (email) DO NOTHING
+                RETURNING id;
+                """,
+                user.model_dump(),
             )
-            result = await cursor.fetchall()
         except errors.Error as error:
             raise DatabaseError(error) from error
 
-        if len(result) == 0:
-            return None
+        if row is None:
+            return False
+
+        self._mark_written(user.id)
+        return True
 
-        return User.model_validate(result[0])
+    @instrumented
+    async def find_by_email(self, email: str) -> User | None:
+        # Credentials are always read from the primary: the recent writes
+        # only know about this process, so a lagging replica could still
+        # accept an email or password changed through another worker.
+        try:
+            return await self._fetch_model(
+                User,
+                sql.SQL("SELECT {} FROM users WHERE email = %s;").format(
+                    USER_COLUMNS,
+                ),
+                [email],
+                prepare=True,
+            )
+        except errors.Error as error:
+            raise DatabaseError(error) from error
 
+    @instrumented
     async def find_by_id(self, user_id: UUID) -> User | None:
         try:
-            cursor = await self._query(
-                "SELECT * FROM users WHERE id = %s;",
+            return await self._fetch_model(
+                User,
+                sql.SQL("SELECT {} FROM users WHERE id = %s;").format(
+                    USER_COLUMNS,
+                ),
                 [user_id],
+                prepare=True,
+                replica=self._read_from_replica(user_id),
             )
-            result = await cursor.fetchall()
         except errors.Error as error:
             raise DatabaseError(error) from error
 
-        if len(result) == 0:
-            return None
-
-        return User.model_validate(result[0])
-
+    @instrumented
     async def update(self, user: User) -> None:
         try:
-            await self._query(
+            await self._execute(
                 """
                 UPDATE users
                 SET
@@ -84,3 +147,113 @@ class PostgresUserRepository(PostgresRepository, UserRepository):
             )
         except errors.Error as error:
             raise DatabaseError(error) from error
+
+        self._mark_written(user.id)
+
+    @instrumented
+    async def update_changes(
+        self,
+        user_id: UUID,
+        changes: UserChanges,
+        expected_updated_at: list[datetime] | None = None,
+    ) -> User | None:
+        values = changes.model_dump(exclude_none=True, exclude={"updated_at"})
+        assignments = sql.SQL(", ").join(
+            [
+                *(
+                    sql.SQL("{} = {}").format(
+                        sql.Identifier(column),
+                        sql.Placeholder(column),
+                    )
+                    for column in values
+                ),
+                # updated_at only moves forward, even for two updates within
+                # the same second, so (id, updated_at) identifies a version.
+                sql.SQL(
+                    "updated_at = GREATEST(%(updated_at)s, "
+                    "updated_at + INTERVAL '1 microsecond')"
+                ),
+            ]
+        )
+        condition = (
+            sql.SQL("AND updated_at = ANY(%(expected_updated_at)s)")
+            if expected_updated_at is not None
+            else sql.SQL("")
+        )
+        try:
+            user = await self._fetch_model(
+                User,
+                sql.SQL(
+                    """
+                    UPDATE users
+                    SET {assignments}
+                    WHERE id = %(id)s
+                    {condition}
+                    AND NOT EXISTS (
+                        SELECT 1 FROM users
+                        WHERE email = %(email)s
+                        AND id <> %(id)s
+                    )
+                    RETURNING {columns};
+                    """
+                ).format(
+                    assignments=assignments,
+                    condition=condition,
+                    columns=USER_COLUMNS,
+                ),
+                {
+                    **values,
+                    "id": user_id,
+                    "email": changes.email,
+                    "updated_at": changes.updated_at,
+                    "expected_updated_at": expected_updated_at,
+                },
+            )
+        except errors.UniqueViolation:
+            return None
+        except errors.Error as error:
+            raise DatabaseError(error) from error
+
+        if user is None:
+            return None
+
+        self._mark_written(user.id)
+        return user
+
+    @instrumented
+    async def update_password(
+        self,
+        user_id: UUID,
+        old_password: str,
+        new_password: str,
+    ) -> None:
+        try:
+            await self._execute(
+                """
+                UPDATE users
+                SET password = %(new_password)s
+                WHERE id = %(id)s
+                AND password = %(old_password)s;
+                """,
+                {
+                    "id": user_id,
+                    "old_password": old_password,
+                    "new_password": new_password,
+                },
+            )
+        except errors.Error as error:
+            raise DatabaseError(error) from error
+
+        self._mark_written(user_id)
+
+    def _mark_written(self, user_id: UUID) -> None:
+        if self._recent_writes is None:
+            return
+
+        self._recent_writes.set(user_id, value=True)
+
+    def _read_from_replica(self, user_id: UUID) -> bool:
+        if self._recent_writes is None:
+            return True
+
+        return self._recent_writes.get(user_id) is None
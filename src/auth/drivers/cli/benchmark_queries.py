@@ -0,0 +1,113 @@
+import argparse
+import asyncio
+import os
+import statistics
+import time
+from collections.abc import Sequence
+from uuid import uuid4
+
+from psycopg import AsyncConnection
+from psycopg.rows import DictRow, dict_row
+from psycopg_pool import AsyncConnectionPool
+from pydantic import BaseModel
+
+from src.auth.adapters.repositories.postgres.postgres_user_repository import (
+    PostgresUserRepository,
+)
+from src.common.adapters.postgres.singleton_async_pool import (
+    PREPARE_THRESHOLD,
+)
+from src.common.drivers.cli.latency import MIN_SAMPLES
+
+
+class BenchmarkResult(BaseModel):
+    prepared: bool
+    queries: int
+    queries_per_second: float
+    p50_ms: float
+    p99_ms: float
+
+
+async def benchmark(
+    database_url: str,
+    *,
+    prepared: bool,
+    iterations: int,
+) -> BenchmarkResult:
+    async with AsyncConnectionPool(
+        database_url,
+        min_size=1,
+        max_size=1,
+        connection_class=AsyncConnection[DictRow],
+        kwargs={
+            "row_factory": dict_row,
+            "prepare_threshold": PREPARE_THRESHOLD if prepared else None,
+        },
+        open=False,
+    ) as pool:
+        repository = PostgresUserRepository(pool)
+        latencies: list[float] = []
+
+        total_start = time.perf_counter()
+        for _ in range(iterations):
+            start = time.perf_counter()
+            await repository.find_by_email(f"{uuid4().hex}@example.com")
+            await repository.find_by_id(uuid4())
+            latencies.append(time.perf_counter() - start)
+        total_seconds = time.perf_counter() - total_start
+
+    queries = iterations * 2
+    percentiles = statistics.quantiles(latencies, n=100, method="inclusive")
+
+    return BenchmarkResult(
+        prepared=prepared,
+        queries=queries,
+        queries_per_second=queries / total_seconds,
+        p50_ms=statistics.median(latencies) * 1000,
+        p99_ms=percentiles[98] * 1000,
+    )
+
+
+def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Benchmark the auth lookup queries with and without "
+            "prepared statements"
+        ),
+    )
+    parser.add_argument(
+        "--database-url",
+        default=os.environ.get("DATABASE_URL"),
+        required="DATABASE_URL" not in os.environ,
+    )
+    parser.add_argument("--iterations", type=int, default=1000)
+    args = parser.parse_args(argv)
+    if args.iterations < MIN_SAMPLES:
+        parser.error(f"--iterations must be at least {MIN_SAMPLES}")
+    return args
+
+
+async def run(args: argparse.Namespace) -> None:
+    print(
+        f"{'prepared':>8} {'queries':>8} {'queries/s':>10} "
+        f"{'p50_ms':>8} {'p99_ms':>8}"
+    )
+    for prepared in (False, True):
+        result = await benchmark(
+            args.database_url,
+            prepared=prepared,
+            iterations=args.iterations,
+        )
+        print(
+            f"{result.prepared!s:>8} {result.queries:>8} "
+            f"{result.queries_per_second:>10.1f} "
+            f"{result.p50_ms:>8.3f} {result.p99_ms:>8.3f}"
+        )
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    asyncio.run(run(parse_args(argv)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+import argparse
+import itertools
+import os
+import secrets
+import statistics
+import time
+from collections.abc import Sequence
+
+import argon2
+from pydantic import BaseModel
+
+from src.common.drivers.cli.latency import MIN_SAMPLES
+
+
+class CalibrationResult(BaseModel):
+    time_cost: int
+    memory_cost: int
+    parallelism: int
+    hashes_per_second_per_core: float
+    hashes_per_second_per_host: float
+    p50_ms: float
+    p99_ms: float
+
+
+def calibrate(
+    time_cost: int,
+    memory_cost: int,
+    parallelism: int,
+    *,
+    iterations: int,
+) -> CalibrationResult:
+    password_hasher = argon2.PasswordHasher(
+        time_cost=time_cost,
+        memory_cost=memory_cost,
+        parallelism=parallelism,
+    )
+    password = secrets.token_urlsafe(16)
+    latencies: list[float] = []
+
+    cpu_start = time.process_time()
+    for _ in range(iterations):
+        start = time.perf_counter()
+        password_hasher.hash(password)
+        latencies.append(time.perf_counter() - start)
+    cpu_seconds = time.process_time() - cpu_start
+
+    percentiles = statistics.quantiles(latencies, n=100, method="inclusive")
+    per_core = iterations / cpu_seconds if cpu_seconds > 0 else 0.0
+
+    return CalibrationResult(
+        time_cost=time_cost,
+        memory_cost=memory_cost,
+        parallelism=parallelism,
+        hashes_per_second_per_core=per_core,
+        hashes_per_second_per_host=per_core * (os.cpu_count() or 1),
+        p50_ms=statistics.median(latencies) * 1000,
+        p99_ms=percentiles[98] * 1000,
+    )
+
+
+def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Benchmark argon2 cost parameters on this host",
+    )
+    parser.add_argument(
+        "--time-cost",
+        type=int,
+        nargs="+",
+        default=[1, 2, 3, 4],
+    )
+    parser.add_argument(
+        "--memory-cost",
+        type=int,
+        nargs="+",
+        default=[19456, 47104, 65536],
+        help="memory cost in KiB",
+    )
+    parser.add_argument(
+        "--parallelism",
+        type=int,
+        nargs="+",
+        default=[1, 2, 4],
+    )
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args(argv)
+    if args.iterations < MIN_SAMPLES:
+        parser.error(f"--iterations must be at least {MIN_SAMPLES}")
+    return args
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    args = parse_args(argv)
+    candidates = itertools.product(
+        args.time_cost,
+        args.memory_cost,
+        args.parallelism,
+    )
+
+    print(
+        f"{'time_cost':>9} {'memory_cost':>11} {'parallelism':>11} "
+        f"{'hashes/s/core':>13} {'hashes/s/host':>13} "
+        f"{'p50_ms':>8} {'p99_ms':>8}"
+    )
+    for time_cost, memory_cost, parallelism in candidates:
+        result = calibrate(
+            time_cost,
+            memory_cost,
+            parallelism,
+            iterations=args.iterations,
+        )
+        print(
+            f"{result.time_cost:>9} {result.memory_cost:>11} "
+            f"{result.parallelism:>11} "
+            f"{result.hashes_per_second_per_core:>13.1f} "
+            f"{result.hashes_per_second_per_host:>13.1f} "
+            f"{result.p50_ms:>8.1f} {result.p99_ms:>8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,11 @@
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
 from functools import cache
 from typing import Annotated
+from uuid import UUID
 
 import argon2
 from fastapi import Depends
@@ -9,14 +15,18 @@ from psycopg.rows import DictRow
 from psycopg_pool import AsyncConnectionPool
 
 from src.auth.adapters.argon2_password_hasher import Argon2PasswordHasher
+from src.auth.adapters.executor_password_hasher import ExecutorPasswordHasher
+from src.auth.adapters.lru_user_cache import LruUserCache
 from src.auth.adapters.py_jwt_manager import PyJwtManager
 from src.auth.adapters.repositories.postgres.postgres_user_repository import (
     PostgresUserRepository,
 )
 from src.auth.domain.entities import User
-from src.auth.ports.jwt_manager import JwtManager
+from src.auth.ports.async_password_hasher import AsyncPasswordHasher
+from src.auth.ports.jwt_manager import JwtManager, TokenPayload
 from src.auth.ports.password_hasher import PasswordHasher
 from src.auth.ports.repositories.user_repository import UserRepository
+from src.auth.ports.user_cache import UserCache
 from src.auth.use_cases.authenticate_use_case import AuthenticateUseCase
 from src.auth.use_cases.create_user_use_case import CreateUserUseCase
 from src.auth.use_cases.get_user_from_token_use_case import (
@@ -24,27 +34,105 @@ from src.auth.use_cases.get_user_from_token_use_case import (
 )
 from src.auth.use_cases.inputs import AuthenticateInput
 from src.auth.use_cases.update_user_use_case import UpdateUserUseCase
-from src.common.drivers.rest.dependencies import get_pool
+from src.common.drivers.rest.dependencies import (
+    get_pool,
+    get_replica_pool,
+)
 from src.common.drivers.rest.model_validate import model_validate
-from src.common.settings import settings
+from src.common.lru_cache import LruCache
+from src.common.settings import ExecutorEnum, settings
 
 
 @cache
 def get_password_hasher() -> PasswordHasher:
-    argon2_password_hasher = argon2.PasswordHasher()
+    argon2_password_hasher = argon2.PasswordHasher(
+        time_cost=settings.ARGON2_TIME_COST,
+        memory_cost=settings.ARGON2_MEMORY_COST,
+        parallelism=settings.ARGON2_PARALLELISM,
+    )
     return Argon2PasswordHasher(
         argon2_password_hasher,
     )
 
 
+@cache
+def get_password_hasher_executor() -> Executor:
+    if ExecutorEnum.process == settings.PASSWORD_HASHER_EXECUTOR:
+        return ProcessPoolExecutor(
+            max_workers=settings.PASSWORD_HASHER_WORKERS,
+        )
+
+    return ThreadPoolExecutor(
+        max_workers=settings.PASSWORD_HASHER_WORKERS,
+        thread_name_prefix="password-hasher",
+    )
+
+
+@cache
+def get_executor_password_hasher(
+    password_hasher: Annotated[
+        PasswordHasher,
+        Depends(get_password_hasher),
+    ],
+    executor: Annotated[
+        Executor,
+        Depends(get_password_hasher_executor),
+    ],
+) -> ExecutorPasswordHasher:
+    return ExecutorPasswordHasher(
+        password_hasher,
+        executor,
+        max_pending=settings.PASSWORD_HASHER_MAX_PENDING,
+    )
+
+
+def get_async_password_hasher(
+    password_hasher: Annotated[
+        ExecutorPasswordHasher,
+        Depends(get_executor_password_hasher),
+    ],
+) -> AsyncPasswordHasher:
+    return password_hasher
+
+
+@cache
+def get_recent_user_writes() -> LruCache[UUID, bool]:
+    return LruCache(
+        settings.DATABASE_READ_YOUR_WRITES_MAX_SIZE,
+        ttl=settings.DATABASE_READ_YOUR_WRITES_SECONDS,
+    )
+
+
 @cache
 def get_user_repository(
     pool: Annotated[
         AsyncConnectionPool[AsyncConnection[DictRow]],
         Depends(get_pool),
     ],
+    replica_pool: Annotated[
+        AsyncConnectionPool[AsyncConnection[DictRow]],
+        Depends(get_replica_pool),
+    ],
+    recent_writes: Annotated[
+        LruCache[UUID, bool],
+        Depends(get_recent_user_writes),
+    ],
+) -> UserRepository:
+    return PostgresUserRepository(pool, replica_pool, recent_writes)
+
+
+@cache
+def get_primary_user_repository(
+    pool: Annotated[
+        AsyncConnectionPool[AsyncConnection[DictRow]],
+        Depends(get_pool),
+    ],
+    recent_writes: Annotated[
+        LruCache[UUID, bool],
+        Depends(get_recent_user_writes),
+    ],
 ) -> UserRepository:
-    return PostgresUserRepository(pool)
+    return PostgresUserRepository(pool, recent_writes=recent_writes)
 
 
 @cache
@@ -54,8 +142,8 @@ def get_create_user_use_case(
         Depends(get_user_repository),
     ],
     password_hasher: Annotated[
-        PasswordHasher,
-        Depends(get_password_hasher),
+        AsyncPasswordHasher,
+        Depends(get_async_password_hasher),
     ],
 ) -> CreateUserUseCase:
     return CreateUserUseCase(
@@ -65,13 +153,42 @@ def get_create_user_use_case(
 
 
 @cache
-def get_jwt_manager() -> JwtManager:
+def get_token_cache() -> LruCache[bytes, TokenPayload]:
+    return LruCache(settings.JWT_CACHE_MAX_SIZE)
+
+
+@cache
+def get_jwt_manager(
+    token_cache: Annotated[
+        LruCache[bytes, TokenPayload],
+        Depends(get_token_cache),
+    ],
+) -> JwtManager:
     return PyJwtManager(
         settings.JWT_SECRET_KEY,
         settings.JWT_ALGORITHM,
+        cache=token_cache,
+    )
+
+
+@cache
+def get_user_lru_cache() -> LruCache[UUID, User]:
+    return LruCache(
+        settings.USER_CACHE_MAX_SIZE,
+        ttl=settings.USER_CACHE_TTL_SECONDS,
     )
 
 
+@cache
+def get_user_cache(
+    user_lru_cache: Annotated[
+        LruCache[UUID, User],
+        Depends(get_user_lru_cache),
+    ],
+) -> UserCache:
+    return LruUserCache(user_lru_cache)
+
+
 @cache
 def get_authenticate_use_case(
     user_repository: Annotated[
@@ -83,14 +200,19 @@ def get_authenticate_use_case(
         Depends(get_jwt_manager),
     ],
     password_hasher: Annotated[
-        PasswordHasher,
-        Depends(get_password_hasher),
+        AsyncPasswordHasher,
+        Depends(get_async_password_hasher),
+    ],
+    user_cache: Annotated[
+        UserCache,
+        Depends(get_user_cache),
     ],
 ) -> AuthenticateUseCase:
     return AuthenticateUseCase(
         user_repository,
         jwt_manager,
         password_hasher,
+        user_cache,
     )
 
 
@@ -119,10 +241,15 @@ def get_user_from_token_use_case(
         JwtManager,
         Depends(get_jwt_manager),
     ],
+    user_cache: Annotated[
+        UserCache,
+        Depends(get_user_cache),
+    ],
 ) -> GetUserFromTokenUseCase:
     return GetUserFromTokenUseCase(
         user_repository,
         jwt_manager,
+        user_cache,
     )
 
 
@@ -143,14 +270,19 @@ async def get_current_user(
 def get_update_user_use_case(
     user_repository: Annotated[
         UserRepository,
-        Depends(get_user_repository),
+        Depends(get_primary_user_repository),
     ],
     password_hasher: Annotated[
-        PasswordHasher,
-        Depends(get_password_hasher),
+        AsyncPasswordHasher,
+        Depends(get_async_password_hasher),
+    ],
+    user_cache: Annotated[
+        UserCache,
+        Depends(get_user_cache),
     ],
 ) -> UpdateUserUseCase:
     return UpdateUserUseCase(
         user_repository,
         password_hasher,
+        user_cache,
     )
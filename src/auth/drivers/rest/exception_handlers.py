@@ -1,9 +1,11 @@
 from fastapi import status
 
+from src.auth.adapters.errors import PasswordHasherBusyError
 from src.auth.use_cases.errors import (
     EmailAlreadyExistsError,
     InvalidCredentialsError,
     InvalidTokenError,
+    UserChangedError,
 )
 from src.common.drivers.rest.create_error_handler import create_error_handler
 from src.common.types import ExceptionHandlerEntry
@@ -27,4 +29,15 @@ exception_handlers: list[ExceptionHandlerEntry] = [
             headers={"WWW-Authenticate": "Bearer"},
         ),
     ),
+    (
+        UserChangedError,
+        create_error_handler(status.HTTP_412_PRECONDITION_FAILED),
+    ),
+    (
+        PasswordHasherBusyError,
+        create_error_handler(
+            status.HTTP_503_SERVICE_UNAVAILABLE,
+            headers={"Retry-After": "1"},
+        ),
+    ),
 ]
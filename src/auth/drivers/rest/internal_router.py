@@ -0,0 +1,70 @@
+from typing import Annotated
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, status
+
+from src.auth.adapters.executor_password_hasher import (
+    ExecutorPasswordHasher,
+    ExecutorPasswordHasherStats,
+)
+from src.auth.domain.entities import User
+from src.auth.drivers.rest.dependencies import (
+    get_executor_password_hasher,
+    get_token_cache,
+    get_user_lru_cache,
+)
+from src.auth.ports.jwt_manager import TokenPayload
+from src.common.drivers.rest.dependencies import require_internal_endpoints
+from src.common.lru_cache import LruCache, LruCacheInfo
+
+router = APIRouter(
+    prefix="/internal",
+    tags=["internal"],
+    include_in_schema=False,
+    dependencies=[Depends(require_internal_endpoints)],
+)
+
+
+@router.get(
+    "/password-hasher",
+    status_code=status.HTTP_200_OK,
+    response_model=ExecutorPasswordHasherStats,
+    summary="Password hasher worker pool stats",
+)
+def get_password_hasher_stats(
+    password_hasher: Annotated[
+        ExecutorPasswordHasher,
+        Depends(get_executor_password_hasher),
+    ],
+) -> ExecutorPasswordHasherStats:
+    return password_hasher.stats()
+
+
+@router.get(
+    "/token-cache",
+    status_code=status.HTTP_200_OK,
+    response_model=LruCacheInfo,
+    summary="Verified token cache stats",
+)
+def get_token_cache_info(
+    token_cache: Annotated[
+        LruCache[bytes, TokenPayload],
+        Depends(get_token_cache),
+    ],
+) -> LruCacheInfo:
+    return token_cache.info()
+
+
+@router.get(
+    "/user-cache",
+    status_code=status.HTTP_200_OK,
+    response_model=LruCacheInfo,
+    summary="Authenticated user cache stats",
+)
+def get_user_cache_info(
+    user_cache: Annotated[
+        LruCache[UUID, User],
+        Depends(get_user_lru_cache),
+    ],
+) -> LruCacheInfo:
+    return user_cache.info()
@@ -0,0 +1,23 @@
+import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI
+
+from src.auth.drivers.rest.dependencies import get_password_hasher_executor
+
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def setup_password_hasher_executor(
+    _app: FastAPI,
+) -> AsyncIterator[None]:
+    executor = get_password_hasher_executor()
+    logger.info("Password hasher executor started...")
+    yield
+
+    executor.shutdown(wait=False, cancel_futures=True)
+
+
+lifespans = [setup_password_hasher_executor]
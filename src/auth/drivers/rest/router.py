@@ -1,6 +1,6 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Header, Response, status
 
 from src.auth.domain.entities import User
 from src.auth.drivers.rest.dependencies import (
@@ -25,6 +25,11 @@ from src.auth.use_cases.outputs import (
 )
 from src.auth.use_cases.update_user_use_case import UpdateUserUseCase
 from src.common.drivers.rest.errors import ErrorResponse
+from src.common.drivers.rest.etag import (
+    entity_tag,
+    matching_versions,
+    none_match,
+)
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
@@ -94,6 +99,9 @@ async def post_token(
             "description": "User profile data",
             "model": GetProfileOutput,
         },
+        status.HTTP_304_NOT_MODIFIED: {
+            "description": "Profile not modified since the If-None-Match ETag",
+        },
         status.HTTP_401_UNAUTHORIZED: {
             "description": "Not authorized",
             "model": ErrorResponse,
@@ -105,7 +113,21 @@ def get_profile(
         User,
         Depends(get_current_user),
     ],
-) -> GetProfileOutput:
+    response: Response,
+    if_none_match: Annotated[str | None, Header()] = None,
+) -> GetProfileOutput | Response:
+    # current_user may come from the per-process user cache, so after an
+    # update on another worker the tag can lag by up to
+    # USER_CACHE_TTL_SECONDS. That is safe: If-Match is checked against the
+    # primary row, so a stale tag gets 412, never a lost update.
+    tag = entity_tag(current_user.id, current_user.updated_at)
+    if not none_match(if_none_match, tag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers={"ETag": tag},
+        )
+
+    response.headers["ETag"] = tag
     return GetProfileOutput.from_user(current_user)
 
 
@@ -127,6 +149,10 @@ def get_profile(
             "description": "Email already in use",
             "model": ErrorResponse,
         },
+        status.HTTP_412_PRECONDITION_FAILED: {
+            "description": "Profile changed since the If-Match ETag",
+            "model": ErrorResponse,
+        },
     },
 )
 async def post_profile(
@@ -139,5 +165,13 @@ async def post_profile(
         UpdateUserUseCase,
         Depends(get_update_user_use_case),
     ],
+    response: Response,
+    if_match: Annotated[str | None, Header()] = None,
 ) -> UpdateUserOutput:
-    return await update_user(current_user, data)
+    user = await update_user(
+        current_user,
+        data,
+        matching_versions(if_match, current_user.id),
+    )
+    response.headers["ETag"] = entity_tag(user.id, user.updated_at)
+    return user
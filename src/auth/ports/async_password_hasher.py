@@ -0,0 +1,16 @@
+from abc import ABC, abstractmethod
+from collections.abc import Awaitable
+
+
+class AsyncPasswordHasher(ABC):
+    @abstractmethod
+    def verify(self, hash_: str, password: str) -> Awaitable[bool]:
+        raise NotImplementedError  # pragma: no cover
+
+    @abstractmethod
+    def hash(self, password: str) -> Awaitable[str]:
+        raise NotImplementedError  # pragma: no cover
+
+    @abstractmethod
+    def needs_rehash(self, hash_: str) -> Awaitable[bool]:
+        raise NotImplementedError  # pragma: no cover
@@ -1,8 +1,20 @@
+import datetime
 from abc import ABC, abstractmethod
 from collections.abc import Awaitable
 from uuid import UUID
 
+from pydantic import BaseModel, Field
+
 from src.auth.domain.entities import User
+from src.common.datetime import Datetime
+
+
+class UserChanges(BaseModel):
+    email: str | None = None
+    password: str | None = None
+    first_name: str | None = None
+    last_name: str | None = None
+    updated_at: datetime.datetime = Field(default_factory=Datetime.now)
 
 
 class UserRepository(ABC):
@@ -10,6 +22,10 @@ class UserRepository(ABC):
     def create(self, user: User) -> Awaitable[None]:
         raise NotImplementedError  # pragma: no cover
 
+    @abstractmethod
+    def create_if_not_exists(self, user: User) -> Awaitable[bool]:
+        raise NotImplementedError  # pragma: no cover
+
     @abstractmethod
     def find_by_email(self, email: str) -> Awaitable[User | None]:
         raise NotImplementedError  # pragma: no cover
@@ -21,3 +37,21 @@ class UserRepository(ABC):
     @abstractmethod
     def update(self, user: User) -> Awaitable[None]:
         raise NotImplementedError  # pragma: no cover
+
+    @abstractmethod
+    def update_changes(
+        self,
+        user_id: UUID,
+        changes: UserChanges,
+        expected_updated_at: list[datetime.datetime] | None = None,
+    ) -> Awaitable[User | None]:
+        raise NotImplementedError  # pragma: no cover
+
+    @abstractmethod
+    def update_password(
+        self,
+        user_id: UUID,
+        old_password: str,
+        new_password: str,
+    ) -> Awaitable[None]:
+        raise NotImplementedError  # pragma: no cover
@@ -0,0 +1,18 @@
+from abc import ABC, abstractmethod
+from uuid import UUID
+
+from src.auth.domain.entities import User
+
+
+class UserCache(ABC):
+    @abstractmethod
+    def get(self, user_id: UUID) -> User | None:
+        raise NotImplementedError  # pragma: no cover
+
+    @abstractmethod
+    def set(self, user: User) -> None:
+        raise NotImplementedError  # pragma: no cover
+
+    @abstractmethod
+    def invalidate(self, user_id: UUID) -> None:
+        raise NotImplementedError  # pragma: no cover
@@ -1,25 +1,55 @@
+import asyncio
+import logging
 from datetime import timedelta
 
+from src.auth.domain.entities import User
+from src.auth.ports.async_password_hasher import AsyncPasswordHasher
 from src.auth.ports.jwt_manager import JwtManager, TokenPayload
-from src.auth.ports.password_hasher import PasswordHasher
 from src.auth.ports.repositories.user_repository import UserRepository
+from src.auth.ports.user_cache import UserCache
 from src.auth.use_cases.errors import InvalidCredentialsError
 from src.auth.use_cases.inputs import AuthenticateInput
 from src.auth.use_cases.outputs import AuthenticateOutput
 from src.common.datetime import Datetime
 from src.common.settings import settings
 
+logger = logging.getLogger(__name__)
+
 
 class AuthenticateUseCase:
     def __init__(
         self,
         repository: UserRepository,
         jwt_manager: JwtManager,
-        password_hasher: PasswordHasher,
+        password_hasher: AsyncPasswordHasher,
+        user_cache: UserCache,
     ) -> None:
         self._repository = repository
         self._jwt_manager = jwt_manager
         self._password_hasher = password_hasher
+        self._user_cache = user_cache
+        self._rehash_tasks: set[asyncio.Task[None]] = set()
+
+    async def _rehash(self, user: User, password: str) -> None:
+        try:
+            new_password = await self._password_hasher.hash(password)
+            await self._repository.update_password(
+                user.id,
+                user.password,
+                new_password,
+            )
+        except Exception:
+            logger.exception(
+                msg="Failed to rehash password",
+                extra={"user_id": str(user.id)},
+            )
+        else:
+            self._user_cache.invalidate(user.id)
+
+    def _schedule_rehash(self, user: User, password: str) -> None:
+        task = asyncio.create_task(self._rehash(user, password))
+        self._rehash_tasks.add(task)
+        task.add_done_callback(self._rehash_tasks.discard)
 
     async def __call__(self, data: AuthenticateInput) -> AuthenticateOutput:
         user = await self._repository.find_by_email(data.email)
@@ -27,9 +57,14 @@ class AuthenticateUseCase:
         if user is None:
             raise InvalidCredentialsError()
 
-        if not self._password_hasher.verify(user.password, data.password):
+        if not await self._password_hasher.verify(
+            user.password, data.password
+        ):
             raise InvalidCredentialsError()
 
+        if await self._password_hasher.needs_rehash(user.password):
+            self._schedule_rehash(user, data.password)
+
         now = Datetime.now()
         exp = now + timedelta(minutes=settings.JWT_EXPIRATION_TIME_MINUTES)
         token_payload = TokenPayload(
@@ -1,4 +1,4 @@
-from src.auth.ports.password_hasher import PasswordHasher
+from src.auth.ports.async_password_hasher import AsyncPasswordHasher
 from src.auth.ports.repositories.user_repository import UserRepository
 from src.auth.use_cases.errors import EmailAlreadyExistsError
 from src.auth.use_cases.inputs import CreateUserInput
@@ -9,20 +9,20 @@ class CreateUserUseCase:
     def __init__(
         self,
         repository: UserRepository,
-        password_hasher: PasswordHasher,
+        password_hasher: AsyncPasswordHasher,
     ) -> None:
         self._repository = repository
         self._password_hasher = password_hasher
 
-    async def _email_in_use(self, email: str) -> bool:
-        return await self._repository.find_by_email(email) is not None
-
     async def __call__(self, data: CreateUserInput) -> CreateUserOutput:
-        if await self._email_in_use(data.email):
+        # Hashing is the expensive part of a signup: reject a known email
+        # before paying for it. The insert still guards against a race.
+        if await self._repository.find_by_email(data.email) is not None:
             raise EmailAlreadyExistsError()
 
-        user = data.to_user(self._password_hasher)
+        user = await data.to_user(self._password_hasher)
 
-        await self._repository.create(user)
+        if not await self._repository.create_if_not_exists(user):
+            raise EmailAlreadyExistsError()
 
         return CreateUserOutput.from_user(user)
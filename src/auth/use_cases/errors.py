@@ -11,3 +11,8 @@ class InvalidCredentialsError(Exception):
 class InvalidTokenError(Exception):
     def __init__(self, msg: str = "Invalid token") -> None:
         super().__init__(msg)
+
+
+class UserChangedError(Exception):
+    def __init__(self, msg: str = "User has changed") -> None:
+        super().__init__(msg)
@@ -1,6 +1,7 @@
 from src.auth.domain.entities import User
 from src.auth.ports.jwt_manager import JwtManager
 from src.auth.ports.repositories.user_repository import UserRepository
+from src.auth.ports.user_cache import UserCache
 from src.auth.use_cases.errors import (
     InvalidTokenError,
 )
@@ -11,17 +12,25 @@ class GetUserFromTokenUseCase:
         self,
         repository: UserRepository,
         jwt_manager: JwtManager,
+        user_cache: UserCache,
     ) -> None:
         self._repository = repository
         self._jwt_manager = jwt_manager
+        self._user_cache = user_cache
 
     async def __call__(self, token: str) -> User:
         payload = self._jwt_manager.decode(token)
         if payload is None:
             raise InvalidTokenError()
 
+        user = self._user_cache.get(payload.sub)
+        if user is not None:
+            return user
+
         user = await self._repository.find_by_id(payload.sub)
         if user is None:
             raise InvalidTokenError()
 
+        self._user_cache.set(user)
+
         return user
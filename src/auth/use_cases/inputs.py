@@ -1,7 +1,8 @@
 from pydantic import BaseModel, EmailStr, Field, model_validator
 
 from src.auth.domain.entities import User
-from src.auth.ports.password_hasher import PasswordHasher
+from src.auth.ports.async_password_hasher import AsyncPasswordHasher
+from src.auth.ports.repositories.user_repository import UserChanges
 
 
 class CreateUserInput(BaseModel):
@@ -18,10 +19,10 @@ class CreateUserInput(BaseModel):
             raise ValueError(msg)
         return self
 
-    def to_user(self, password_hasher: PasswordHasher) -> User:
+    async def to_user(self, password_hasher: AsyncPasswordHasher) -> User:
         return User(
             email=self.email,
-            password=password_hasher.hash(self.password),
+            password=await password_hasher.hash(self.password),
             first_name=self.first_name,
             last_name=self.last_name,
         )
@@ -62,18 +63,17 @@ class UpdateUserInput(BaseModel):
             raise ValueError(msg)
         return self
 
-    def to_user(
+    async def to_changes(
         self,
-        current_user: User,
-        password_hasher: PasswordHasher,
-    ) -> User:
-        return User(
-            id=current_user.id,
-            email=self.email or current_user.email,
-            password=self.password
-            and password_hasher.hash(self.password)
-            or current_user.password,
-            first_name=self.first_name or current_user.first_name,
-            last_name=self.last_name or current_user.last_name,
-            created_at=current_user.created_at,
+        password_hasher: AsyncPasswordHasher,
+    ) -> UserChanges:
+        password = None
+        if self.password:
+            password = await password_hasher.hash(self.password)
+
+        return UserChanges(
+            email=self.email,
+            password=password,
+            first_name=self.first_name,
+            last_name=self.last_name,
         )
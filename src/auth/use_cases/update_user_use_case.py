@@ -1,9 +1,15 @@
+from datetime import datetime
 from uuid import UUID
 
 from src.auth.domain.entities import User
-from src.auth.ports.password_hasher import PasswordHasher
+from src.auth.ports.async_password_hasher import AsyncPasswordHasher
 from src.auth.ports.repositories.user_repository import UserRepository
-from src.auth.use_cases.errors import EmailAlreadyExistsError
+from src.auth.ports.user_cache import UserCache
+from src.auth.use_cases.errors import (
+    EmailAlreadyExistsError,
+    InvalidTokenError,
+    UserChangedError,
+)
 from src.auth.use_cases.inputs import UpdateUserInput
 from src.auth.use_cases.outputs import UpdateUserOutput
 
@@ -12,34 +18,51 @@ class UpdateUserUseCase:
     def __init__(
         self,
         repository: UserRepository,
-        password_hasher: PasswordHasher,
+        password_hasher: AsyncPasswordHasher,
+        user_cache: UserCache,
     ) -> None:
         self._repository = repository
         self._password_hasher = password_hasher
-
-    async def _email_in_use(
-        self,
-        user_id: UUID,
-        email: str | None,
-    ) -> bool:
-        if email is None:
-            return False
-
-        user = await self._repository.find_by_email(email)
-        if user is None:
-            return False
-
-        return user.id != user_id
+        self._user_cache = user_cache
 
     async def __call__(
         self,
         current_user: User,
         data: UpdateUserInput,
+        expected_updated_at: list[datetime] | None = None,
     ) -> UpdateUserOutput:
-        if await self._email_in_use(current_user.id, data.email):
-            raise EmailAlreadyExistsError()
+        changes = await data.to_changes(self._password_hasher)
+        updated_user = await self._repository.update_changes(
+            current_user.id,
+            changes,
+            expected_updated_at,
+        )
+        if updated_user is None:
+            raise await self._update_error(
+                current_user.id,
+                expected_updated_at,
+            )
 
-        updated_user = data.to_user(current_user, self._password_hasher)
-        await self._repository.update(updated_user)
+        self._user_cache.invalidate(updated_user.id)
 
         return UpdateUserOutput.from_user(updated_user)
+
+    async def _update_error(
+        self,
+        user_id: UUID,
+        expected_updated_at: list[datetime] | None,
+    ) -> Exception:
+        # The update reports every rejected guard as None: re-read the user
+        # to tell which one it was. The repository is bound to the primary
+        # the update just ran on, so a lagging replica cannot misreport it.
+        user = await self._repository.find_by_id(user_id)
+        if user is None:
+            return InvalidTokenError()
+
+        if (
+            expected_updated_at is not None
+            and user.updated_at not in expected_updated_at
+        ):
+            return UserChangedError()
+
+        return EmailAlreadyExistsError()
@@ -0,0 +1,61 @@
+import time
+from collections.abc import Iterable
+from typing import Self
+
+from psycopg import AsyncCursor, sql
+from psycopg.abc import Params, Query
+from psycopg.rows import Row
+
+from src.common.adapters.postgres.query_recorder import query_recorder
+
+
+class InstrumentedAsyncCursor(AsyncCursor[Row]):
+    async def execute(
+        self,
+        query: Query,
+        params: Params | None = None,
+        *,
+        prepare: bool | None = None,
+        binary: bool | None = None,
+    ) -> Self:
+        start = time.perf_counter()
+        try:
+            return await super().execute(
+                query,
+                params,
+                prepare=prepare,
+                binary=binary,
+            )
+        finally:
+            self._record(query, time.perf_counter() - start)
+
+    async def executemany(
+        self,
+        query: Query,
+        params_seq: Iterable[Params],
+        *,
+        returning: bool = False,
+    ) -> None:
+        start = time.perf_counter()
+        try:
+            await super().executemany(
+                query,
+                params_seq,
+                returning=returning,
+            )
+        finally:
+            self._record(query, time.perf_counter() - start)
+
+    def _record(self, query: Query, duration: float) -> None:
+        query_recorder.record_query(
+            lambda: self._statement(query),
+            duration=duration,
+            rows=self.rowcount,
+        )
+
+    def _statement(self, query: Query) -> str:
+        if isinstance(query, sql.Composable):
+            query = query.as_string(self.connection)
+        elif isinstance(query, bytes):
+            query = query.decode()
+        return " ".join(query.split())
@@ -0,0 +1,19 @@
+import time
+
+from psycopg import AsyncConnection
+from psycopg.rows import DictRow
+from psycopg_pool import AsyncConnectionPool
+
+from src.common.adapters.postgres.query_recorder import query_recorder
+
+
+class InstrumentedAsyncPool(AsyncConnectionPool[AsyncConnection[DictRow]]):
+    async def getconn(
+        self,
+        timeout: float | None = None,
+    ) -> AsyncConnection[DictRow]:
+        start = time.perf_counter()
+        try:
+            return await super().getconn(timeout)
+        finally:
+            query_recorder.record_pool_wait(time.perf_counter() - start)
@@ -0,0 +1,8 @@
+def escape_like(term: str) -> str:
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def like_patterns(term: str, *, substring: bool) -> tuple[str, str]:
+    escaped = escape_like(term)
+    prefix = f"{escaped}%"
+    return (f"%{prefix}" if substring else prefix), prefix
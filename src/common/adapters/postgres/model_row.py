@@ -0,0 +1,32 @@
+from collections.abc import Sequence
+from typing import TypeVar
+
+from psycopg import AsyncCursor, sql
+from psycopg.rows import AsyncRowFactory, RowMaker
+from pydantic import BaseModel
+
+M = TypeVar("M", bound=BaseModel)
+
+
+def columns(model: type[BaseModel]) -> sql.Composed:
+    return sql.SQL(", ").join(map(sql.Identifier, model.model_fields))
+
+
+def model_row(model: type[M]) -> AsyncRowFactory[M]:
+    def factory(cursor: AsyncCursor[M]) -> RowMaker[M]:
+        names = [column.name for column in cursor.description or []]
+        return model_row_maker(model, names)
+
+    return factory
+
+
+def model_row_maker(model: type[M], names: Sequence[str]) -> RowMaker[M]:
+    fields_set = set(names)
+
+    def make_row(values: Sequence[object]) -> M:
+        return model.model_construct(
+            fields_set,
+            **dict(zip(names, values, strict=True)),
+        )
+
+    return make_row
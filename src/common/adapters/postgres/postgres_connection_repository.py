@@ -0,0 +1,28 @@
+from collections.abc import Awaitable, Callable
+from typing import TypeAlias
+from uuid import uuid4
+
+from psycopg import AsyncConnection, AsyncCursor, AsyncServerCursor
+from psycopg.rows import DictRow
+
+ConnectionFactory: TypeAlias = Callable[
+    [],
+    Awaitable[AsyncConnection[DictRow]],
+]
+
+
+class PostgresConnectionRepository:
+    stream_size = 500
+
+    def __init__(self, connection: ConnectionFactory) -> None:
+        self._connection = connection
+
+    async def _cursor(self) -> AsyncCursor[DictRow]:
+        connection = await self._connection()
+        return connection.cursor()
+
+    async def _server_cursor(self) -> AsyncServerCursor[DictRow]:
+        connection = await self._connection()
+        cursor = connection.cursor(name=f"stream_{uuid4().hex}")
+        cursor.itersize = self.stream_size
+        return cursor
@@ -1,19 +1,117 @@
-from psycopg import AsyncConnection, AsyncCursor
+from collections.abc import AsyncIterator
+from typing import TypeVar
+from uuid import uuid4
+
+from psycopg import AsyncConnection
 from psycopg.abc import Params, Query
 from psycopg.rows import DictRow
 from psycopg_pool import AsyncConnectionPool
+from pydantic import BaseModel
+
+from src.common.adapters.postgres.model_row import model_row
+
+M = TypeVar("M", bound=BaseModel)
 
 
 class PostgresRepository:
+    stream_size = 500
+
     def __init__(
-        self, pool: AsyncConnectionPool[AsyncConnection[DictRow]]
+        self,
+        pool: AsyncConnectionPool[AsyncConnection[DictRow]],
+        replica_pool: AsyncConnectionPool[AsyncConnection[DictRow]]
+        | None = None,
     ) -> None:
         self._pool = pool
+        self._replica_pool = replica_pool or pool
 
-    async def _query(
+    async def _execute(
         self,
         query: Query,
         params: Params | None = None,
-    ) -> AsyncCursor[DictRow]:
+        *,
+        prepare: bool | None = None,
+    ) -> int:
         async with self._pool.connection() as connection:
-            return await connection.execute(query, params)
+            cursor = await connection.execute(query, params, prepare=prepare)
+            return cursor.rowcount
+
+    async def _fetch_one(
+        self,
+        query: Query,
+        params: Params | None = None,
+        *,
+        prepare: bool | None = None,
+        replica: bool = False,
+    ) -> DictRow | None:
+        async with self._get_pool(replica=replica).connection() as connection:
+            cursor = await connection.execute(query, params, prepare=prepare)
+            return await cursor.fetchone()
+
+    async def _fetch_all(
+        self,
+        query: Query,
+        params: Params | None = None,
+        *,
+        prepare: bool | None = None,
+        replica: bool = False,
+    ) -> list[DictRow]:
+        async with self._get_pool(replica=replica).connection() as connection:
+            cursor = await connection.execute(query, params, prepare=prepare)
+            return await cursor.fetchall()
+
+    async def _fetch_model(  # noqa: PLR0913
+        self,
+        model: type[M],
+        query: Query,
+        params: Params | None = None,
+        *,
+        prepare: bool | None = None,
+        replica: bool = False,
+    ) -> M | None:
+        async with (
+            self._get_pool(replica=replica).connection() as connection,
+            connection.cursor(row_factory=model_row(model)) as cursor,
+        ):
+            await cursor.execute(query, params, prepare=prepare)
+            return await cursor.fetchone()
+
+    async def _fetch_models(  # noqa: PLR0913
+        self,
+        model: type[M],
+        query: Query,
+        params: Params | None = None,
+        *,
+        prepare: bool | None = None,
+        replica: bool = False,
+    ) -> list[M]:
+        async with (
+            self._get_pool(replica=replica).connection() as connection,
+            connection.cursor(row_factory=model_row(model)) as cursor,
+        ):
+            await cursor.execute(query, params, prepare=prepare)
+            return await cursor.fetchall()
+
+    async def _stream(
+        self,
+        query: Query,
+        params: Params | None = None,
+        *,
+        size: int | None = None,
+        replica: bool = False,
+    ) -> AsyncIterator[DictRow]:
+        async with (
+            self._get_pool(replica=replica).connection() as connection,
+            connection.cursor(name=f"stream_{uuid4().hex}") as cursor,
+        ):
+            cursor.itersize = size or self.stream_size
+            await cursor.execute(query, params)
+            async for row in cursor:
+                yield row
+
+    def _get_pool(
+        self,
+        *,
+        replica: bool,
+    ) -> AsyncConnectionPool[AsyncConnection[DictRow]]:
+        return self._replica_pool if replica else self._pool
@@ -0,0 +1,102 @@
+import functools
+import logging
+import math
+from collections.abc import Awaitable, Callable
+from contextvars import ContextVar
+from typing import ParamSpec, TypeVar
+
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, math.inf)
+
+current_query_name: ContextVar[str] = ContextVar(
+    "current_query_name",
+    default="unknown",
+)
+
+
+def instrumented(
+    func: Callable[P, Awaitable[R]],
+) -> Callable[P, Awaitable[R]]:
+    async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        token = current_query_name.set(func.__qualname__)
+        try:
+            return await func(*args, **kwargs)
+        finally:
+            current_query_name.reset(token)
+
+    functools.update_wrapper(wrapper, func)
+    return wrapper
+
+
+class QueryStats(BaseModel):
+    calls: int = 0
+    rows: int = 0
+    total_ms: float = 0
+    max_ms: float = 0
+    pool_waits: int = 0
+    pool_wait_ms: float = 0
+    buckets: dict[str, int] = {}
+
+
+class QueryRecorder:
+    def __init__(self, slow_query_ms: float | None = None) -> None:
+        self.slow_query_ms = slow_query_ms
+        self._stats: dict[str, QueryStats] = {}
+
+    def record_query(
+        self,
+        statement: Callable[[], str],
+        *,
+        duration: float,
+        rows: int,
+    ) -> None:
+        name = current_query_name.get()
+        duration_ms = duration * 1000
+        stats = self._get(name)
+        stats.calls += 1
+        stats.rows += max(rows, 0)
+        stats.total_ms += duration_ms
+        stats.max_ms = max(stats.max_ms, duration_ms)
+        bucket = next(le for le in BUCKETS_MS if duration_ms <= le)
+        key = f"le_{bucket}"
+        stats.buckets[key] = stats.buckets.get(key, 0) + 1
+
+        if self.slow_query_ms is not None and duration_ms > self.slow_query_ms:
+            logger.warning(
+                "Slow query",
+                extra={
+                    "query_name": name,
+                    "duration_ms": round(duration_ms, 3),
+                    "rows": rows,
+                    "statement": statement(),
+                },
+            )
+
+    def record_pool_wait(self, duration: float) -> None:
+        stats = self._get(current_query_name.get())
+        stats.pool_waits += 1
+        stats.pool_wait_ms += duration * 1000
+
+    def stats(self) -> dict[str, QueryStats]:
+        return {
+            name: stats.model_copy(deep=True)
+            for name, stats in self._stats.items()
+        }
+
+    def reset(self) -> None:
+        self._stats.clear()
+
+    def _get(self, name: str) -> QueryStats:
+        stats = self._stats.get(name)
+        if stats is None:
+            stats = self._stats[name] = QueryStats()
+        return stats
+
+
+query_recorder = QueryRecorder()
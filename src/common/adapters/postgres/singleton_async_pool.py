@@ -2,24 +2,66 @@ from psycopg import AsyncConnection
 from psycopg.rows import DictRow, dict_row
 from psycopg_pool import AsyncConnectionPool
 
+from src.common.adapters.postgres.instrumented_async_cursor import (
+    InstrumentedAsyncCursor,
+)
+from src.common.adapters.postgres.instrumented_async_pool import (
+    InstrumentedAsyncPool,
+)
 from src.common.settings import settings
 
+PREPARE_THRESHOLD = 5
+
 
 class SingletonAsyncPool:
     _instance: AsyncConnectionPool[AsyncConnection[DictRow]] | None = None
+    _replica_instance: AsyncConnectionPool[AsyncConnection[DictRow]] | None = (
+        None
+    )
 
     @classmethod
     def get_instance(
         cls,
     ) -> AsyncConnectionPool[AsyncConnection[DictRow]]:
         if cls._instance is None:
-            cls._instance = AsyncConnectionPool(
-                str(settings.DATABASE_URL),
-                connection_class=AsyncConnection[DictRow],
-                kwargs={
-                    "row_factory": dict_row,
-                },
-                open=False,
-            )
+            cls._instance = cls._create(str(settings.DATABASE_URL))
 
         return cls._instance
+
+    @classmethod
+    def get_replica_instance(
+        cls,
+    ) -> AsyncConnectionPool[AsyncConnection[DictRow]]:
+        if settings.DATABASE_REPLICA_URL is None:
+            return cls.get_instance()
+
+        if cls._replica_instance is None:
+            cls._replica_instance = cls._create(
+                str(settings.DATABASE_REPLICA_URL),
+            )
+
+        return cls._replica_instance
+
+    @staticmethod
+    def _create(
+        conninfo: str,
+    ) -> AsyncConnectionPool[AsyncConnection[DictRow]]:
+        return InstrumentedAsyncPool(
+            conninfo,
+            min_size=settings.DATABASE_POOL_MIN_SIZE,
+            max_size=settings.DATABASE_POOL_MAX_SIZE,
+            timeout=settings.DATABASE_POOL_TIMEOUT,
+            max_idle=settings.DATABASE_POOL_MAX_IDLE,
+            max_lifetime=settings.DATABASE_POOL_MAX_LIFETIME,
+            connection_class=AsyncConnection[DictRow],
+            kwargs={
+                "row_factory": dict_row,
+                "cursor_factory": InstrumentedAsyncCursor,
+                "prepare_threshold": (
+                    PREPARE_THRESHOLD
+                    if settings.DATABASE_PREPARED_STATEMENTS
+                    else None
+                ),
+            },
+            open=False,
+        )
@@ -0,0 +1,21 @@
+import base64
+from typing import TypeVar
+
+from pydantic import BaseModel
+
+M = TypeVar("M", bound=BaseModel)
+
+
+def encode_cursor(key: BaseModel) -> str:
+    data = key.model_dump_json().encode()
+    return base64.urlsafe_b64encode(data).decode().rstrip("=")
+
+
+def decode_cursor(model: type[M], cursor: str) -> M:
+    padding = "=" * (-len(cursor) % 4)
+    try:
+        data = base64.urlsafe_b64decode(cursor + padding)
+        return model.model_validate_json(data)
+    except ValueError as error:
+        msg = "Invalid cursor"
+        raise ValueError(msg) from error
@@ -0,0 +1,89 @@
+import argparse
+import secrets
+import time
+from collections.abc import Callable, Sequence
+from uuid import uuid4
+
+from pydantic import BaseModel
+
+from src.auth.domain.entities import User
+from src.common.adapters.postgres.model_row import model_row_maker
+from src.core.domain.entities import Category, Note, NoteCategory
+
+
+class RowMappingResult(BaseModel):
+    model: str
+    validate_us: float
+    construct_us: float
+    speedup: float
+
+
+def sample_entities() -> list[BaseModel]:
+    return [
+        User(
+            email="john.doe@example.com",
+            password=secrets.token_hex(32),
+            first_name="John",
+            last_name="Doe",
+        ),
+        Note(user_id=uuid4(), title="Title", content="Content"),
+        Category(user_id=uuid4(), name="Name"),
+        NoteCategory(note_id=uuid4(), category_id=uuid4()),
+    ]
+
+
+def _per_row_us(func: Callable[[], object], iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - start) / iterations * 1_000_000
+
+
+def benchmark(entity: BaseModel, *, iterations: int) -> RowMappingResult:
+    model = type(entity)
+    names = list(model.model_fields)
+    values = tuple(getattr(entity, name) for name in names)
+    make_row = model_row_maker(model, names)
+
+    validate_us = _per_row_us(
+        lambda: model.model_validate(dict(zip(names, values, strict=True))),
+        iterations,
+    )
+    construct_us = _per_row_us(lambda: make_row(values), iterations)
+
+    return RowMappingResult(
+        model=model.__name__,
+        validate_us=validate_us,
+        construct_us=construct_us,
+        speedup=validate_us / construct_us,
+    )
+
+
+def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Compare the per-row cost of dict rows plus model_validate "
+            "against trusted tuple rows plus model_construct"
+        ),
+    )
+    parser.add_argument("--iterations", type=int, default=20000)
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    args = parse_args(argv)
+
+    print(
+        f"{'model':>12} {'validate_us':>11} {'construct_us':>12} "
+        f"{'speedup':>7}"
+    )
+    for entity in sample_entities():
+        result = benchmark(entity, iterations=args.iterations)
+        print(
+            f"{result.model:>12} {result.validate_us:>11.2f} "
+            f"{result.construct_us:>12.2f} {result.speedup:>7.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
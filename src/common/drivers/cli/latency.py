@@ -0,0 +1,34 @@
+import statistics
+import time
+from collections.abc import Awaitable, Callable
+
+from pydantic import BaseModel
+
+# statistics.quantiles needs at least two data points.
+MIN_SAMPLES = 2
+
+
+class Latency(BaseModel):
+    rows: int
+    p50_ms: float
+    p99_ms: float
+
+
+async def measure(
+    call: Callable[[], Awaitable[int]],
+    iterations: int,
+) -> Latency:
+    latencies: list[float] = []
+    rows = 0
+    for _ in range(iterations):
+        start = time.perf_counter()
+        rows = await call()
+        latencies.append(time.perf_counter() - start)
+
+    percentiles = statistics.quantiles(latencies, n=100, method="inclusive")
+
+    return Latency(
+        rows=rows,
+        p50_ms=statistics.median(latencies) * 1000,
+        p99_ms=percentiles[98] * 1000,
+    )
@@ -1,11 +1,32 @@
+from fastapi import HTTPException, status
 from psycopg import AsyncConnection
 from psycopg.rows import DictRow
 from psycopg_pool import AsyncConnectionPool
 
+from src.common.adapters.postgres.query_recorder import (
+    QueryRecorder,
+    query_recorder,
+)
 from src.common.adapters.postgres.singleton_async_pool import (
     SingletonAsyncPool,
 )
+from src.common.settings import settings
 
 
 def get_pool() -> AsyncConnectionPool[AsyncConnection[DictRow]]:
     return SingletonAsyncPool.get_instance()
+
+
+def get_replica_pool() -> AsyncConnectionPool[AsyncConnection[DictRow]]:
+    return SingletonAsyncPool.get_replica_instance()
+
+
+def get_query_recorder() -> QueryRecorder:
+    return query_recorder
+
+
+def require_internal_endpoints() -> None:
+    # Operational endpoints stay indistinguishable from unknown routes
+    # unless they are explicitly enabled.
+    if not settings.SERVER_INTERNAL_ENDPOINTS:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
@@ -0,0 +1,51 @@
+from datetime import UTC, datetime, timedelta
+from uuid import UUID
+
+EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+
+MICROSECOND = timedelta(microseconds=1)
+
+
+def entity_tag(id_: UUID, updated_at: datetime) -> str:
+    version = (updated_at - EPOCH) // MICROSECOND
+    return f'"{id_.hex}-{version:x}"'
+
+
+def none_match(if_none_match: str | None, tag: str) -> bool:
+    if if_none_match is None:
+        return True
+
+    # If-None-Match uses the weak comparison: W/ prefixes are ignored.
+    tags = _split(if_none_match)
+    return "*" not in tags and tag not in (t.removeprefix("W/") for t in tags)
+
+
+def matching_versions(
+    if_match: str | None,
+    id_: UUID,
+) -> list[datetime] | None:
+    if if_match is None:
+        return None
+
+    tags = _split(if_match)
+    if "*" in tags:
+        return None
+
+    # If-Match uses the strong comparison, so weak or foreign tags are
+    # dropped; an empty list matches no version at all.
+    prefix = f'"{id_.hex}-'
+    versions = []
+    for tag in tags:
+        if not tag.startswith(prefix) or not tag.endswith('"'):
+            continue
+        try:
+            versions.append(
+                EPOCH + int(tag[len(prefix) : -1], 16) * MICROSECOND
+            )
+        except ValueError:
+            continue
+    return versions
+
+
+def _split(header: str) -> list[str]:
+    return [tag.strip() for tag in header.split(",") if tag.strip()]
@@ -0,0 +1,69 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, status
+from psycopg import AsyncConnection
+from psycopg.rows import DictRow
+from psycopg_pool import AsyncConnectionPool
+
+from src.common.adapters.postgres.query_recorder import (
+    QueryRecorder,
+    QueryStats,
+)
+from src.common.drivers.rest.dependencies import (
+    get_pool,
+    get_query_recorder,
+    get_replica_pool,
+    require_internal_endpoints,
+)
+
+router = APIRouter(
+    prefix="/internal",
+    tags=["internal"],
+    include_in_schema=False,
+    dependencies=[Depends(require_internal_endpoints)],
+)
+
+
+@router.get(
+    "/pool",
+    status_code=status.HTTP_200_OK,
+    response_model=dict[str, int],
+    summary="Database connection pool stats",
+)
+def get_pool_stats(
+    pool: Annotated[
+        AsyncConnectionPool[AsyncConnection[DictRow]],
+        Depends(get_pool),
+    ],
+) -> dict[str, int]:
+    return pool.get_stats()
+
+
+@router.get(
+    "/replica-pool",
+    status_code=status.HTTP_200_OK,
+    response_model=dict[str, int],
+    summary="Replica database connection pool stats",
+)
+def get_replica_pool_stats(
+    pool: Annotated[
+        AsyncConnectionPool[AsyncConnection[DictRow]],
+        Depends(get_replica_pool),
+    ],
+) -> dict[str, int]:
+    return pool.get_stats()
+
+
+@router.get(
+    "/queries",
+    status_code=status.HTTP_200_OK,
+    response_model=dict[str, QueryStats],
+    summary="Per-query latency, pool wait and row count stats",
+)
+def get_query_stats(
+    recorder: Annotated[
+        QueryRecorder,
+        Depends(get_query_recorder),
+    ],
+) -> dict[str, QueryStats]:
+    return recorder.stats()
@@ -3,21 +3,74 @@ from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
+from psycopg import AsyncConnection
+from psycopg.rows import DictRow
+from psycopg_pool import AsyncConnectionPool
 
+from src.common.adapters.postgres.query_recorder import query_recorder
 from src.common.adapters.postgres.singleton_async_pool import (
     SingletonAsyncPool,
 )
+from src.common.settings import settings
 
 logger = logging.getLogger(__name__)
 
 
+async def check_pool_size(
+    pool: AsyncConnectionPool[AsyncConnection[DictRow]],
+    workers: int,
+) -> None:
+    async with pool.connection() as connection:
+        cursor = await connection.execute(
+            """
+            SELECT
+                current_setting('max_connections')::int AS max_connections,
+                current_setting('superuser_reserved_connections')::int
+                    AS reserved_connections;
+            """
+        )
+        row = await cursor.fetchone()
+
+    if row is None:
+        return
+
+    available = row["max_connections"] - row["reserved_connections"]
+    per_worker = available // workers
+    if pool.max_size > per_worker:
+        logger.warning(
+            "Connection pool can exceed the database connection limit",
+            extra={
+                "pool_max_size": pool.max_size,
+                "workers": workers,
+                "max_connections": row["max_connections"],
+                "reserved_connections": row["reserved_connections"],
+                "connections_per_worker": per_worker,
+            },
+        )
+
+
 @asynccontextmanager
 async def setup_async_pool(_app: FastAPI) -> AsyncIterator[None]:
+    query_recorder.slow_query_ms = (
+        settings.DATABASE_SLOW_QUERY_MS
+        if settings.DATABASE_SLOW_QUERY_MS > 0
+        else None
+    )
+
     pool = SingletonAsyncPool.get_instance()
     await pool.open(wait=True)
+    await check_pool_size(pool, settings.SERVER_WORKERS or 1)
     logger.info("Async Connection Pool started...")
+
+    replica_pool = SingletonAsyncPool.get_replica_instance()
+    if replica_pool is not pool:
+        await replica_pool.open(wait=True)
+        await check_pool_size(replica_pool, settings.SERVER_WORKERS or 1)
+        logger.info("Async Replica Connection Pool started...")
     yield
 
+    if replica_pool is not pool:
+        await replica_pool.close()
     await pool.close()
 
 
@@ -0,0 +1,56 @@
+from collections.abc import AsyncGenerator, AsyncIterable
+from contextlib import aclosing
+
+from pydantic import BaseModel
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+CHUNK_SIZE = 64 * 1024
+
+MAX_LINE_SIZE = 1024 * 1024
+
+
+async def ndjson(
+    items: AsyncGenerator[BaseModel, None],
+    *,
+    chunk_size: int = CHUNK_SIZE,
+) -> AsyncGenerator[bytes, None]:
+    buffer = bytearray()
+    async with aclosing(items):
+        async for item in items:
+            buffer += item.model_dump_json().encode()
+            buffer += b"\n"
+            if len(buffer) >= chunk_size:
+                yield bytes(buffer)
+                buffer.clear()
+
+    if buffer:
+        yield bytes(buffer)
+
+
+async def ndjson_lines(
+    chunks: AsyncIterable[bytes],
+    *,
+    max_line_size: int = MAX_LINE_SIZE,
+) -> AsyncGenerator[bytes, None]:
+    buffer = bytearray()
+    overflow = False
+    async for chunk in chunks:
+        start = 0
+        while (end := chunk.find(b"\n", start)) != -1:
+            if not overflow:
+                buffer += chunk[start:end]
+            # An oversized line is cut short rather than buffered whole, so
+            # it fails validation like any other malformed line.
+            yield bytes(buffer[: max_line_size + 1])
+            buffer.clear()
+            overflow = False
+            start = end + 1
+
+        if not overflow:
+            buffer += chunk[start:]
+            overflow = len(buffer) > max_line_size
+            del buffer[max_line_size + 1 :]
+
+    if buffer:
+        yield bytes(buffer)
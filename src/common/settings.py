@@ -15,17 +15,43 @@ class EnvEnum(str, Enum):
     test = "test"
 
 
+class ExecutorEnum(str, Enum):
+    thread = "thread"
+    process = "process"
+
+
 class Settings(BaseModel):
     DATABASE_URL: PostgresDsn
+    DATABASE_POOL_MIN_SIZE: int = 4
+    DATABASE_POOL_MAX_SIZE: int | None = None
+    DATABASE_POOL_TIMEOUT: float = 30
+    DATABASE_POOL_MAX_IDLE: float = 600
+    DATABASE_POOL_MAX_LIFETIME: float = 3600
+    DATABASE_PREPARED_STATEMENTS: bool = True
+    DATABASE_SLOW_QUERY_MS: float = 200
+    DATABASE_REPLICA_URL: PostgresDsn | None = None
+    DATABASE_READ_YOUR_WRITES_SECONDS: float = 5
+    DATABASE_READ_YOUR_WRITES_MAX_SIZE: int = 10000
     JWT_SECRET_KEY: str
     JWT_ALGORITHM: str
     JWT_EXPIRATION_TIME_MINUTES: int
+    JWT_CACHE_MAX_SIZE: int = 1024
     SERVER_HOST: str
     SERVER_PORT: int
     SERVER_RELOAD: bool = False
     SERVER_WORKERS: int | None = None
     SERVER_ROOT_PATH: str = ""
     SERVER_PROXY_HEADERS: bool = False
+    SERVER_INTERNAL_ENDPOINTS: bool = False
+    ARGON2_TIME_COST: int = 3
+    ARGON2_MEMORY_COST: int = 65536
+    ARGON2_PARALLELISM: int = 4
+    PASSWORD_HASHER_EXECUTOR: ExecutorEnum = ExecutorEnum.thread
+    PASSWORD_HASHER_WORKERS: int | None = None
+    PASSWORD_HASHER_MAX_PENDING: int = 64
+    USER_CACHE_MAX_SIZE: int = 1024
+    USER_CACHE_TTL_SECONDS: float = 30
+    IMPORT_CHUNK_SIZE: int = 1000
     ENV: EnvEnum
 
     @computed_field  # type: ignore[misc]
@@ -0,0 +1,8 @@
+from psycopg import sql
+
+# change_id is the id of the transaction that wrote the row. Transactions
+# older than the oldest one still running have all ended, so below it no
+# change can commit behind a cursor that already moved past it.
+SETTLED_CHANGES = sql.SQL(
+    "AND change_id < pg_snapshot_xmin(pg_current_snapshot())::TEXT::BIGINT"
+)
@@ -1,20 +1,30 @@
-from types import TracebackType
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from typing import Self
 
-from psycopg import AsyncConnection
+from anyio import CancelScope
+from psycopg import AsyncConnection, errors
+from psycopg.pq import TransactionStatus
 from psycopg.rows import DictRow
 from psycopg_pool import AsyncConnectionPool
 
+from src.common.adapters.errors import DatabaseError
 from src.core.adapters.postgres.repositories import (
     PostgresCategoryRepository,
     PostgresNoteCategoryRepository,
     PostgresNoteRepository,
+    PostgresTombstoneRepository,
 )
 from src.core.ports.unit_of_work import UnitOfWork
 
+# A connection still running a query (ACTIVE) cannot be rolled back; the
+# pool discards it on release instead.
+ROLLBACK_STATUSES = (TransactionStatus.INTRANS, TransactionStatus.INERROR)
+
 
 class PostgresUnitOfWork(UnitOfWork):
-    _connection: AsyncConnection[DictRow]
+    _connection: AsyncConnection[DictRow] | None = None
+    _pipelined: bool = False
 
     def __init__(
         self, pool: AsyncConnectionPool[AsyncConnection[DictRow]]
@@ -22,25 +32,75 @@ class PostgresUnitOfWork(UnitOfWork):
         self._pool = pool
 
     async def __aenter__(self) -> Self:
-        self._connection = await self._pool.getconn()
-        self.note_repository = PostgresNoteRepository(self._connection)
-        self.category_repository = PostgresCategoryRepository(self._connection)
+        self.note_repository = PostgresNoteRepository(self._get_connection)
+        self.category_repository = PostgresCategoryRepository(
+            self._get_connection,
+        )
         self.note_category_repository = PostgresNoteCategoryRepository(
-            self._connection,
+            self._get_connection,
+        )
+        self.tombstone_repository = PostgresTombstoneRepository(
+            self._get_connection,
         )
         return self
 
-    async def __aexit__(
-        self,
-        exc_type: type[BaseException] | None,
-        exc_val: BaseException | None,
-        exc_tb: TracebackType | None,
-    ) -> None:
-        await super().__aexit__(exc_type, exc_val, exc_tb)
-        await self._pool.putconn(self._connection)
-
     async def commit(self) -> None:
-        await self._connection.commit()
+        if self._connection is None:
+            return
+
+        try:
+            await self._connection.commit()
+        except errors.Error as error:
+            raise DatabaseError(error) from error
+
+        if not self._pipelined:
+            await self._release()
 
     async def rollback(self) -> None:
-        await self._connection.rollback()
+        if self._connection is None:
+            return
+
+        # A cancelled request (e.g. a client leaving a streamed response)
+        # must still give the connection back to the pool.
+        with CancelScope(shield=True):
+            try:
+                if (
+                    self._connection.info.transaction_status
+                    in ROLLBACK_STATUSES
+                ):
+                    await self._connection.rollback()
+            finally:
+                await self._release()
+
+    @asynccontextmanager
+    async def pipeline(self) -> AsyncIterator[None]:
+        connection = await self._get_connection()
+        self._pipelined = True
+        try:
+            async with connection.pipeline():
+                yield
+        except errors.Error as error:
+            raise DatabaseError(error) from error
+        finally:
+            self._pipelined = False
+
+        if not self._in_transaction(connection):
+            await self._release()
+
+    async def _get_connection(self) -> AsyncConnection[DictRow]:
+        if self._connection is None:
+            self._connection = await self._pool.getconn()
+
+        return self._connection
+
+    async def _release(self) -> None:
+        if self._connection is None:
+            return
+
+        connection = self._connection
+        self._connection = None
+        await self._pool.putconn(connection)
+
+    @staticmethod
+    def _in_transaction(connection: AsyncConnection[DictRow]) -> bool:
+        return connection.info.transaction_status != TransactionStatus.IDLE
@@ -1,9 +1,11 @@
 from .postgres_category_repository import PostgresCategoryRepository
 from .postgres_note_category_repository import PostgresNoteCategoryRepository
 from .postgres_note_repository import PostgresNoteRepository
+from .postgres_tombstone_repository import PostgresTombstoneRepository
 
 __all__ = [
     "PostgresNoteRepository",
     "PostgresCategoryRepository",
     "PostgresNoteCategoryRepository",
+    "PostgresTombstoneRepository",
 ]
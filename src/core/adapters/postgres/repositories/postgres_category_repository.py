@@ -1,23 +1,31 @@
 from uuid import UUID
 
-from psycopg import AsyncConnection, errors
-from psycopg.rows import DictRow
+from psycopg import errors, sql
 
 from src.common.adapters.errors import DatabaseError
-from src.core.domain.entities import Category
+from src.common.adapters.postgres.like import like_patterns
+from src.common.adapters.postgres.postgres_connection_repository import (
+    PostgresConnectionRepository,
+)
+from src.common.adapters.postgres.query_recorder import instrumented
+from src.core.adapters.postgres.changes import SETTLED_CHANGES
+from src.core.domain.entities import (
+    Category,
+    CategoryChange,
+    CategorySuggestion,
+)
 from src.core.ports.repositories.category_repository import CategoryRepository
+from src.core.ports.repositories.change_key import ChangeKey
 
 
-class PostgresCategoryRepository(CategoryRepository):
-    def __init__(
-        self,
-        connection: AsyncConnection[DictRow],
-    ) -> None:
-        self._connection = connection
-
+class PostgresCategoryRepository(
+    PostgresConnectionRepository,
+    CategoryRepository,
+):
+    @instrumented
     async def create(self, category: Category) -> None:
         try:
-            async with self._connection.cursor() as cursor:
+            async with await self._cursor() as cursor:
                 await cursor.execute(
                     """
                     INSERT INTO categories (
@@ -39,12 +47,44 @@ class PostgresCategoryRepository(CategoryRepository):
         except errors.Error as error:
             raise DatabaseError(error) from error
 
+    @instrumented
+    async def create_if_not_exists(self, category: Category) -> bool:
+        try:
+            async with await self._cursor() as cursor:
+                await cursor.execute(
+                    """
+                    INSERT INTO categories (
+                        id,
+                        user_id,
+                        name,
+                        updated_at,
+                        created_at
+                    ) VALUES (
+                        %(id)s,
+                        %(user_id)s,
+                        %(name)s,
+                        %(updated_at)s,
+                        %(created_at)s
+                    )
+                    ON CONFLICT (user_id, name) DO NOTHING
+                    RETURNING id;
+                    """,
+                    category.model_dump(),
+                    prepare=True,
+                )
+                row = await cursor.fetchone()
+        except errors.Error as error:
+            raise DatabaseError(error) from error
+
+        return row is not None
+
+    @instrumented
     async def update(
         self,
         category: Category,
     ) -> None:
         try:
-            async with self._connection.cursor() as cursor:
+            async with await self._cursor() as cursor:
                 await cursor.execute(
                     """
                     UPDATE categories
@@ -60,12 +100,13 @@ class PostgresCategoryRepository(CategoryRepository):
         except errors.Error as error:
             raise DatabaseError(error) from error
 
+    @instrumented
     async def delete(
         self,
         category_id: UUID,
     ) -> None:
         try:
-            async with self._connection.cursor() as cursor:
+            async with await self._cursor() as cursor:
                 await cursor.execute(
                     """
                     DELETE FROM categories
@@ -76,13 +117,14 @@ class PostgresCategoryRepository(CategoryRepository):
         except errors.Error as error:
             raise DatabaseError(error) from error
 
+    @instrumented
     async def exists(
         self,
         name: str,
         user_id: UUID,
     ) -> bool:
         try:
-            async with self._connection.cursor() as cursor:
+            async with await self._cursor() as cursor:
                 result_cursor = await cursor.execute(
                     """
                     SELECT name FROM categories
@@ -90,9 +132,116 @@ class PostgresCategoryRepository(CategoryRepository):
                     AND name = %s;
                     """,
                     [user_id, name],
+                    prepare=True,
                 )
                 result = await result_cursor.fetchall()
         except errors.Error as error:
             raise DatabaseError(error) from error
 
         return len(result) > 0
+
+    @instrumented
+    async def filter_owned_ids(
+        self,
+        category_ids: list[UUID],
+        user_id: UUID,
+    ) -> list[UUID]:
+        if len(category_ids) == 0:
+            return []
+
+        try:
+            async with await self._cursor() as cursor:
+                await cursor.execute(
+                    """
+                    SELECT id FROM categories
+                    WHERE id = ANY(%s)
+                    AND user_id = %s;
+                    """,
+                    [category_ids, user_id],
+                    prepare=True,
+                )
+                result = await cursor.fetchall()
+        except errors.Error as error:
+            raise DatabaseError(error) from error
+
+        return [row["id"] for row in result]
+
+    @instrumented
+    async def find_changes(
+        self,
+        user_id: UUID,
+        limit: int,
+        after: ChangeKey | None = None,
+    ) -> list[CategoryChange]:
+        keyset = (
+            sql.SQL("AND (change_id, id) > (%(change_id)s, %(id)s)")
+            if after is not None
+            else sql.SQL("")
+        )
+        query = sql.SQL(
+            """
+            SELECT id, user_id, name, updated_at, created_at, change_id
+            FROM categories
+            WHERE user_id = %(user_id)s
+            {settled}
+            {keyset}
+            ORDER BY change_id, id
+            LIMIT %(limit)s;
+            """
+        ).format(settled=SETTLED_CHANGES, keyset=keyset)
+
+        try:
+            async with await self._cursor() as cursor:
+                await cursor.execute(
+                    query,
+                    {
+                        "user_id": user_id,
+                        "limit": limit,
+                        **(after.model_dump() if after is not None else {}),
+                    },
+                    prepare=True,
+                )
+                result = await cursor.fetchall()
+        except errors.Error as error:
+            raise DatabaseError(error) from error
+
+        return [CategoryChange.model_validate(row) for row in result]
+
+    @instrumented
+    async def autocomplete(
+        self,
+        user_id: UUID,
+        term: str,
+        limit: int,
+        *,
+        substring: bool = False,
+    ) -> list[CategorySuggestion]:
+        pattern, prefix = like_patterns(term, substring=substring)
+
+        try:
+            async with await self._cursor() as cursor:
+                await cursor.execute(
+                    """
+                    SELECT id, name FROM categories
+                    WHERE user_id = %(user_id)s
+                    AND lower(name::TEXT) LIKE lower(%(pattern)s)
+                    ORDER BY
+                        lower(name::TEXT) LIKE lower(%(prefix)s) DESC,
+                        length(name),
+                        lower(name::TEXT),
+                        id
+                    LIMIT %(limit)s;
+                    """,
+                    {
+                        "user_id": user_id,
+                        "pattern": pattern,
+                        "prefix": prefix,
+                        "limit": limit,
+                    },
+                    prepare=True,
+                )
+                result = await cursor.fetchall()
+        except errors.Error as error:
+            raise DatabaseError(error) from error
+
+        return [CategorySuggestion.model_validate(row) for row in result]
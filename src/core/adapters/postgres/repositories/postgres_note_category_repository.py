@@ -1,44 +1,119 @@
-from psycopg import AsyncConnection, errors
-from psycopg.rows import DictRow
+from uuid import UUID
+
+from psycopg import errors
 
 from src.common.adapters.errors import DatabaseError
+from src.common.adapters.postgres.postgres_connection_repository import (
+    PostgresConnectionRepository,
+)
+from src.common.adapters.postgres.query_recorder import instrumented
 from src.core.domain.entities import NoteCategory
 from src.core.ports.repositories.note_category_repository import (
     NoteCategoryRepository,
 )
 
 
-class PostgresNoteCategoryRepository(NoteCategoryRepository):
-    def __init__(self, connection: AsyncConnection[DictRow]) -> None:
-        self._connection = connection
-
+class PostgresNoteCategoryRepository(
+    PostgresConnectionRepository,
+    NoteCategoryRepository,
+):
+    @instrumented
     async def create(self, note_category: NoteCategory) -> None:
         await self.create_many([note_category])
 
+    @instrumented
     async def create_many(
         self,
         notes_categories: list[NoteCategory],
     ) -> None:
+        if len(notes_categories) == 0:
+            return
+
         try:
-            async with self._connection.cursor() as cursor:
-                await cursor.executemany(
+            async with await self._cursor() as cursor:
+                await cursor.execute(
                     """
                     INSERT INTO notes_categories (
                         note_id,
                         category_id,
                         updated_at,
                         created_at
-                    ) VALUES (
-                        %(note_id)s,
-                        %(category_id)s,
-                        %(updated_at)s,
-                        %(created_at)s
+                    )
+                    SELECT * FROM unnest(
+                        %(note_ids)s::uuid[],
+                        %(category_ids)s::uuid[],
+                        %(updated_ats)s::timestamptz[],
+                        %(created_ats)s::timestamptz[]
                     );
                     """,
-                    (
-                        note_category.model_dump()
-                        for note_category in notes_categories
-                    ),
+                    {
+                        "note_ids": [
+                            note_category.note_id
+                            for note_category in notes_categories
+                        ],
+                        "category_ids": [
+                            note_category.category_id
+                            for note_category in notes_categories
+                        ],
+                        "updated_ats": [
+                            note_category.updated_at
+                            for note_category in notes_categories
+                        ],
+                        "created_ats": [
+                            note_category.created_at
+                            for note_category in notes_categories
+                        ],
+                    },
+                    prepare=True,
+                )
+        except errors.Error as error:
+            raise DatabaseError(error) from error
+
+    @instrumented
+    async def copy_many(
+        self,
+        notes_categories: list[NoteCategory],
+    ) -> None:
+        if len(notes_categories) == 0:
+            return
+
+        try:
+            async with (
+                await self._cursor() as cursor,
+                cursor.copy(
+                    """
+                    COPY notes_categories (
+                        note_id,
+                        category_id,
+                        updated_at,
+                        created_at
+                    ) FROM STDIN;
+                    """
+                ) as copy,
+            ):
+                for note_category in notes_categories:
+                    await copy.write_row(
+                        (
+                            note_category.note_id,
+                            note_category.category_id,
+                            note_category.updated_at,
+                            note_category.created_at,
+                        ),
+                    )
+        except errors.Error as error:
+            raise DatabaseError(error) from error
+
+    @instrumented
+    async def delete_by_note_id(self, note_id: UUID) -> None:
+        try:
+            async with await self._cursor() as cursor:
+                await cursor.execute(
+                    """
+                    DELETE FROM notes_categories
+                    WHERE note_id = %s;
+                    """,
+                    [note_id],
+                    prepare=True,
                 )
         except errors.Error as error:
             raise DatabaseError(error) from error
@@ -1,20 +1,45 @@
+from collections.abc import AsyncGenerator
+from datetime import datetime
 from uuid import UUID
 
-from psycopg import AsyncConnection, errors
-from psycopg.rows import DictRow
+from anyio import CancelScope
+from psycopg import errors, sql
 
 from src.common.adapters.errors import DatabaseError
-from src.core.domain.entities import Note
-from src.core.ports.repositories.note_repository import NoteRepository
+from src.common.adapters.postgres.like import like_patterns
+from src.common.adapters.postgres.postgres_connection_repository import (
+    PostgresConnectionRepository,
+)
+from src.common.adapters.postgres.query_recorder import instrumented
+from src.core.adapters.postgres.changes import SETTLED_CHANGES
+from src.core.domain.entities import (
+    Note,
+    NoteChange,
+    NoteSearchResult,
+    NoteSuggestion,
+    NoteWithCategories,
+)
+from src.core.ports.repositories.change_key import ChangeKey
+from src.core.ports.repositories.note_repository import (
+    NotePageKey,
+    NoteRepository,
+    NoteSearchKey,
+)
 
+HEADLINE_OPTIONS = (
+    "StartSel=<mark>, StopSel=</mark>, "
+    "MinWords=15, MaxWords=35, MaxFragments=2"
+)
 
-class PostgresNoteRepository(NoteRepository):
-    def __init__(self, connection: AsyncConnection[DictRow]) -> None:
-        self._connection = connection
 
+class PostgresNoteRepository(
+    PostgresConnectionRepository,
+    NoteRepository,
+):
+    @instrumented
     async def create(self, note: Note) -> None:
         try:
-            async with self._connection.cursor() as cursor:
+            async with await self._cursor() as cursor:
                 await cursor.execute(
                     """
                     INSERT INTO notes (
@@ -38,12 +63,48 @@ class PostgresNoteRepository(NoteRepository):
         except errors.Error as error:
             raise DatabaseError(error) from error
 
+    @instrumented
+    async def copy_many(self, notes: list[Note]) -> None:
+        if len(notes) == 0:
+            return
+
+        try:
+            async with (
+                await self._cursor() as cursor,
+                cursor.copy(
+                    """
+                    COPY notes (
+                        id,
+                        user_id,
+                        title,
+                        content,
+                        updated_at,
+                        created_at
+                    ) FROM STDIN;
+                    """
+                ) as copy,
+            ):
+                for note in notes:
+                    await copy.write_row(
+                        (
+                            note.id,
+                            note.user_id,
+                            note.title,
+                            note.content,
+                            note.updated_at,
+                            note.created_at,
+                        ),
+                    )
+        except errors.Error as error:
+            raise DatabaseError(error) from error
+
+    @instrumented
     async def update(
         self,
         note: Note,
     ) -> None:
         try:
-            async with self._connection.cursor() as cursor:
+            async with await self._cursor() as cursor:
                 await cursor.execute(
                     """
                     UPDATE notes
@@ -60,12 +121,13 @@ class PostgresNoteRepository(NoteRepository):
         except errors.Error as error:
             raise DatabaseError(error) from error
 
+    @instrumented
     async def delete(
         self,
         note_id: UUID,
     ) -> None:
         try:
-            async with self._connection.cursor() as cursor:
+            async with await self._cursor() as cursor:
                 await cursor.execute(
                     """
                     DELETE FROM notes
@@ -75,3 +137,367 @@ class PostgresNoteRepository(NoteRepository):
                 )
         except errors.Error as error:
             raise DatabaseError(error) from error
+
+    @instrumented
+    async def find_by_id(
+        self,
+        note_id: UUID,
+        user_id: UUID,
+    ) -> NoteWithCategories | None:
+        try:
+            async with await self._cursor() as cursor:
+                await cursor.execute(
+                    """
+                    SELECT
+                        id,
+                        user_id,
+                        title,
+                        content,
+                        updated_at,
+                        created_at,
+                        ARRAY(
+                            SELECT category_id FROM notes_categories
+                            WHERE note_id = notes.id
+                            ORDER BY category_id
+                        ) AS category_ids
+                    FROM notes
+                    WHERE id = %s
+                    AND user_id = %s;
+                    """,
+                    [note_id, user_id],
+                    prepare=True,
+                )
+                row = await cursor.fetchone()
+        except errors.Error as error:
+            raise DatabaseError(error) from error
+
+        if row is None:
+            return None
+
+        return NoteWithCategories.model_validate(row)
+
+    @instrumented
+    async def update_owned(
+        self,
+        note: Note,
+        expected_updated_at: list[datetime] | None = None,
+    ) -> Note | None:
+        condition = (
+            sql.SQL("AND updated_at = ANY(%(expected_updated_at)s)")
+            if expected_updated_at is not None
+            else sql.SQL("")
+        )
+        # updated_at only moves forward, even for two updates within the
+        # same second, so (id, updated_at) always identifies a version.
+        query = sql.SQL(
+            """
+            UPDATE notes
+            SET
+                title = %(title)s,
+                content = %(content)s,
+                updated_at = GREATEST(
+                    %(updated_at)s,
+                    updated_at + INTERVAL '1 microsecond'
+                )
+            WHERE id = %(id)s
+            AND user_id = %(user_id)s
+            {condition}
+            RETURNING
+                id,
+                user_id,
+                title,
+                content,
+                updated_at,
+                created_at;
+            """
+        ).format(condition=condition)
+
+        try:
+            async with await self._cursor() as cursor:
+                await cursor.execute(
+                    query,
+                    {
+                        **note.model_dump(),
+                        "expected_updated_at": expected_updated_at,
+                    },
+                    prepare=True,
+                )
+                row = await cursor.fetchone()
+        except errors.Error as error:
+            raise DatabaseError(error) from error
+
+        if row is None:
+            return None
+
+        return Note.model_validate(row)
+
+    @instrumented
+    async def delete_owned(
+        self,
+        note_id: UUID,
+        user_id: UUID,
+    ) -> bool:
+        try:
+            async with await self._cursor() as cursor:
+                await cursor.execute(
+                    """
+                    DELETE FROM notes
+                    WHERE id = %s
+                    AND user_id = %s
+                    RETURNING id;
+                    """,
+                    [note_id, user_id],
+                    prepare=True,
+                )
+                row = await cursor.fetchone()
+        except errors.Error as error:
+            raise DatabaseError(error) from error
+
+        return row is not None
+
+    @instrumented
+    async def find_page(
+        self,
+        user_id: UUID,
+        limit: int,
+        after: NotePageKey | None = None,
+    ) -> list[NoteWithCategories]:
+        keyset = (
+            sql.SQL("AND (updated_at, id) < (%(updated_at)s, %(id)s)")
+            if after is not None
+            else sql.SQL("")
+        )
+        query = sql.SQL(
+            """
+            SELECT
+                id,
+                user_id,
+                title,
+                content,
+                updated_at,
+                created_at,
+                ARRAY(
+                    SELECT category_id FROM notes_categories
+                    WHERE note_id = notes.id
+                    ORDER BY category_id
+                ) AS category_ids
+            FROM notes
+            WHERE user_id = %(user_id)s
+            {keyset}
+            ORDER BY updated_at DESC, id DESC
+            LIMIT %(limit)s;
+            """
+        ).format(keyset=keyset)
+
+        try:
+            async with await self._cursor() as cursor:
+                await cursor.execute(
+                    query,
+                    {
+                        "user_id": user_id,
+                        "limit": limit,
+                        **(after.model_dump() if after is not None else {}),
+                    },
+                    prepare=True,
+                )
+                result = await cursor.fetchall()
+        except errors.Error as error:
+            raise DatabaseError(error) from error
+
+        return [NoteWithCategories.model_validate(row) for row in result]
+
+    @instrumented
+    async def find_changes(
+        self,
+        user_id: UUID,
+        limit: int,
+        after: ChangeKey | None = None,
+    ) -> list[NoteChange]:
+        keyset = (
+            sql.SQL("AND (change_id, id) > (%(change_id)s, %(id)s)")
+            if after is not None
+            else sql.SQL("")
+        )
+        query = sql.SQL(
+            """
+            SELECT
+                id,
+                user_id,
+                title,
+                content,
+                updated_at,
+                created_at,
+                ARRAY(
+                    SELECT category_id FROM notes_categories
+                    WHERE note_id = notes.id
+                    ORDER BY category_id
+                ) AS category_ids,
+                change_id
+            FROM notes
+            WHERE user_id = %(user_id)s
+            {settled}
+            {keyset}
+            ORDER BY change_id, id
+            LIMIT %(limit)s;
+            """
+        ).format(settled=SETTLED_CHANGES, keyset=keyset)
+
+        try:
+            async with await self._cursor() as cursor:
+                await cursor.execute(
+                    query,
+                    {
+                        "user_id": user_id,
+                        "limit": limit,
+                        **(after.model_dump() if after is not None else {}),
+                    },
+                    prepare=True,
+                )
+                result = await cursor.fetchall()
+        except errors.Error as error:
+            raise DatabaseError(error) from error
+
+        return [NoteChange.model_validate(row) for row in result]
+
+    @instrumented
+    async def search(
+        self,
+        user_id: UUID,
+        query: str,
+        limit: int,
+        after: NoteSearchKey | None = None,
+    ) -> list[NoteSearchResult]:
+        keyset = (
+            sql.SQL(
+                "AND (ts_rank_cd(notes.search, query), notes.id) "
+                "< (%(rank)s::REAL, %(id)s)"
+            )
+            if after is not None
+            else sql.SQL("")
+        )
+        statement = sql.SQL(
+            """
+            SELECT
+                page.id,
+                page.title,
+                ts_headline(
+                    'simple',
+                    coalesce(page.content, ''),
+                    page.query,
+                    %(headline_options)s
+                ) AS headline,
+                page.rank,
+                page.updated_at
+            FROM (
+                SELECT
+                    notes.id,
+                    notes.title,
+                    notes.content,
+                    notes.updated_at,
+                    query,
+                    ts_rank_cd(notes.search, query) AS rank
+                FROM notes, websearch_to_tsquery('simple', %(query)s) AS query
+                WHERE notes.user_id = %(user_id)s
+                AND notes.search @@ query
+                {keyset}
+                ORDER BY rank DESC, notes.id DESC
+                LIMIT %(limit)s
+            ) AS page
+            ORDER BY page.rank DESC, page.id DESC;
+            """
+        ).format(keyset=keyset)
+
+        try:
+            async with await self._cursor() as cursor:
+                await cursor.execute(
+                    statement,
+                    {
+                        "user_id": user_id,
+                        "query": query,
+                        "limit": limit,
+                        "headline_options": HEADLINE_OPTIONS,
+                        **(after.model_dump() if after is not None else {}),
+                    },
+                    prepare=True,
+                )
+                result = await cursor.fetchall()
+        except errors.Error as error:
+            raise DatabaseError(error) from error
+
+        return [NoteSearchResult.model_validate(row) for row in result]
+
+    @instrumented
+    async def autocomplete(
+        self,
+        user_id: UUID,
+        term: str,
+        limit: int,
+        *,
+        substring: bool = False,
+    ) -> list[NoteSuggestion]:
+        pattern, prefix = like_patterns(term, substring=substring)
+
+        try:
+            async with await self._cursor() as cursor:
+                await cursor.execute(
+                    """
+                    SELECT id, title FROM notes
+                    WHERE user_id = %(user_id)s
+                    AND lower(title::TEXT) LIKE lower(%(pattern)s)
+                    ORDER BY
+                        lower(title::TEXT) LIKE lower(%(prefix)s) DESC,
+                        length(title),
+                        lower(title::TEXT),
+                        id
+                    LIMIT %(limit)s;
+                    """,
+                    {
+                        "user_id": user_id,
+                        "pattern": pattern,
+                        "prefix": prefix,
+                        "limit": limit,
+                    },
+                    prepare=True,
+                )
+                result = await cursor.fetchall()
+        except errors.Error as error:
+            raise DatabaseError(error) from error
+
+        return [NoteSuggestion.model_validate(row) for row in result]
+
+    async def stream(
+        self,
+        user_id: UUID,
+    ) -> AsyncGenerator[NoteWithCategories, None]:
+        try:
+            cursor = await self._server_cursor()
+            try:
+                await cursor.execute(
+                    """
+                    SELECT
+                        id,
+                        user_id,
+                        title,
+                        content,
+                        updated_at,
+                        created_at,
+                        ARRAY(
+                            SELECT category_id FROM notes_categories
+                            WHERE note_id = notes.id
+                            ORDER BY category_id
+                        ) AS category_ids
+                    FROM notes
+                    WHERE user_id = %s
+                    ORDER BY updated_at DESC, id DESC;
+                    """,
+                    [user_id],
+                )
+                async for row in cursor:
+                    yield NoteWithCategories.model_validate(row)
+            finally:
+                # Closing must complete even when the consumer is cancelled,
+                # or the connection is left mid-query and gets discarded.
+                with CancelScope(shield=True):
+                    await cursor.close()
+        except errors.Error as error:
+            raise DatabaseError(error) from error
@@ -0,0 +1,64 @@
+from uuid import UUID
+
+from psycopg import errors, sql
+
+from src.common.adapters.errors import DatabaseError
+from src.common.adapters.postgres.postgres_connection_repository import (
+    PostgresConnectionRepository,
+)
+from src.common.adapters.postgres.query_recorder import instrumented
+from src.core.adapters.postgres.changes import SETTLED_CHANGES
+from src.core.domain.entities import Tombstone, TombstoneEntityEnum
+from src.core.ports.repositories.change_key import ChangeKey
+from src.core.ports.repositories.tombstone_repository import (
+    TombstoneRepository,
+)
+
+
+class PostgresTombstoneRepository(
+    PostgresConnectionRepository,
+    TombstoneRepository,
+):
+    @instrumented
+    async def find_changes(
+        self,
+        user_id: UUID,
+        entity: TombstoneEntityEnum,
+        limit: int,
+        after: ChangeKey | None = None,
+    ) -> list[Tombstone]:
+        keyset = (
+            sql.SQL("AND (change_id, id) > (%(change_id)s, %(id)s)")
+            if after is not None
+            else sql.SQL("")
+        )
+        query = sql.SQL(
+            """
+            SELECT entity, id, user_id, deleted_at, change_id
+            FROM tombstones
+            WHERE user_id = %(user_id)s
+            AND entity = %(entity)s
+            {settled}
+            {keyset}
+            ORDER BY change_id, id
+            LIMIT %(limit)s;
+            """
+        ).format(settled=SETTLED_CHANGES, keyset=keyset)
+
+        try:
+            async with await self._cursor() as cursor:
+                await cursor.execute(
+                    query,
+                    {
+                        "user_id": user_id,
+                        "entity": entity.value,
+                        "limit": limit,
+                        **(after.model_dump() if after is not None else {}),
+                    },
+                    prepare=True,
+                )
+                result = await cursor.fetchall()
+        except errors.Error as error:
+            raise DatabaseError(error) from error
+
+        return [Tombstone.model_validate(row) for row in result]
@@ -1,4 +1,5 @@
 from datetime import datetime
+from enum import Enum
 from uuid import UUID, uuid4
 
 from pydantic import BaseModel, Field
@@ -46,3 +47,46 @@ class NoteCategory(BaseModel):
         strict=True,
         default_factory=Datetime.now,
     )
+
+
+class NoteWithCategories(Note):
+    category_ids: list[UUID] = Field(default_factory=list)
+
+
+class NoteChange(NoteWithCategories):
+    change_id: int
+
+
+class CategoryChange(Category):
+    change_id: int
+
+
+class NoteSearchResult(BaseModel):
+    id: UUID
+    title: str
+    headline: str
+    rank: float
+    updated_at: datetime
+
+
+class NoteSuggestion(BaseModel):
+    id: UUID
+    title: str
+
+
+class CategorySuggestion(BaseModel):
+    id: UUID
+    name: str
+
+
+class TombstoneEntityEnum(str, Enum):
+    notes = "notes"
+    categories = "categories"
+
+
+class Tombstone(BaseModel):
+    entity: TombstoneEntityEnum
+    id: UUID
+    user_id: UUID
+    deleted_at: datetime
+    change_id: int = 0
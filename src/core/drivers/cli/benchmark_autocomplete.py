@@ -0,0 +1,157 @@
+import argparse
+import asyncio
+import os
+from collections.abc import Sequence
+from functools import partial
+
+from psycopg import AsyncConnection
+from psycopg.rows import DictRow, dict_row
+
+from src.common.drivers.cli.latency import MIN_SAMPLES, Latency, measure
+from src.core.adapters.postgres.repositories import (
+    PostgresCategoryRepository,
+    PostgresNoteRepository,
+)
+from src.core.drivers.cli.seed_notes import cleanup, seed
+
+PREFIXES = ("n", "no", "not", "note 1", "note 12345")
+SUBSTRINGS = ("w12", "123", " w9")
+CATEGORY_PREFIXES = ("c", "cat", "category 1", "category 1234")
+
+LIMIT = 10
+
+
+class AutocompleteBenchmarkResult(Latency):
+    table: str
+    mode: str
+    term: str
+
+
+async def benchmark(
+    database_url: str,
+    *,
+    users: int,
+    notes: int,
+    categories: int,
+    iterations: int,
+) -> list[AutocompleteBenchmarkResult]:
+    async with await AsyncConnection.connect(
+        database_url,
+        autocommit=True,
+        row_factory=dict_row,
+    ) as connection:
+
+        async def get_connection() -> AsyncConnection[DictRow]:
+            return connection
+
+        note_repository = PostgresNoteRepository(get_connection)
+        category_repository = PostgresCategoryRepository(get_connection)
+        user_ids = await seed(
+            connection,
+            users=users,
+            notes=notes,
+            categories=categories,
+        )
+        user_id = user_ids[0]
+
+        async def autocomplete_notes(term: str, *, substring: bool) -> int:
+            results = await note_repository.autocomplete(
+                user_id,
+                term,
+                LIMIT,
+                substring=substring,
+            )
+            return len(results)
+
+        async def autocomplete_categories(
+            term: str,
+            *,
+            substring: bool,
+        ) -> int:
+            results = await category_repository.autocomplete(
+                user_id,
+                term,
+                LIMIT,
+                substring=substring,
+            )
+            return len(results)
+
+        cases = [
+            *(("notes", "prefix", term) for term in PREFIXES),
+            *(("notes", "substring", term) for term in SUBSTRINGS),
+            *(("categories", "prefix", term) for term in CATEGORY_PREFIXES),
+            *(("categories", "substring", term) for term in SUBSTRINGS),
+        ]
+
+        try:
+            results: list[AutocompleteBenchmarkResult] = []
+            for table, mode, term in cases:
+                call = (
+                    autocomplete_notes
+                    if table == "notes"
+                    else autocomplete_categories
+                )
+                latency = await measure(
+                    partial(call, term, substring=mode == "substring"),
+                    iterations,
+                )
+                results.append(
+                    AutocompleteBenchmarkResult(
+                        table=table,
+                        mode=mode,
+                        term=term,
+                        **latency.model_dump(),
+                    ),
+                )
+            return results
+        finally:
+            await cleanup(connection, user_ids)
+
+
+def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Seed notes and categories and measure the autocomplete "
+            "queries for one user"
+        ),
+    )
+    parser.add_argument(
+        "--database-url",
+        default=os.environ.get("DATABASE_URL"),
+        required="DATABASE_URL" not in os.environ,
+    )
+    parser.add_argument("--users", type=int, default=100)
+    parser.add_argument("--notes", type=int, default=1_000_000)
+    parser.add_argument("--categories", type=int, default=100_000)
+    parser.add_argument("--iterations", type=int, default=50)
+    args = parser.parse_args(argv)
+    if args.iterations < MIN_SAMPLES:
+        parser.error(f"--iterations must be at least {MIN_SAMPLES}")
+    return args
+
+
+async def run(args: argparse.Namespace) -> None:
+    print(
+        f"{'table':>10} {'mode':>9} {'term':>14} {'rows':>4} "
+        f"{'p50_ms':>8} {'p99_ms':>8}"
+    )
+    results = await benchmark(
+        args.database_url,
+        users=args.users,
+        notes=args.notes,
+        categories=args.categories,
+        iterations=args.iterations,
+    )
+    for result in results:
+        print(
+            f"{result.table:>10} {result.mode:>9} {result.term!r:>14} "
+            f"{result.rows:>4} {result.p50_ms:>8.3f} {result.p99_ms:>8.3f}"
+        )
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    asyncio.run(run(parse_args(argv)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+import argparse
+import asyncio
+import os
+from collections.abc import Sequence
+from functools import partial
+
+from psycopg import AsyncConnection
+from psycopg.rows import DictRow, dict_row
+
+from src.common.drivers.cli.latency import MIN_SAMPLES, Latency, measure
+from src.core.adapters.postgres.repositories import PostgresNoteRepository
+from src.core.drivers.cli.seed_notes import cleanup, seed
+
+TERMS = ("w0", "w10", "w500", "w9999", "w1 w2", '"w0 w1"', "w3 -w4")
+
+PAGE_SIZE = 20
+
+
+class SearchBenchmarkResult(Latency):
+    term: str
+    method: str
+
+
+async def benchmark(
+    database_url: str,
+    *,
+    users: int,
+    notes: int,
+    iterations: int,
+) -> list[SearchBenchmarkResult]:
+    async with await AsyncConnection.connect(
+        database_url,
+        autocommit=True,
+        row_factory=dict_row,
+    ) as connection:
+
+        async def get_connection() -> AsyncConnection[DictRow]:
+            return connection
+
+        repository = PostgresNoteRepository(get_connection)
+        user_ids = await seed(connection, users=users, notes=notes)
+        user_id = user_ids[0]
+
+        async def search(term: str) -> int:
+            results = await repository.search(user_id, term, PAGE_SIZE + 1)
+            return len(results)
+
+        async def scan(term: str) -> int:
+            word = term.strip('"').split()[0]
+            pattern = f"%{word}%"
+            cursor = await connection.execute(
+                """
+                SELECT id FROM notes
+                WHERE user_id = %s
+                AND (title ILIKE %s OR content ILIKE %s)
+                ORDER BY updated_at DESC
+                LIMIT %s;
+                """,
+                [user_id, pattern, pattern, PAGE_SIZE + 1],
+            )
+            return len(await cursor.fetchall())
+
+        try:
+            results: list[SearchBenchmarkResult] = []
+            for term in TERMS:
+                for method, call in (("tsvector", search), ("ilike", scan)):
+                    latency = await measure(partial(call, term), iterations)
+                    results.append(
+                        SearchBenchmarkResult(
+                            term=term,
+                            method=method,
+                            **latency.model_dump(),
+                        ),
+                    )
+            return results
+        finally:
+            await cleanup(connection, user_ids)
+
+
+def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Seed notes and compare full-text search with an ILIKE scan "
+            "for one user"
+        ),
+    )
+    parser.add_argument(
+        "--database-url",
+        default=os.environ.get("DATABASE_URL"),
+        required="DATABASE_URL" not in os.environ,
+    )
+    parser.add_argument("--users", type=int, default=100)
+    parser.add_argument("--notes", type=int, default=1_000_000)
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args(argv)
+    if args.iterations < MIN_SAMPLES:
+        parser.error(f"--iterations must be at least {MIN_SAMPLES}")
+    return args
+
+
+async def run(args: argparse.Namespace) -> None:
+    print(
+        f"{'term':>10} {'method':>8} {'rows':>5} {'p50_ms':>8} {'p99_ms':>8}"
+    )
+    results = await benchmark(
+        args.database_url,
+        users=args.users,
+        notes=args.notes,
+        iterations=args.iterations,
+    )
+    for result in results:
+        print(
+            f"{result.term:>10} {result.method:>8} {result.rows:>5} "
+            f"{result.p50_ms:>8.3f} {result.p99_ms:>8.3f}"
+        )
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    asyncio.run(run(parse_args(argv)))
+
+
+if __name__ == "__main__":
+    main()
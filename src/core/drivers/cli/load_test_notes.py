@@ -0,0 +1,243 @@
+import argparse
+import asyncio
+import os
+import statistics
+import time
+from collections.abc import Awaitable, Callable, Sequence
+from functools import partial
+from uuid import UUID, uuid4
+
+from psycopg import AsyncConnection
+from psycopg.rows import DictRow, dict_row
+from psycopg_pool import AsyncConnectionPool
+from pydantic import BaseModel
+
+from src.auth.adapters.repositories.postgres.postgres_user_repository import (
+    PostgresUserRepository,
+)
+from src.auth.domain.entities import User
+from src.common.adapters.postgres.instrumented_async_cursor import (
+    InstrumentedAsyncCursor,
+)
+from src.common.adapters.postgres.query_recorder import query_recorder
+from src.common.adapters.postgres.singleton_async_pool import (
+    PREPARE_THRESHOLD,
+)
+from src.common.drivers.cli.latency import MIN_SAMPLES
+from src.core.adapters.postgres.postgres_unit_of_work import PostgresUnitOfWork
+from src.core.use_cases.create_category_use_case import CreateCategoryUseCase
+from src.core.use_cases.create_note_use_case import CreateNoteUseCase
+from src.core.use_cases.delete_note_use_case import DeleteNoteUseCase
+from src.core.use_cases.get_note_use_case import GetNoteUseCase
+from src.core.use_cases.inputs import (
+    CreateCategoryInput,
+    CreateNoteInput,
+    UpdateNoteInput,
+)
+from src.core.use_cases.update_note_use_case import UpdateNoteUseCase
+
+OPERATIONS = ("create", "get", "update", "delete")
+
+Pool = AsyncConnectionPool[AsyncConnection[DictRow]]
+
+
+class LoadTestResult(BaseModel):
+    operation: str
+    requests: int
+    requests_per_second: float
+    p50_ms: float
+    p99_ms: float
+    statements_per_request: float
+
+
+class Worker:
+    def __init__(self, pool: Pool, categories: int) -> None:
+        self._pool = pool
+        self._categories = categories
+        self.user_id = uuid4()
+        self.category_ids: list[UUID] = []
+        self.note_ids: list[UUID] = []
+
+    async def setup(self) -> None:
+        await PostgresUserRepository(self._pool).create(
+            User(
+                id=self.user_id,
+                email=f"{self.user_id.hex}@example.com",
+                password="load-test",  # noqa: S106
+                first_name="Load",
+                last_name="Test",
+            ),
+        )
+        for index in range(self._categories):
+            category = await CreateCategoryUseCase(
+                PostgresUnitOfWork(self._pool),
+            )(
+                CreateCategoryInput(
+                    user_id=self.user_id,
+                    name=f"category-{index}",
+                ),
+            )
+            self.category_ids.append(category.id)
+
+    async def create(self) -> None:
+        note = await CreateNoteUseCase(PostgresUnitOfWork(self._pool))(
+            CreateNoteInput(
+                user_id=self.user_id,
+                title="Load test",
+                content="Load test note",
+                category_ids=self.category_ids,
+            ),
+        )
+        self.note_ids.append(note.id)
+
+    async def get(self, note_id: UUID) -> None:
+        await GetNoteUseCase(PostgresUnitOfWork(self._pool))(
+            note_id,
+            self.user_id,
+        )
+
+    async def update(self, note_id: UUID) -> None:
+        await UpdateNoteUseCase(PostgresUnitOfWork(self._pool))(
+            UpdateNoteInput(
+                id=note_id,
+                user_id=self.user_id,
+                title="Load test (updated)",
+                content="Load test note (updated)",
+                category_ids=self.category_ids[::-1],
+            ),
+        )
+
+    async def delete(self, note_id: UUID) -> None:
+        await DeleteNoteUseCase(PostgresUnitOfWork(self._pool))(
+            note_id,
+            self.user_id,
+        )
+
+    def calls(
+        self,
+        operation: str,
+        iterations: int,
+    ) -> list[Callable[[], Awaitable[None]]]:
+        if operation == "create":
+            return [self.create] * iterations
+
+        method: Callable[[UUID], Awaitable[None]] = getattr(self, operation)
+        return [partial(method, note_id) for note_id in self.note_ids]
+
+
+async def _run_calls(
+    calls: list[Callable[[], Awaitable[None]]],
+    latencies: list[float],
+) -> None:
+    for call in calls:
+        start = time.perf_counter()
+        await call()
+        latencies.append(time.perf_counter() - start)
+
+
+async def _run_operation(
+    workers: list[Worker],
+    operation: str,
+    iterations: int,
+) -> LoadTestResult:
+    latencies: list[float] = []
+    query_recorder.reset()
+
+    total_start = time.perf_counter()
+    await asyncio.gather(
+        *(
+            _run_calls(worker.calls(operation, iterations), latencies)
+            for worker in workers
+        ),
+    )
+    total_seconds = time.perf_counter() - total_start
+
+    statements = sum(stats.calls for stats in query_recorder.stats().values())
+    percentiles = statistics.quantiles(latencies, n=100, method="inclusive")
+
+    return LoadTestResult(
+        operation=operation,
+        requests=len(latencies),
+        requests_per_second=len(latencies) / total_seconds,
+        p50_ms=statistics.median(latencies) * 1000,
+        p99_ms=percentiles[98] * 1000,
+        statements_per_request=statements / len(latencies),
+    )
+
+
+async def load_test(
+    database_url: str,
+    *,
+    concurrency: int,
+    iterations: int,
+    categories: int,
+) -> list[LoadTestResult]:
+    async with AsyncConnectionPool(
+        database_url,
+        min_size=concurrency,
+        max_size=concurrency,
+        connection_class=AsyncConnection[DictRow],
+        kwargs={
+            "row_factory": dict_row,
+            "cursor_factory": InstrumentedAsyncCursor,
+            "prepare_threshold": PREPARE_THRESHOLD,
+        },
+        open=False,
+    ) as pool:
+        workers = [Worker(pool, categories) for _ in range(concurrency)]
+        for worker in workers:
+            await worker.setup()
+
+        return [
+            await _run_operation(workers, operation, iterations)
+            for operation in OPERATIONS
+        ]
+
+
+def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Load test the note use cases (create, get, update and delete) "
+            "against a migrated database"
+        ),
+    )
+    parser.add_argument(
+        "--database-url",
+        default=os.environ.get("DATABASE_URL"),
+        required="DATABASE_URL" not in os.environ,
+    )
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--iterations", type=int, default=100)
+    parser.add_argument("--categories", type=int, default=3)
+    args = parser.parse_args(argv)
+    if args.iterations < MIN_SAMPLES:
+        parser.error(f"--iterations must be at least {MIN_SAMPLES}")
+    return args
+
+
+async def run(args: argparse.Namespace) -> None:
+    print(
+        f"{'operation':>9} {'requests':>8} {'requests/s':>10} "
+        f"{'p50_ms':>8} {'p99_ms':>8} {'statements':>10}"
+    )
+    results = await load_test(
+        args.database_url,
+        concurrency=args.concurrency,
+        iterations=args.iterations,
+        categories=args.categories,
+    )
+    for result in results:
+        print(
+            f"{result.operation:>9} {result.requests:>8} "
+            f"{result.requests_per_second:>10.1f} "
+            f"{result.p50_ms:>8.3f} {result.p99_ms:>8.3f} "
+            f"{result.statements_per_request:>10.1f}"
+        )
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    asyncio.run(run(parse_args(argv)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+from uuid import UUID
+
+from psycopg import AsyncConnection
+from psycopg.rows import DictRow
+
+VOCABULARY_SIZE = 10_000
+
+
+async def seed(
+    connection: AsyncConnection[DictRow],
+    *,
+    users: int,
+    notes: int,
+    categories: int = 0,
+    batch_size: int = 100_000,
+) -> list[UUID]:
+    cursor = await connection.execute(
+        """
+        INSERT INTO users (
+            id,
+            email,
+            password,
+            first_name,
+            last_name,
+            updated_at,
+            created_at
+        )
+        SELECT
+            id,
+            'seed-' || id || '@example.com',
+            'seed',
+            'Seed',
+            'User',
+            now(),
+            now()
+        FROM (
+            SELECT gen_random_uuid() AS id
+            FROM generate_series(1, %(users)s)
+        ) AS seeded
+        RETURNING id;
+        """,
+        {"users": users},
+    )
+    user_ids = [row["id"] for row in await cursor.fetchall()]
+
+    # Word frequencies are skewed (w0 is the most common) so that searches
+    # hit both very common and rare words.
+    for start in range(0, notes, batch_size):
+        await connection.execute(
+            """
+            INSERT INTO notes (
+                id,
+                user_id,
+                title,
+                content,
+                updated_at,
+                created_at
+            )
+            SELECT
+                gen_random_uuid(),
+                (%(user_ids)s::UUID[])[1 + i %% %(users)s],
+                'note ' || i || ' w' || i %% %(vocabulary)s,
+                (
+                    SELECT string_agg(
+                        'w' || floor(power(random(), 3) * %(vocabulary)s),
+                        ' '
+                    )
+                    FROM generate_series(1, 40)
+                    WHERE i > 0
+                ),
+                now() - i * INTERVAL '1 second',
+                now()
+            FROM generate_series(%(start)s, %(stop)s) AS i;
+            """,
+            {
+                "user_ids": user_ids,
+                "users": users,
+                "vocabulary": VOCABULARY_SIZE,
+                "start": start + 1,
+                "stop": min(start + batch_size, notes),
+            },
+        )
+
+    if categories > 0:
+        await connection.execute(
+            """
+            INSERT INTO categories (
+                id,
+                user_id,
+                name,
+                updated_at,
+                created_at
+            )
+            SELECT
+                gen_random_uuid(),
+                (%(user_ids)s::UUID[])[1 + i %% %(users)s],
+                'category ' || i || ' w' || i %% %(vocabulary)s,
+                now(),
+                now()
+            FROM generate_series(1, %(categories)s) AS i;
+            """,
+            {
+                "user_ids": user_ids,
+                "users": users,
+                "vocabulary": VOCABULARY_SIZE,
+                "categories": categories,
+            },
+        )
+
+    await connection.execute("ANALYZE users, notes, categories;")
+
+    return user_ids
+
+
+async def cleanup(
+    connection: AsyncConnection[DictRow],
+    user_ids: list[UUID],
+) -> None:
+    await connection.execute(
+        "DELETE FROM users WHERE id = ANY(%s);",
+        [user_ids],
+    )
@@ -1,6 +1,7 @@
 from typing import Annotated
+from uuid import UUID
 
-from fastapi import Body, Depends
+from fastapi import Body, Depends, Header, Query
 from psycopg import AsyncConnection
 from psycopg.rows import DictRow
 from psycopg_pool import AsyncConnectionPool
@@ -8,14 +9,40 @@ from psycopg_pool import AsyncConnectionPool
 from src.auth.domain.entities import User
 from src.auth.drivers.rest.dependencies import get_current_user
 from src.common.drivers.rest.dependencies import get_pool
+from src.common.drivers.rest.etag import matching_versions
 from src.common.drivers.rest.model_validate import model_validate
+from src.common.settings import settings
 from src.core.adapters.postgres.postgres_unit_of_work import PostgresUnitOfWork
 from src.core.ports.unit_of_work import UnitOfWork
+from src.core.use_cases.autocomplete_categories_use_case import (
+    AutocompleteCategoriesUseCase,
+)
+from src.core.use_cases.autocomplete_notes_use_case import (
+    AutocompleteNotesUseCase,
+)
 from src.core.use_cases.create_category_use_case import CreateCategoryUseCase
+from src.core.use_cases.create_note_use_case import CreateNoteUseCase
+from src.core.use_cases.delete_note_use_case import DeleteNoteUseCase
+from src.core.use_cases.export_notes_use_case import ExportNotesUseCase
+from src.core.use_cases.get_note_use_case import GetNoteUseCase
+from src.core.use_cases.import_notes_use_case import ImportNotesUseCase
 from src.core.use_cases.inputs import (
+    AutocompleteInput,
+    AutocompleteModeEnum,
     CreateCategoryInput,
     CreateCategoryInputBase,
+    CreateNoteInput,
+    CreateNoteInputBase,
+    ListNotesInput,
+    SearchNotesInput,
+    SyncInput,
+    UpdateNoteInput,
+    UpdateNoteInputBase,
 )
+from src.core.use_cases.list_notes_use_case import ListNotesUseCase
+from src.core.use_cases.search_notes_use_case import SearchNotesUseCase
+from src.core.use_cases.sync_use_case import SyncUseCase
+from src.core.use_cases.update_note_use_case import UpdateNoteUseCase
 
 
 def get_unit_of_work(
@@ -53,3 +80,227 @@ async def get_create_category_input(
             "user_id": user.id,
         },
     )
+
+
+def get_create_note_use_case(
+    unit_of_work: Annotated[
+        UnitOfWork,
+        Depends(get_unit_of_work),
+    ],
+) -> CreateNoteUseCase:
+    return CreateNoteUseCase(unit_of_work)
+
+
+def get_get_note_use_case(
+    unit_of_work: Annotated[
+        UnitOfWork,
+        Depends(get_unit_of_work),
+    ],
+) -> GetNoteUseCase:
+    return GetNoteUseCase(unit_of_work)
+
+
+def get_update_note_use_case(
+    unit_of_work: Annotated[
+        UnitOfWork,
+        Depends(get_unit_of_work),
+    ],
+) -> UpdateNoteUseCase:
+    return UpdateNoteUseCase(unit_of_work)
+
+
+def get_delete_note_use_case(
+    unit_of_work: Annotated[
+        UnitOfWork,
+        Depends(get_unit_of_work),
+    ],
+) -> DeleteNoteUseCase:
+    return DeleteNoteUseCase(unit_of_work)
+
+
+async def get_create_note_input(
+    user: Annotated[
+        User,
+        Depends(get_current_user),
+    ],
+    data: Annotated[
+        CreateNoteInputBase,
+        Body(title="CreateNoteInput"),
+    ],
+) -> CreateNoteInput:
+    return model_validate(
+        CreateNoteInput,
+        {
+            **data.model_dump(),
+            "user_id": user.id,
+        },
+    )
+
+
+async def get_update_note_input(
+    note_id: UUID,
+    user: Annotated[
+        User,
+        Depends(get_current_user),
+    ],
+    data: Annotated[
+        UpdateNoteInputBase,
+        Body(title="UpdateNoteInput"),
+    ],
+    if_match: Annotated[str | None, Header()] = None,
+) -> UpdateNoteInput:
+    return model_validate(
+        UpdateNoteInput,
+        {
+            **data.model_dump(),
+            "id": note_id,
+            "user_id": user.id,
+            "expected_updated_at": matching_versions(if_match, note_id),
+        },
+    )
+
+
+def get_list_notes_use_case(
+    unit_of_work: Annotated[
+        UnitOfWork,
+        Depends(get_unit_of_work),
+    ],
+) -> ListNotesUseCase:
+    return ListNotesUseCase(unit_of_work)
+
+
+async def get_list_notes_input(
+    user: Annotated[
+        User,
+        Depends(get_current_user),
+    ],
+    limit: Annotated[int, Query(ge=1, le=100)] = 20,
+    cursor: Annotated[str | None, Query(max_length=512)] = None,
+) -> ListNotesInput:
+    return model_validate(
+        ListNotesInput,
+        {
+            "user_id": user.id,
+            "limit": limit,
+            "cursor": cursor,
+        },
+        base_loc=("query",),
+    )
+
+
+def get_search_notes_use_case(
+    unit_of_work: Annotated[
+        UnitOfWork,
+        Depends(get_unit_of_work),
+    ],
+) -> SearchNotesUseCase:
+    return SearchNotesUseCase(unit_of_work)
+
+
+async def get_search_notes_input(
+    user: Annotated[
+        User,
+        Depends(get_current_user),
+    ],
+    q: Annotated[str, Query(min_length=1, max_length=256)],
+    limit: Annotated[int, Query(ge=1, le=100)] = 20,
+    cursor: Annotated[str | None, Query(max_length=512)] = None,
+) -> SearchNotesInput:
+    return model_validate(
+        SearchNotesInput,
+        {
+            "user_id": user.id,
+            "query": q,
+            "limit": limit,
+            "cursor": cursor,
+        },
+        base_loc=("query",),
+    )
+
+
+def get_autocomplete_notes_use_case(
+    unit_of_work: Annotated[
+        UnitOfWork,
+        Depends(get_unit_of_work),
+    ],
+) -> AutocompleteNotesUseCase:
+    return AutocompleteNotesUseCase(unit_of_work)
+
+
+def get_autocomplete_categories_use_case(
+    unit_of_work: Annotated[
+        UnitOfWork,
+        Depends(get_unit_of_work),
+    ],
+) -> AutocompleteCategoriesUseCase:
+    return AutocompleteCategoriesUseCase(unit_of_work)
+
+
+async def get_autocomplete_input(
+    user: Annotated[
+        User,
+        Depends(get_current_user),
+    ],
+    q: Annotated[str, Query(min_length=1, max_length=100)],
+    limit: Annotated[int, Query(ge=1, le=20)] = 10,
+    mode: AutocompleteModeEnum = AutocompleteModeEnum.prefix,
+) -> AutocompleteInput:
+    return model_validate(
+        AutocompleteInput,
+        {
+            "user_id": user.id,
+            "query": q,
+            "limit": limit,
+            "mode": mode,
+        },
+        base_loc=("query",),
+    )
+
+
+def get_export_notes_use_case(
+    unit_of_work: Annotated[
+        UnitOfWork,
+        Depends(get_unit_of_work),
+    ],
+) -> ExportNotesUseCase:
+    return ExportNotesUseCase(unit_of_work)
+
+
+def get_import_notes_use_case(
+    unit_of_work: Annotated[
+        UnitOfWork,
+        Depends(get_unit_of_work),
+    ],
+) -> ImportNotesUseCase:
+    return ImportNotesUseCase(
+        unit_of_work,
+        chunk_size=settings.IMPORT_CHUNK_SIZE,
+    )
+
+
+def get_sync_use_case(
+    unit_of_work: Annotated[
+        UnitOfWork,
+        Depends(get_unit_of_work),
+    ],
+) -> SyncUseCase:
+    return SyncUseCase(unit_of_work)
+
+
+async def get_sync_input(
+    user: Annotated[
+        User,
+        Depends(get_current_user),
+    ],
+    limit: Annotated[int, Query(ge=1, le=500)] = 100,
+    cursor: Annotated[str | None, Query(max_length=1024)] = None,
+) -> SyncInput:
+    return model_validate(
+        SyncInput,
+        {
+            "user_id": user.id,
+            "limit": limit,
+            "cursor": cursor,
+        },
+        base_loc=("query",),
+    )
@@ -2,11 +2,33 @@ from fastapi import status
 
 from src.common.drivers.rest.create_error_handler import create_error_handler
 from src.common.types import ExceptionHandlerEntry
-from src.core.use_cases.errors import CategoryAlreadyExistsError
+from src.core.use_cases.errors import (
+    CategoryAlreadyExistsError,
+    CategoryNotFoundError,
+    InvalidCursorError,
+    NoteChangedError,
+    NoteNotFoundError,
+)
 
 exception_handlers: list[ExceptionHandlerEntry] = [
     (
         CategoryAlreadyExistsError,
         create_error_handler(status.HTTP_409_CONFLICT),
     ),
+    (
+        CategoryNotFoundError,
+        create_error_handler(status.HTTP_404_NOT_FOUND),
+    ),
+    (
+        InvalidCursorError,
+        create_error_handler(status.HTTP_400_BAD_REQUEST),
+    ),
+    (
+        NoteChangedError,
+        create_error_handler(status.HTTP_412_PRECONDITION_FAILED),
+    ),
+    (
+        NoteNotFoundError,
+        create_error_handler(status.HTTP_404_NOT_FOUND),
+    ),
 ]
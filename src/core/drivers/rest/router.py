@@ -1,20 +1,83 @@
 from typing import Annotated
+from uuid import UUID
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Header, Request, Response, status
+from fastapi.responses import StreamingResponse
 
+from src.auth.domain.entities import User
+from src.auth.drivers.rest.dependencies import get_current_user
 from src.common.drivers.rest.errors import ErrorResponse
+from src.common.drivers.rest.etag import entity_tag, none_match
+from src.common.drivers.rest.ndjson import (
+    NDJSON_MEDIA_TYPE,
+    ndjson,
+    ndjson_lines,
+)
 from src.core.drivers.rest.dependencies import (
+    get_autocomplete_categories_use_case,
+    get_autocomplete_input,
+    get_autocomplete_notes_use_case,
     get_create_category_input,
     get_create_category_use_case,
+    get_create_note_input,
+    get_create_note_use_case,
+    get_delete_note_use_case,
+    get_export_notes_use_case,
+    get_get_note_use_case,
+    get_import_notes_use_case,
+    get_list_notes_input,
+    get_list_notes_use_case,
+    get_search_notes_input,
+    get_search_notes_use_case,
+    get_sync_input,
+    get_sync_use_case,
+    get_update_note_input,
+    get_update_note_use_case,
+)
+from src.core.use_cases.autocomplete_categories_use_case import (
+    AutocompleteCategoriesUseCase,
+)
+from src.core.use_cases.autocomplete_notes_use_case import (
+    AutocompleteNotesUseCase,
 )
 from src.core.use_cases.create_category_use_case import CreateCategoryUseCase
-from src.core.use_cases.inputs import CreateCategoryInput
-from src.core.use_cases.outputs import CreateCategoryOutput
+from src.core.use_cases.create_note_use_case import CreateNoteUseCase
+from src.core.use_cases.delete_note_use_case import DeleteNoteUseCase
+from src.core.use_cases.export_notes_use_case import ExportNotesUseCase
+from src.core.use_cases.get_note_use_case import GetNoteUseCase
+from src.core.use_cases.import_notes_use_case import ImportNotesUseCase
+from src.core.use_cases.inputs import (
+    AutocompleteInput,
+    CreateCategoryInput,
+    CreateNoteInput,
+    ListNotesInput,
+    SearchNotesInput,
+    SyncInput,
+    UpdateNoteInput,
+)
+from src.core.use_cases.list_notes_use_case import ListNotesUseCase
+from src.core.use_cases.outputs import (
+    AutocompleteCategoriesOutput,
+    AutocompleteNotesOutput,
+    CreateCategoryOutput,
+    CreateNoteOutput,
+    GetNoteOutput,
+    ImportNotesOutput,
+    ListNotesOutput,
+    SearchNotesOutput,
+    SyncOutput,
+    UpdateNoteOutput,
+)
+from src.core.use_cases.search_notes_use_case import SearchNotesUseCase
+from src.core.use_cases.sync_use_case import SyncUseCase
+from src.core.use_cases.update_note_use_case import UpdateNoteUseCase
 
-router = APIRouter(prefix="/categories", tags=["categories"])
+categories_router = APIRouter(prefix="/categories", tags=["categories"])
+notes_router = APIRouter(prefix="/notes", tags=["notes"])
+sync_router = APIRouter(prefix="/sync", tags=["sync"])
 
 
-@router.post(
+@categories_router.post(
     "/",
     status_code=status.HTTP_201_CREATED,
     response_model=CreateCategoryOutput,
@@ -41,3 +104,361 @@ async def post_categories(
     ],
 ) -> CreateCategoryOutput:
     return await create_category(data)
+
+
+@categories_router.get(
+    "/autocomplete",
+    status_code=status.HTTP_200_OK,
+    response_model=AutocompleteCategoriesOutput,
+    summary="Suggest categories by name",
+    description=(
+        "`mode=prefix` matches names starting with `q`, "
+        "`mode=substring` matches names containing it. "
+        "Substring terms shorter than 3 characters match as prefixes. "
+        "Prefix matches come first, then shorter names."
+    ),
+)
+async def autocomplete_categories(
+    data: Annotated[
+        AutocompleteInput,
+        Depends(get_autocomplete_input),
+    ],
+    autocomplete_categories: Annotated[
+        AutocompleteCategoriesUseCase,
+        Depends(get_autocomplete_categories_use_case),
+    ],
+) -> AutocompleteCategoriesOutput:
+    return await autocomplete_categories(data)
+
+
+@notes_router.post(
+    "/",
+    status_code=status.HTTP_201_CREATED,
+    response_model=CreateNoteOutput,
+    summary="Create a new note",
+    responses={
+        status.HTTP_201_CREATED: {
+            "description": "Note created successfully",
+            "model": CreateNoteOutput,
+        },
+        status.HTTP_404_NOT_FOUND: {
+            "description": "Category not found",
+            "model": ErrorResponse,
+        },
+    },
+)
+async def post_notes(
+    data: Annotated[
+        CreateNoteInput,
+        Depends(get_create_note_input),
+    ],
+    create_note: Annotated[
+        CreateNoteUseCase,
+        Depends(get_create_note_use_case),
+    ],
+) -> CreateNoteOutput:
+    return await create_note(data)
+
+
+@notes_router.get(
+    "/",
+    status_code=status.HTTP_200_OK,
+    response_model=ListNotesOutput,
+    summary="List notes, most recently updated first",
+    responses={
+        status.HTTP_200_OK: {
+            "description": "A page of notes and the cursor of the next one",
+            "model": ListNotesOutput,
+        },
+        status.HTTP_400_BAD_REQUEST: {
+            "description": "Invalid cursor",
+            "model": ErrorResponse,
+        },
+    },
+)
+async def get_notes(
+    data: Annotated[
+        ListNotesInput,
+        Depends(get_list_notes_input),
+    ],
+    list_notes: Annotated[
+        ListNotesUseCase,
+        Depends(get_list_notes_use_case),
+    ],
+) -> ListNotesOutput:
+    return await list_notes(data)
+
+
+@notes_router.get(
+    "/search",
+    status_code=status.HTTP_200_OK,
+    response_model=SearchNotesOutput,
+    summary="Search notes by title and content, best matches first",
+    description=(
+        "`q` accepts web search syntax (quoted phrases, `or`, `-term`). "
+        "Matches in `headline` are wrapped in `<mark>` tags; the rest of "
+        "the headline is the note content as is, not HTML-escaped."
+    ),
+    responses={
+        status.HTTP_200_OK: {
+            "description": "A page of results and the cursor of the next one",
+            "model": SearchNotesOutput,
+        },
+        status.HTTP_400_BAD_REQUEST: {
+            "description": "Invalid cursor",
+            "model": ErrorResponse,
+        },
+    },
+)
+async def search_notes(
+    data: Annotated[
+        SearchNotesInput,
+        Depends(get_search_notes_input),
+    ],
+    search_notes: Annotated[
+        SearchNotesUseCase,
+        Depends(get_search_notes_use_case),
+    ],
+) -> SearchNotesOutput:
+    return await search_notes(data)
+
+
+@notes_router.get(
+    "/autocomplete",
+    status_code=status.HTTP_200_OK,
+    response_model=AutocompleteNotesOutput,
+    summary="Suggest notes by title",
+    description=(
+        "`mode=prefix` matches titles starting with `q`, "
+        "`mode=substring` matches titles containing it. "
+        "Substring terms shorter than 3 characters match as prefixes. "
+        "Prefix matches come first, then shorter titles."
+    ),
+)
+async def autocomplete_notes(
+    data: Annotated[
+        AutocompleteInput,
+        Depends(get_autocomplete_input),
+    ],
+    autocomplete_notes: Annotated[
+        AutocompleteNotesUseCase,
+        Depends(get_autocomplete_notes_use_case),
+    ],
+) -> AutocompleteNotesOutput:
+    return await autocomplete_notes(data)
+
+
+@notes_router.get(
+    "/export",
+    status_code=status.HTTP_200_OK,
+    response_class=StreamingResponse,
+    summary="Export all notes as NDJSON",
+    description=(
+        "One note per line, most recently updated first, in the same shape "
+        "as `GET /notes/{note_id}`."
+    ),
+    responses={
+        status.HTTP_200_OK: {
+            "description": "The notes, one JSON object per line",
+            "content": {NDJSON_MEDIA_TYPE: {}},
+        },
+    },
+)
+async def export_notes(
+    current_user: Annotated[
+        User,
+        Depends(get_current_user),
+    ],
+    export_notes: Annotated[
+        ExportNotesUseCase,
+        Depends(get_export_notes_use_case),
+    ],
+) -> StreamingResponse:
+    return StreamingResponse(
+        ndjson(export_notes(current_user.id)),
+        media_type=NDJSON_MEDIA_TYPE,
+        headers={
+            "Content-Disposition": 'attachment; filename="notes.ndjson"',
+        },
+    )
+
+
+@notes_router.post(
+    "/import",
+    status_code=status.HTTP_200_OK,
+    response_model=ImportNotesOutput,
+    summary="Import notes from NDJSON",
+    description=(
+        "One note per line, in the shape of `POST /notes/` with optional "
+        "`created_at` and `updated_at`, so an export can be imported back. "
+        "Notes are loaded in chunks of `IMPORT_CHUNK_SIZE`, each in its own "
+        "transaction; invalid lines are skipped and reported with their "
+        "line number."
+    ),
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {NDJSON_MEDIA_TYPE: {"schema": {"type": "string"}}},
+        },
+    },
+)
+async def import_notes(
+    request: Request,
+    current_user: Annotated[
+        User,
+        Depends(get_current_user),
+    ],
+    import_notes: Annotated[
+        ImportNotesUseCase,
+        Depends(get_import_notes_use_case),
+    ],
+) -> ImportNotesOutput:
+    return await import_notes(current_user.id, ndjson_lines(request.stream()))
+
+
+@notes_router.get(
+    "/{note_id}",
+    status_code=status.HTTP_200_OK,
+    response_model=GetNoteOutput,
+    summary="Get a note",
+    responses={
+        status.HTTP_200_OK: {
+            "description": "Note data",
+            "model": GetNoteOutput,
+        },
+        status.HTTP_304_NOT_MODIFIED: {
+            "description": "Note not modified since the If-None-Match ETag",
+        },
+        status.HTTP_404_NOT_FOUND: {
+            "description": "Note not found",
+            "model": ErrorResponse,
+        },
+    },
+)
+async def get_note(
+    note_id: UUID,
+    current_user: Annotated[
+        User,
+        Depends(get_current_user),
+    ],
+    get_note: Annotated[
+        GetNoteUseCase,
+        Depends(get_get_note_use_case),
+    ],
+    response: Response,
+    if_none_match: Annotated[str | None, Header()] = None,
+) -> GetNoteOutput | Response:
+    note = await get_note(note_id, current_user.id)
+    tag = entity_tag(note.id, note.updated_at)
+    if not none_match(if_none_match, tag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers={"ETag": tag},
+        )
+
+    response.headers["ETag"] = tag
+    return note
+
+
+@notes_router.put(
+    "/{note_id}",
+    status_code=status.HTTP_200_OK,
+    response_model=UpdateNoteOutput,
+    summary="Update a note",
+    responses={
+        status.HTTP_200_OK: {
+            "description": "Note updated successfully",
+            "model": UpdateNoteOutput,
+        },
+        status.HTTP_404_NOT_FOUND: {
+            "description": "Note or category not found",
+            "model": ErrorResponse,
+        },
+        status.HTTP_412_PRECONDITION_FAILED: {
+            "description": "Note changed since the If-Match ETag",
+            "model": ErrorResponse,
+        },
+    },
+)
+async def put_note(
+    data: Annotated[
+        UpdateNoteInput,
+        Depends(get_update_note_input),
+    ],
+    update_note: Annotated[
+        UpdateNoteUseCase,
+        Depends(get_update_note_use_case),
+    ],
+    response: Response,
+) -> UpdateNoteOutput:
+    note = await update_note(data)
+    response.headers["ETag"] = entity_tag(note.id, note.updated_at)
+    return note
+
+
+@notes_router.delete(
+    "/{note_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="Delete a note",
+    responses={
+        status.HTTP_404_NOT_FOUND: {
+            "description": "Note not found",
+            "model": ErrorResponse,
+        },
+    },
+)
+async def delete_note(
+    note_id: UUID,
+    current_user: Annotated[
+        User,
+        Depends(get_current_user),
+    ],
+    delete_note: Annotated[
+        DeleteNoteUseCase,
+        Depends(get_delete_note_use_case),
+    ],
+) -> None:
+    await delete_note(note_id, current_user.id)
+
+
+@sync_router.get(
+    "/",
+    status_code=status.HTTP_200_OK,
+    response_model=SyncOutput,
+    summary="Get the notes and categories changed since a cursor",
+    description=(
+        "Without `cursor`, returns everything from the start. Pass the "
+        "`next_cursor` of a response to get the changes made after it, and "
+        "keep calling while `has_more` is true. Each page holds at most "
+        "`limit` notes, categories and deletions of each. Notes carry their "
+        "full `category_ids`, which replace the ones the client has. Changes "
+        "become visible a couple of seconds after they are made."
+    ),
+    responses={
+        status.HTTP_200_OK: {
+            "description": "A page of changes and the cursor to resume from",
+            "model": SyncOutput,
+        },
+        status.HTTP_400_BAD_REQUEST: {
+            "description": "Invalid cursor",
+            "model": ErrorResponse,
+        },
+    },
+)
+async def get_sync(
+    data: Annotated[
+        SyncInput,
+        Depends(get_sync_input),
+    ],
+    sync: Annotated[
+        SyncUseCase,
+        Depends(get_sync_use_case),
+    ],
+) -> SyncOutput:
+    return await sync(data)
+
+
+router = APIRouter()
+router.include_router(categories_router)
+router.include_router(notes_router)
+router.include_router(sync_router)
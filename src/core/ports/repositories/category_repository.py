@@ -2,7 +2,12 @@ from abc import ABC, abstractmethod
 from collections.abc import Awaitable
 from uuid import UUID
 
-from src.core.domain.entities import Category
+from src.core.domain.entities import (
+    Category,
+    CategoryChange,
+    CategorySuggestion,
+)
+from src.core.ports.repositories.change_key import ChangeKey
 
 
 class CategoryRepository(ABC):
@@ -13,6 +18,13 @@ class CategoryRepository(ABC):
     ) -> Awaitable[None]:
         raise NotImplementedError  # pragma: no cover
 
+    @abstractmethod
+    def create_if_not_exists(
+        self,
+        category: Category,
+    ) -> Awaitable[bool]:
+        raise NotImplementedError  # pragma: no cover
+
     @abstractmethod
     def update(
         self,
@@ -34,3 +46,31 @@ class CategoryRepository(ABC):
         user_id: UUID,
     ) -> Awaitable[bool]:
         raise NotImplementedError  # pragma: no cover
+
+    @abstractmethod
+    def filter_owned_ids(
+        self,
+        category_ids: list[UUID],
+        user_id: UUID,
+    ) -> Awaitable[list[UUID]]:
+        raise NotImplementedError  # pragma: no cover
+
+    @abstractmethod
+    def find_changes(
+        self,
+        user_id: UUID,
+        limit: int,
+        after: ChangeKey | None = None,
+    ) -> Awaitable[list[CategoryChange]]:
+        raise NotImplementedError  # pragma: no cover
+
+    @abstractmethod
+    def autocomplete(
+        self,
+        user_id: UUID,
+        term: str,
+        limit: int,
+        *,
+        substring: bool = False,
+    ) -> Awaitable[list[CategorySuggestion]]:
+        raise NotImplementedError  # pragma: no cover
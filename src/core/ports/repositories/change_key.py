@@ -0,0 +1,8 @@
+from uuid import UUID
+
+from pydantic import BaseModel
+
+
+class ChangeKey(BaseModel):
+    change_id: int
+    id: UUID
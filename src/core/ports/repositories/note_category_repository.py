@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 from collections.abc import Awaitable
+from uuid import UUID
 
 from src.core.domain.entities import NoteCategory
 
@@ -18,3 +19,17 @@ class NoteCategoryRepository(ABC):
         note_categories: list[NoteCategory],
     ) -> Awaitable[None]:
         raise NotImplementedError  # pragma: no cover
+
+    @abstractmethod
+    def copy_many(
+        self,
+        note_categories: list[NoteCategory],
+    ) -> Awaitable[None]:
+        raise NotImplementedError  # pragma: no cover
+
+    @abstractmethod
+    def delete_by_note_id(
+        self,
+        note_id: UUID,
+    ) -> Awaitable[None]:
+        raise NotImplementedError  # pragma: no cover
@@ -1,8 +1,28 @@
 from abc import ABC, abstractmethod
-from collections.abc import Awaitable
+from collections.abc import AsyncGenerator, Awaitable
+from datetime import datetime
 from uuid import UUID
 
-from src.core.domain.entities import Note
+from pydantic import BaseModel
+
+from src.core.domain.entities import (
+    Note,
+    NoteChange,
+    NoteSearchResult,
+    NoteSuggestion,
+    NoteWithCategories,
+)
+from src.core.ports.repositories.change_key import ChangeKey
+
+
+class NotePageKey(BaseModel):
+    updated_at: datetime
+    id: UUID
+
+
+class NoteSearchKey(BaseModel):
+    rank: float
+    id: UUID
 
 
 class NoteRepository(ABC):
@@ -13,6 +33,13 @@ class NoteRepository(ABC):
     ) -> Awaitable[None]:
         raise NotImplementedError  # pragma: no cover
 
+    @abstractmethod
+    def copy_many(
+        self,
+        notes: list[Note],
+    ) -> Awaitable[None]:
+        raise NotImplementedError  # pragma: no cover
+
     @abstractmethod
     def update(
         self,
@@ -26,3 +53,73 @@ class NoteRepository(ABC):
         note_id: UUID,
     ) -> Awaitable[None]:
         raise NotImplementedError  # pragma: no cover
+
+    @abstractmethod
+    def find_by_id(
+        self,
+        note_id: UUID,
+        user_id: UUID,
+    ) -> Awaitable[NoteWithCategories | None]:
+        raise NotImplementedError  # pragma: no cover
+
+    @abstractmethod
+    def update_owned(
+        self,
+        note: Note,
+        expected_updated_at: list[datetime] | None = None,
+    ) -> Awaitable[Note | None]:
+        raise NotImplementedError  # pragma: no cover
+
+    @abstractmethod
+    def delete_owned(
+        self,
+        note_id: UUID,
+        user_id: UUID,
+    ) -> Awaitable[bool]:
+        raise NotImplementedError  # pragma: no cover
+
+    @abstractmethod
+    def find_page(
+        self,
+        user_id: UUID,
+        limit: int,
+        after: NotePageKey | None = None,
+    ) -> Awaitable[list[NoteWithCategories]]:
+        raise NotImplementedError  # pragma: no cover
+
+    @abstractmethod
+    def find_changes(
+        self,
+        user_id: UUID,
+        limit: int,
+        after: ChangeKey | None = None,
+    ) -> Awaitable[list[NoteChange]]:
+        raise NotImplementedError  # pragma: no cover
+
+    @abstractmethod
+    def search(
+        self,
+        user_id: UUID,
+        query: str,
+        limit: int,
+        after: NoteSearchKey | None = None,
+    ) -> Awaitable[list[NoteSearchResult]]:
+        raise NotImplementedError  # pragma: no cover
+
+    @abstractmethod
+    def autocomplete(
+        self,
+        user_id: UUID,
+        term: str,
+        limit: int,
+        *,
+        substring: bool = False,
+    ) -> Awaitable[list[NoteSuggestion]]:
+        raise NotImplementedError  # pragma: no cover
+
+    @abstractmethod
+    def stream(
+        self,
+        user_id: UUID,
+    ) -> AsyncGenerator[NoteWithCategories, None]:
+        raise NotImplementedError  # pragma: no cover
@@ -0,0 +1,18 @@
+from abc import ABC, abstractmethod
+from collections.abc import Awaitable
+from uuid import UUID
+
+from src.core.domain.entities import Tombstone, TombstoneEntityEnum
+from src.core.ports.repositories.change_key import ChangeKey
+
+
+class TombstoneRepository(ABC):
+    @abstractmethod
+    def find_changes(
+        self,
+        user_id: UUID,
+        entity: TombstoneEntityEnum,
+        limit: int,
+        after: ChangeKey | None = None,
+    ) -> Awaitable[list[Tombstone]]:
+        raise NotImplementedError  # pragma: no cover
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 from collections.abc import Awaitable
+from contextlib import AbstractAsyncContextManager
 from types import TracebackType
 from typing import Self
 
@@ -8,12 +9,16 @@ from src.core.ports.repositories.note_category_repository import (
     NoteCategoryRepository,
 )
 from src.core.ports.repositories.note_repository import NoteRepository
+from src.core.ports.repositories.tombstone_repository import (
+    TombstoneRepository,
+)
 
 
 class UnitOfWork(ABC):
     note_repository: NoteRepository
     category_repository: CategoryRepository
     note_category_repository: NoteCategoryRepository
+    tombstone_repository: TombstoneRepository
 
     @abstractmethod
     async def __aenter__(self) -> Self:
@@ -34,3 +39,7 @@ class UnitOfWork(ABC):
     @abstractmethod
     def rollback(self) -> Awaitable[None]:
         raise NotImplementedError  # pragma: no cover
+
+    @abstractmethod
+    def pipeline(self) -> AbstractAsyncContextManager[None]:
+        raise NotImplementedError  # pragma: no cover
@@ -0,0 +1,21 @@
+from src.core.ports.unit_of_work import UnitOfWork
+from src.core.use_cases.inputs import AutocompleteInput
+from src.core.use_cases.outputs import AutocompleteCategoriesOutput
+
+
+class AutocompleteCategoriesUseCase:
+    def __init__(self, unit_of_work: UnitOfWork) -> None:
+        self._unit_of_work = unit_of_work
+
+    async def __call__(
+        self, data: AutocompleteInput
+    ) -> AutocompleteCategoriesOutput:
+        async with self._unit_of_work as uow, uow.pipeline():
+            items = await uow.category_repository.autocomplete(
+                data.user_id,
+                data.query,
+                data.limit,
+                substring=data.substring,
+            )
+
+        return AutocompleteCategoriesOutput(items=items)
@@ -14,17 +14,14 @@ class CreateCategoryUseCase:
     ) -> CreateCategoryOutput:
         category = data.to_category()
 
-        async with self._unit_of_work as uow:
-            category_exists = await uow.category_repository.exists(
-                category.name,
-                category.user_id,
+        async with self._unit_of_work as uow, uow.pipeline():
+            created = await uow.category_repository.create_if_not_exists(
+                category,
             )
 
-            if category_exists:
+            if not created:
                 raise CategoryAlreadyExistsError()
 
-            await uow.category_repository.create(category)
-
             await uow.commit()
 
         return CreateCategoryOutput.from_category(category)
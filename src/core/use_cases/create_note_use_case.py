@@ -0,0 +1,31 @@
+from src.core.ports.unit_of_work import UnitOfWork
+from src.core.use_cases.errors import CategoryNotFoundError
+from src.core.use_cases.inputs import CreateNoteInput
+from src.core.use_cases.outputs import CreateNoteOutput
+
+
+class CreateNoteUseCase:
+    def __init__(self, unit_of_work: UnitOfWork) -> None:
+        self._unit_of_work = unit_of_work
+
+    async def __call__(self, data: CreateNoteInput) -> CreateNoteOutput:
+        note = data.to_note()
+        note_categories = data.to_note_categories(note)
+        category_ids = [
+            note_category.category_id for note_category in note_categories
+        ]
+
+        async with self._unit_of_work as uow, uow.pipeline():
+            owned_ids = await uow.category_repository.filter_owned_ids(
+                category_ids,
+                note.user_id,
+            )
+
+            if len(owned_ids) != len(category_ids):
+                raise CategoryNotFoundError()
+
+            await uow.note_repository.create(note)
+            await uow.note_category_repository.create_many(note_categories)
+            await uow.commit()
+
+        return CreateNoteOutput.from_note(note, category_ids)
@@ -0,0 +1,18 @@
+from uuid import UUID
+
+from src.core.ports.unit_of_work import UnitOfWork
+from src.core.use_cases.errors import NoteNotFoundError
+
+
+class DeleteNoteUseCase:
+    def __init__(self, unit_of_work: UnitOfWork) -> None:
+        self._unit_of_work = unit_of_work
+
+    async def __call__(self, note_id: UUID, user_id: UUID) -> None:
+        async with self._unit_of_work as uow, uow.pipeline():
+            deleted = await uow.note_repository.delete_owned(note_id, user_id)
+
+            if not deleted:
+                raise NoteNotFoundError()
+
+            await uow.commit()
@@ -1,3 +1,23 @@
 class CategoryAlreadyExistsError(Exception):
     def __init__(self, msg: str = "Category already exists") -> None:
         super().__init__(msg)
+
+
+class CategoryNotFoundError(Exception):
+    def __init__(self, msg: str = "Category not found") -> None:
+        super().__init__(msg)
+
+
+class NoteNotFoundError(Exception):
+    def __init__(self, msg: str = "Note not found") -> None:
+        super().__init__(msg)
+
+
+class NoteChangedError(Exception):
+    def __init__(self, msg: str = "Note has changed") -> None:
+        super().__init__(msg)
+
+
+class InvalidCursorError(Exception):
+    def __init__(self, msg: str = "Invalid cursor") -> None:
+        super().__init__(msg)
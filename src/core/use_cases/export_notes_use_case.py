@@ -0,0 +1,23 @@
+from collections.abc import AsyncGenerator
+from contextlib import aclosing
+from uuid import UUID
+
+from src.core.ports.unit_of_work import UnitOfWork
+from src.core.use_cases.outputs import NoteOutput
+
+
+class ExportNotesUseCase:
+    def __init__(self, unit_of_work: UnitOfWork) -> None:
+        self._unit_of_work = unit_of_work
+
+    async def __call__(
+        self, user_id: UUID
+    ) -> AsyncGenerator[NoteOutput, None]:
+        # The stream is closed before the unit of work gives its connection
+        # back, so its server-side cursor never outlives the transaction.
+        async with (
+            self._unit_of_work as uow,
+            aclosing(uow.note_repository.stream(user_id)) as notes,
+        ):
+            async for note in notes:
+                yield NoteOutput.from_note(note, note.category_ids)
@@ -0,0 +1,19 @@
+from uuid import UUID
+
+from src.core.ports.unit_of_work import UnitOfWork
+from src.core.use_cases.errors import NoteNotFoundError
+from src.core.use_cases.outputs import GetNoteOutput
+
+
+class GetNoteUseCase:
+    def __init__(self, unit_of_work: UnitOfWork) -> None:
+        self._unit_of_work = unit_of_work
+
+    async def __call__(self, note_id: UUID, user_id: UUID) -> GetNoteOutput:
+        async with self._unit_of_work as uow, uow.pipeline():
+            note = await uow.note_repository.find_by_id(note_id, user_id)
+
+        if note is None:
+            raise NoteNotFoundError()
+
+        return GetNoteOutput.from_note(note, note.category_ids)
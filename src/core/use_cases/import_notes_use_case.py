@@ -0,0 +1,148 @@
+import logging
+from collections.abc import AsyncIterable
+from uuid import UUID
+
+from pydantic import ValidationError
+
+from src.common.adapters.errors import DatabaseError
+from src.core.ports.unit_of_work import UnitOfWork
+from src.core.use_cases.inputs import ImportNoteInput
+from src.core.use_cases.outputs import ImportNoteError, ImportNotesOutput
+
+logger = logging.getLogger(__name__)
+
+MAX_IMPORT_ERRORS = 100
+
+
+class ImportNotesUseCase:
+    def __init__(
+        self,
+        unit_of_work: UnitOfWork,
+        *,
+        chunk_size: int,
+        max_errors: int = MAX_IMPORT_ERRORS,
+    ) -> None:
+        self._unit_of_work = unit_of_work
+        self._chunk_size = chunk_size
+        self._max_errors = max_errors
+
+    async def __call__(
+        self,
+        user_id: UUID,
+        lines: AsyncIterable[bytes],
+    ) -> ImportNotesOutput:
+        output = ImportNotesOutput()
+        chunk: list[tuple[int, ImportNoteInput]] = []
+        line_number = 0
+
+        async for line in lines:
+            line_number += 1
+            if not line.strip():
+                continue
+
+            try:
+                data = ImportNoteInput.model_validate_json(line)
+            except ValidationError as error:
+                self._fail(output, line_number, self._message(error))
+                continue
+
+            chunk.append((line_number, data))
+            if len(chunk) == self._chunk_size:
+                await self._load(user_id, chunk, output)
+                chunk = []
+
+        if chunk:
+            await self._load(user_id, chunk, output)
+
+        return output
+
+    async def _load(
+        self,
+        user_id: UUID,
+        chunk: list[tuple[int, ImportNoteInput]],
+        output: ImportNotesOutput,
+    ) -> None:
+        category_ids = list(
+            dict.fromkeys(
+                category_id
+                for _, data in chunk
+                for category_id in data.category_ids
+            )
+        )
+
+        # Each chunk commits on its own, so a failure only loses the chunk
+        # being loaded and the connection is not held between chunks.
+        accepted = chunk
+        try:
+            async with self._unit_of_work as uow:
+                owned_ids = set(
+                    await uow.category_repository.filter_owned_ids(
+                        category_ids,
+                        user_id,
+                    ),
+                )
+
+                for line_number, data in chunk:
+                    if not owned_ids.issuperset(data.category_ids):
+                        self._fail(output, line_number, "Category not found")
+
+                accepted = [
+                    (line_number, data)
+                    for line_number, data in chunk
+                    if owned_ids.issuperset(data.category_ids)
+                ]
+
+                notes = [data.to_note(user_id) for _, data in accepted]
+                notes_categories = [
+                    note_category
+                    for note, (_, data) in zip(notes, accepted, strict=True)
+                    for note_category in data.to_note_categories(note)
+                ]
+
+                await uow.note_repository.copy_many(notes)
+                await uow.note_category_repository.copy_many(
+                    notes_categories,
+                )
+                await uow.commit()
+        except DatabaseError:
+            # Earlier chunks are already committed: report this one as
+            # failed and keep going, so the summary matches the database.
+            logger.exception(
+                "Notes chunk failed to import",
+                extra={"user_id": str(user_id)},
+            )
+            for line_number, _ in accepted:
+                self._fail(output, line_number, "Failed to save")
+            return
+
+        output.imported += len(notes)
+        logger.info(
+            "Notes imported",
+            extra={
+                "user_id": str(user_id),
+                "imported": output.imported,
+                "failed": output.failed,
+            },
+        )
+
+    def _fail(
+        self,
+        output: ImportNotesOutput,
+        line_number: int,
+        message: str,
+    ) -> None:
+        output.failed += 1
+        if len(output.errors) < self._max_errors:
+            output.errors.append(
+                ImportNoteError(line=line_number, message=message),
+            )
+
+    @staticmethod
+    def _message(error: ValidationError) -> str:
+        messages = []
+        for details in error.errors(include_url=False):
+            loc = ".".join(str(part) for part in details["loc"])
+            messages.append(
+                f"{loc}: {details['msg']}" if loc else details["msg"]
+            )
+        return "; ".join(messages)
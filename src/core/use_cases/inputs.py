@@ -1,8 +1,11 @@
+from datetime import datetime
+from enum import Enum
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import AwareDatetime, BaseModel, Field
 
-from src.core.domain.entities import Category
+from src.common.datetime import Datetime
+from src.core.domain.entities import Category, Note, NoteCategory
 
 
 class CreateCategoryInputBase(BaseModel):
@@ -21,3 +24,116 @@ class CreateCategoryInput(CreateCategoryInputBase):
             user_id=self.user_id,
             name=self.name,
         )
+
+
+class CreateNoteInputBase(BaseModel):
+    title: str = Field(
+        strict=True,
+        min_length=1,
+        max_length=255,
+    )
+    content: str = Field(
+        strict=True,
+        min_length=1,
+    )
+    category_ids: list[UUID] = Field(
+        default_factory=list,
+        max_length=100,
+    )
+
+    def to_note_categories(self, note: Note) -> list[NoteCategory]:
+        return [
+            NoteCategory(
+                note_id=note.id,
+                category_id=category_id,
+                updated_at=note.updated_at,
+                created_at=note.updated_at,
+            )
+            for category_id in dict.fromkeys(self.category_ids)
+        ]
+
+
+class CreateNoteInput(CreateNoteInputBase):
+    user_id: UUID = Field(strict=True)
+
+    def to_note(self) -> Note:
+        return Note(
+            user_id=self.user_id,
+            title=self.title,
+            content=self.content,
+        )
+
+
+class ImportNoteInput(CreateNoteInputBase):
+    created_at: AwareDatetime | None = None
+    updated_at: AwareDatetime | None = None
+
+    def to_note(self, user_id: UUID) -> Note:
+        now = Datetime.now()
+        return Note(
+            user_id=user_id,
+            title=self.title,
+            content=self.content,
+            created_at=self.created_at or self.updated_at or now,
+            updated_at=self.updated_at or now,
+        )
+
+
+class UpdateNoteInputBase(CreateNoteInputBase): ...
+
+
+class UpdateNoteInput(UpdateNoteInputBase):
+    id: UUID = Field(strict=True)
+    user_id: UUID = Field(strict=True)
+    expected_updated_at: list[datetime] | None = None
+
+    def to_note(self) -> Note:
+        return Note(
+            id=self.id,
+            user_id=self.user_id,
+            title=self.title,
+            content=self.content,
+            updated_at=Datetime.now(),
+        )
+
+
+class ListNotesInput(BaseModel):
+    user_id: UUID = Field(strict=True)
+    limit: int = Field(default=20, ge=1, le=100)
+    cursor: str | None = None
+
+
+class SearchNotesInput(BaseModel):
+    user_id: UUID = Field(strict=True)
+    query: str = Field(strict=True, min_length=1, max_length=256)
+    limit: int = Field(default=20, ge=1, le=100)
+    cursor: str | None = None
+
+
+class SyncInput(BaseModel):
+    user_id: UUID = Field(strict=True)
+    limit: int = Field(default=100, ge=1, le=500)
+    cursor: str | None = None
+
+
+TRIGRAM_SIZE = 3
+
+
+class AutocompleteModeEnum(str, Enum):
+    prefix = "prefix"
+    substring = "substring"
+
+
+class AutocompleteInput(BaseModel):
+    user_id: UUID = Field(strict=True)
+    query: str = Field(strict=True, min_length=1, max_length=100)
+    limit: int = Field(default=10, ge=1, le=20)
+    mode: AutocompleteModeEnum = AutocompleteModeEnum.prefix
+
+    @property
+    def substring(self) -> bool:
+        # Shorter terms have no trigram to look up, so they match as prefixes.
+        return (
+            self.mode == AutocompleteModeEnum.substring
+            and len(self.query) >= TRIGRAM_SIZE
+        )
@@ -0,0 +1,44 @@
+from src.common.cursor import decode_cursor, encode_cursor
+from src.core.ports.repositories.note_repository import NotePageKey
+from src.core.ports.unit_of_work import UnitOfWork
+from src.core.use_cases.errors import InvalidCursorError
+from src.core.use_cases.inputs import ListNotesInput
+from src.core.use_cases.outputs import ListNotesOutput, NoteOutput
+
+
+class ListNotesUseCase:
+    def __init__(self, unit_of_work: UnitOfWork) -> None:
+        self._unit_of_work = unit_of_work
+
+    async def __call__(self, data: ListNotesInput) -> ListNotesOutput:
+        try:
+            after = (
+                decode_cursor(NotePageKey, data.cursor)
+                if data.cursor is not None
+                else None
+            )
+        except ValueError as error:
+            raise InvalidCursorError() from error
+
+        async with self._unit_of_work as uow, uow.pipeline():
+            notes = await uow.note_repository.find_page(
+                data.user_id,
+                data.limit + 1,
+                after,
+            )
+
+        page = notes[: data.limit]
+        next_cursor = (
+            encode_cursor(
+                NotePageKey(updated_at=page[-1].updated_at, id=page[-1].id),
+            )
+            if len(notes) > data.limit
+            else None
+        )
+
+        return ListNotesOutput(
+            items=[
+                NoteOutput.from_note(note, note.category_ids) for note in page
+            ],
+            next_cursor=next_cursor,
+        )
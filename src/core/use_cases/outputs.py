@@ -1,15 +1,83 @@
 from typing import Self
 from uuid import UUID
 
-from pydantic import Field
+from pydantic import BaseModel, Field
 from pydantic.json_schema import SkipJsonSchema
 
-from src.core.domain.entities import Category
+from src.core.domain.entities import (
+    Category,
+    CategorySuggestion,
+    Note,
+    NoteSearchResult,
+    NoteSuggestion,
+    NoteWithCategories,
+)
 
 
-class CreateCategoryOutput(Category):
+class CategoryOutput(Category):
     user_id: SkipJsonSchema[UUID] = Field(exclude=True)
 
     @classmethod
     def from_category(cls, category: Category) -> Self:
         return cls(**category.model_dump())
+
+
+class CreateCategoryOutput(CategoryOutput): ...
+
+
+class NoteOutput(NoteWithCategories):
+    user_id: SkipJsonSchema[UUID] = Field(exclude=True)
+
+    @classmethod
+    def from_note(cls, note: Note, category_ids: list[UUID]) -> Self:
+        return cls(
+            **note.model_dump(exclude={"category_ids"}),
+            category_ids=category_ids,
+        )
+
+
+class CreateNoteOutput(NoteOutput): ...
+
+
+class GetNoteOutput(NoteOutput): ...
+
+
+class UpdateNoteOutput(NoteOutput): ...
+
+
+class ImportNoteError(BaseModel):
+    line: int
+    message: str
+
+
+class ImportNotesOutput(BaseModel):
+    imported: int = 0
+    failed: int = 0
+    errors: list[ImportNoteError] = Field(default_factory=list)
+
+
+class ListNotesOutput(BaseModel):
+    items: list[NoteOutput]
+    next_cursor: str | None
+
+
+class SearchNotesOutput(BaseModel):
+    items: list[NoteSearchResult]
+    next_cursor: str | None
+
+
+class AutocompleteNotesOutput(BaseModel):
+    items: list[NoteSuggestion]
+
+
+class AutocompleteCategoriesOutput(BaseModel):
+    items: list[CategorySuggestion]
+
+
+class SyncOutput(BaseModel):
+    notes: list[NoteOutput]
+    categories: list[CategoryOutput]
+    deleted_note_ids: list[UUID]
+    deleted_category_ids: list[UUID]
+    next_cursor: str
+    has_more: bool
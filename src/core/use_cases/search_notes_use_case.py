@@ -0,0 +1,38 @@
+from src.common.cursor import decode_cursor, encode_cursor
+from src.core.ports.repositories.note_repository import NoteSearchKey
+from src.core.ports.unit_of_work import UnitOfWork
+from src.core.use_cases.errors import InvalidCursorError
+from src.core.use_cases.inputs import SearchNotesInput
+from src.core.use_cases.outputs import SearchNotesOutput
+
+
+class SearchNotesUseCase:
+    def __init__(self, unit_of_work: UnitOfWork) -> None:
+        self._unit_of_work = unit_of_work
+
+    async def __call__(self, data: SearchNotesInput) -> SearchNotesOutput:
+        try:
+            after = (
+                decode_cursor(NoteSearchKey, data.cursor)
+                if data.cursor is not None
+                else None
+            )
+        except ValueError as error:
+            raise InvalidCursorError() from error
+
+        async with self._unit_of_work as uow, uow.pipeline():
+            results = await uow.note_repository.search(
+                data.user_id,
+                data.query,
+                data.limit + 1,
+                after,
+            )
+
+        page = results[: data.limit]
+        next_cursor = (
+            encode_cursor(NoteSearchKey(rank=page[-1].rank, id=page[-1].id))
+            if len(results) > data.limit
+            else None
+        )
+
+        return SearchNotesOutput(items=page, next_cursor=next_cursor)
@@ -0,0 +1,119 @@
+from pydantic import BaseModel
+
+from src.common.cursor import decode_cursor, encode_cursor
+from src.core.domain.entities import TombstoneEntityEnum
+from src.core.ports.repositories.change_key import ChangeKey
+from src.core.ports.unit_of_work import UnitOfWork
+from src.core.use_cases.errors import InvalidCursorError
+from src.core.use_cases.inputs import SyncInput
+from src.core.use_cases.outputs import CategoryOutput, NoteOutput, SyncOutput
+
+
+class SyncCursor(BaseModel):
+    notes: ChangeKey | None = None
+    categories: ChangeKey | None = None
+    deleted_notes: ChangeKey | None = None
+    deleted_categories: ChangeKey | None = None
+
+
+class SyncUseCase:
+    def __init__(self, unit_of_work: UnitOfWork) -> None:
+        self._unit_of_work = unit_of_work
+
+    async def __call__(self, data: SyncInput) -> SyncOutput:
+        try:
+            after = (
+                decode_cursor(SyncCursor, data.cursor)
+                if data.cursor is not None
+                else SyncCursor()
+            )
+        except ValueError as error:
+            raise InvalidCursorError() from error
+
+        limit = data.limit + 1
+
+        async with self._unit_of_work as uow, uow.pipeline():
+            notes = await uow.note_repository.find_changes(
+                data.user_id,
+                limit,
+                after.notes,
+            )
+            categories = await uow.category_repository.find_changes(
+                data.user_id,
+                limit,
+                after.categories,
+            )
+            deleted_notes = await uow.tombstone_repository.find_changes(
+                data.user_id,
+                TombstoneEntityEnum.notes,
+                limit,
+                after.deleted_notes,
+            )
+            deleted_categories = await uow.tombstone_repository.find_changes(
+                data.user_id,
+                TombstoneEntityEnum.categories,
+                limit,
+                after.deleted_categories,
+            )
+
+        has_more = (
+            max(
+                len(notes),
+                len(categories),
+                len(deleted_notes),
+                len(deleted_categories),
+            )
+            > data.limit
+        )
+        notes = notes[: data.limit]
+        categories = categories[: data.limit]
+        deleted_notes = deleted_notes[: data.limit]
+        deleted_categories = deleted_categories[: data.limit]
+
+        next_cursor = SyncCursor(
+            notes=(
+                ChangeKey(change_id=notes[-1].change_id, id=notes[-1].id)
+                if notes
+                else after.notes
+            ),
+            categories=(
+                ChangeKey(
+                    change_id=categories[-1].change_id,
+                    id=categories[-1].id,
+                )
+                if categories
+                else after.categories
+            ),
+            deleted_notes=(
+                ChangeKey(
+                    change_id=deleted_notes[-1].change_id,
+                    id=deleted_notes[-1].id,
+                )
+                if deleted_notes
+                else after.deleted_notes
+            ),
+            deleted_categories=(
+                ChangeKey(
+                    change_id=deleted_categories[-1].change_id,
+                    id=deleted_categories[-1].id,
+                )
+                if deleted_categories
+                else after.deleted_categories
+            ),
+        )
+
+        return SyncOutput(
+            notes=[
+                NoteOutput.from_note(note, note.category_ids) for note in notes
+            ],
+            categories=[
+                CategoryOutput.from_category(category)
+                for category in categories
+            ],
+            deleted_note_ids=[tombstone.id for tombstone in deleted_notes],
+            deleted_category_ids=[
+                tombstone.id for tombstone in deleted_categories
+            ],
+            next_cursor=encode_cursor(next_cursor),
+            has_more=has_more,
+        )
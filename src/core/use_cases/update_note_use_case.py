@@ -0,0 +1,55 @@
+from src.core.ports.unit_of_work import UnitOfWork
+from src.core.use_cases.errors import (
+    CategoryNotFoundError,
+    NoteChangedError,
+    NoteNotFoundError,
+)
+from src.core.use_cases.inputs import UpdateNoteInput
+from src.core.use_cases.outputs import UpdateNoteOutput
+
+
+class UpdateNoteUseCase:
+    def __init__(self, unit_of_work: UnitOfWork) -> None:
+        self._unit_of_work = unit_of_work
+
+    async def __call__(self, data: UpdateNoteInput) -> UpdateNoteOutput:
+        note = data.to_note()
+        note_categories = data.to_note_categories(note)
+        category_ids = [
+            note_category.category_id for note_category in note_categories
+        ]
+
+        async with self._unit_of_work as uow, uow.pipeline():
+            owned_ids = await uow.category_repository.filter_owned_ids(
+                category_ids,
+                note.user_id,
+            )
+
+            if len(owned_ids) != len(category_ids):
+                raise CategoryNotFoundError()
+
+            updated_note = await uow.note_repository.update_owned(
+                note,
+                data.expected_updated_at,
+            )
+
+            if updated_note is None:
+                if data.expected_updated_at is None:
+                    raise NoteNotFoundError()
+
+                # The update was conditional: tell a stale version apart
+                # from a missing note.
+                current = await uow.note_repository.find_by_id(
+                    note.id,
+                    note.user_id,
+                )
+                if current is None:
+                    raise NoteNotFoundError()
+
+                raise NoteChangedError()
+
+            await uow.note_category_repository.delete_by_note_id(note.id)
+            await uow.note_category_repository.create_many(note_categories)
+            await uow.commit()
+
+        return UpdateNoteOutput.from_note(updated_note, category_ids)
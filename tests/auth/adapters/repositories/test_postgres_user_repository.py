@@ -1,3 +1,4 @@
+from datetime import timedelta
 from typing import cast
 from uuid import UUID, uuid4
 
@@ -9,11 +10,14 @@ from psycopg_pool import AsyncConnectionPool
 
 from tests.auth.builders.domain.entities.user_builder import UserBuilder
 from tests.auth.helpers.auth_database_client import AuthDatabaseClient
+from tests.helpers.database_test import DatabaseTest
 
 from src.auth.adapters.repositories.postgres.postgres_user_repository import (
     PostgresUserRepository,
 )
+from src.auth.ports.repositories.user_repository import UserChanges
 from src.common.adapters.errors import DatabaseError
+from src.common.lru_cache import LruCache
 
 
 @pytest.mark.anyio(scope="class")
@@ -64,6 +68,56 @@ class TestPostgresUserRepository:
         unique_violation = "23505"
         assert error.error.diag.sqlstate == unique_violation
 
+    @pytest.mark.it("Should create an user if email is free (return true)")
+    async def test_create_if_not_exists(
+        self,
+        pool: AsyncConnectionPool[AsyncConnection[DictRow]],
+    ) -> None:
+        # given
+        client = AuthDatabaseClient(pool)
+        sut = PostgresUserRepository(pool)
+
+        # and
+        user = UserBuilder().build()
+
+        # when
+        created = await sut.create_if_not_exists(user)
+
+        # then
+        assert created
+
+        # and
+        user_from_db = await client.select_user(user.id)
+        assert user == user_from_db
+
+    @pytest.mark.it(
+        "Should NOT create an user if email is in use (return false)"
+    )
+    async def test_create_if_not_exists_email_in_use(
+        self,
+        pool: AsyncConnectionPool[AsyncConnection[DictRow]],
+    ) -> None:
+        # given
+        client = AuthDatabaseClient(pool)
+        sut = PostgresUserRepository(pool)
+
+        # and
+        existing_user = UserBuilder().build()
+        await client.create_user(existing_user)
+
+        # and
+        user = UserBuilder().with_email(existing_user.email).build()
+
+        # when
+        created = await sut.create_if_not_exists(user)
+
+        # then
+        assert not created
+
+        # and
+        user_from_db = await client.select_user(user.id)
+        assert user_from_db is None
+
     @pytest.mark.it("Should find an user by email (return user)")
     async def test_find_by_email(
         self,
@@ -237,3 +291,292 @@ class TestPostgresUserRepository:
         # and
         unique_violation = "23505"
         assert error.error.diag.sqlstate == unique_violation
+
+    @pytest.mark.it("Should update only the changed fields (return user)")
+    async def test_update_changes(
+        self,
+        faker: Faker,
+        pool: AsyncConnectionPool[AsyncConnection[DictRow]],
+    ) -> None:
+        # given
+        client = AuthDatabaseClient(pool)
+        sut = PostgresUserRepository(pool)
+
+        # and
+        user = UserBuilder().build()
+        await client.create_user(user)
+
+        # and
+        changes = UserChanges(first_name=faker.first_name())
+
+        # when
+        updated_user = await sut.update_changes(user.id, changes)
+
+        # then
+        expected_user = user.model_copy(
+            update={
+                "first_name": changes.first_name,
+                "updated_at": max(
+                    changes.updated_at,
+                    user.updated_at + timedelta(microseconds=1),
+                ),
+            }
+        )
+        assert updated_user == expected_user
+
+        # and
+        user_from_db = await client.select_user(user.id)
+        assert user_from_db == expected_user
+
+    @pytest.mark.it(
+        "Should update the changed fields if the user is still at an "
+        "expected version"
+    )
+    async def test_update_changes_expected_version(
+        self,
+        faker: Faker,
+        pool: AsyncConnectionPool[AsyncConnection[DictRow]],
+    ) -> None:
+        # given
+        client = AuthDatabaseClient(pool)
+        sut = PostgresUserRepository(pool)
+
+        # and
+        user = UserBuilder().build()
+        await client.create_user(user)
+
+        # and
+        changes = UserChanges(first_name=faker.first_name())
+
+        # when
+        updated_user = await sut.update_changes(
+            user.id,
+            changes,
+            [user.updated_at - timedelta(seconds=1), user.updated_at],
+        )
+
+        # then
+        assert updated_user is not None
+        assert updated_user.first_name == changes.first_name
+        assert updated_user.updated_at > user.updated_at
+
+    @pytest.mark.it(
+        "Should NOT update the changed fields if the user is not at an "
+        "expected version (return none)"
+    )
+    async def test_update_changes_unexpected_version(
+        self,
+        faker: Faker,
+        pool: AsyncConnectionPool[AsyncConnection[DictRow]],
+    ) -> None:
+        # given
+        client = AuthDatabaseClient(pool)
+        sut = PostgresUserRepository(pool)
+
+        # and
+        user = UserBuilder().build()
+        await client.create_user(user)
+
+        # and
+        changes = UserChanges(first_name=faker.first_name())
+
+        # when
+        updated_user = await sut.update_changes(
+            user.id,
+            changes,
+            [user.updated_at - timedelta(seconds=1)],
+        )
+
+        # then
+        assert updated_user is None
+
+        # and
+        user_from_db = await client.select_user(user.id)
+        assert user_from_db == user
+
+    @pytest.mark.it(
+        "Should NOT update the changed fields if email is in use (return none)"
+    )
+    async def test_update_changes_email_in_use(
+        self,
+        faker: Faker,
+        pool: AsyncConnectionPool[AsyncConnection[DictRow]],
+    ) -> None:
+        # given
+        client = AuthDatabaseClient(pool)
+        sut = PostgresUserRepository(pool)
+
+        # and
+        user = UserBuilder().build()
+        await client.create_user(user)
+
+        # and
+        another_user = UserBuilder().build()
+        await client.create_user(another_user)
+
+        # and
+        changes = UserChanges(
+            email=another_user.email,
+            first_name=faker.first_name(),
+        )
+
+        # when
+        updated_user = await sut.update_changes(user.id, changes)
+
+        # then
+        assert updated_user is None
+
+        # and
+        user_from_db = await client.select_user(user.id)
+        assert user_from_db == user
+
+    @pytest.mark.it("Should update an user password (return none)")
+    async def test_update_password(
+        self,
+        faker: Faker,
+        pool: AsyncConnectionPool[AsyncConnection[DictRow]],
+    ) -> None:
+        # given
+        client = AuthDatabaseClient(pool)
+        sut = PostgresUserRepository(pool)
+
+        # and
+        user = UserBuilder().build()
+        await client.create_user(user)
+
+        # and
+        new_password = faker.password()
+
+        # when
+        await sut.update_password(user.id, user.password, new_password)
+
+        # then
+        user_from_db = await client.select_user(user.id)
+        assert user_from_db is not None
+        assert user_from_db.password == new_password
+
+        # and
+        assert user_from_db.updated_at == user.updated_at
+
+    @pytest.mark.it(
+        "Should NOT update an user password if it changed (return none)"
+    )
+    async def test_update_password_changed(
+        self,
+        faker: Faker,
+        pool: AsyncConnectionPool[AsyncConnection[DictRow]],
+    ) -> None:
+        # given
+        client = AuthDatabaseClient(pool)
+        sut = PostgresUserRepository(pool)
+
+        # and
+        user = UserBuilder().build()
+        await client.create_user(user)
+
+        # when
+        await sut.update_password(user.id, faker.password(), faker.password())
+
+        # then
+        user_from_db = await client.select_user(user.id)
+        assert user_from_db is not None
+        assert user_from_db.password == user.password
+
+    @pytest.mark.it("Should read from the replica pool")
+    async def test_read_from_replica(
+        self,
+        pool: AsyncConnectionPool[AsyncConnection[DictRow]],
+    ) -> None:
+        async with DatabaseTest() as replica_pool:
+            # given
+            client = AuthDatabaseClient(pool)
+            sut = PostgresUserRepository(
+                pool,
+                replica_pool,
+                LruCache(10, ttl=60),
+            )
+
+            # and
+            user = UserBuilder().build()
+            await client.create_user(user)
+
+            # when
+            user_by_id = await sut.find_by_id(user.id)
+
+            # then
+            assert user_by_id is None
+
+    @pytest.mark.it("Should read credentials from the primary pool")
+    async def test_read_credentials_from_primary(
+        self,
+        pool: AsyncConnectionPool[AsyncConnection[DictRow]],
+    ) -> None:
+        async with DatabaseTest() as replica_pool:
+            # given
+            client = AuthDatabaseClient(pool)
+            sut = PostgresUserRepository(
+                pool,
+                replica_pool,
+                LruCache(10, ttl=60),
+            )
+
+            # and
+            user = UserBuilder().build()
+            await client.create_user(user)
+
+            # when
+            user_by_email = await sut.find_by_email(user.email)
+
+            # then
+            assert user_by_email == user
+
+    @pytest.mark.it("Should read from the primary pool without a replica")
+    async def test_read_from_primary(
+        self,
+        pool: AsyncConnectionPool[AsyncConnection[DictRow]],
+    ) -> None:
+        # given
+        client = AuthDatabaseClient(pool)
+        sut = PostgresUserRepository(pool, recent_writes=LruCache(10, ttl=60))
+
+        # and
+        user = UserBuilder().build()
+        await client.create_user(user)
+
+        # when
+        user_by_id = await sut.find_by_id(user.id)
+
+        # then
+        assert user_by_id == user
+
+    @pytest.mark.it("Should read its own writes from the primary pool")
+    async def test_read_your_writes(
+        self,
+        faker: Faker,
+        pool: AsyncConnectionPool[AsyncConnection[DictRow]],
+    ) -> None:
+        async with DatabaseTest() as replica_pool:
+            # given
+            sut = PostgresUserRepository(
+                pool,
+                replica_pool,
+                LruCache(10, ttl=60),
+            )
+
+            # and
+            user = UserBuilder().build()
+            await sut.create(user)
+
+            # and
+            email = faker.email()
+            changes = UserChanges(email=email)
+            updated_user = await sut.update_changes(user.id, changes)
+
+            # when
+            user_by_id = await sut.find_by_id(user.id)
+            user_by_email = await sut.find_by_email(email)
+
+            # then
+            assert updated_user is not None
+            assert user_by_id == updated_user
+            assert user_by_email == updated_user
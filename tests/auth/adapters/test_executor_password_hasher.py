@@ -0,0 +1,118 @@
+import asyncio
+import threading
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+import pytest
+from faker import Faker
+
+from src.auth.adapters.errors import PasswordHasherBusyError
+from src.auth.adapters.executor_password_hasher import ExecutorPasswordHasher
+from src.auth.ports.password_hasher import PasswordHasher
+
+
+@pytest.mark.anyio(scope="class")
+@pytest.mark.describe(ExecutorPasswordHasher.__name__)
+class TestExecutorPasswordHasher:
+    @pytest.fixture()
+    def password_hasher(self, faker: Faker) -> MagicMock:
+        password_hasher = MagicMock(spec=PasswordHasher)
+        password_hasher.verify.return_value = True
+        password_hasher.hash.return_value = str(faker.sha256())
+        password_hasher.needs_rehash.return_value = True
+        return password_hasher
+
+    @pytest.fixture()
+    def executor(self) -> Iterator[ThreadPoolExecutor]:
+        executor = ThreadPoolExecutor(max_workers=2)
+        yield executor
+        executor.shutdown(wait=True)
+
+    @pytest.mark.it("Should verify password in the executor")
+    async def test_verify(
+        self,
+        faker: Faker,
+        password_hasher: MagicMock,
+        executor: ThreadPoolExecutor,
+    ) -> None:
+        # given
+        password = faker.password()
+        hash_ = str(faker.sha256())
+        sut = ExecutorPasswordHasher(password_hasher, executor, max_pending=1)
+
+        # when
+        result = await sut.verify(hash_, password)
+
+        # then
+        assert result
+        password_hasher.verify.assert_called_once_with(hash_, password)
+
+    @pytest.mark.it("Should hash password in the executor")
+    async def test_hash(
+        self,
+        faker: Faker,
+        password_hasher: MagicMock,
+        executor: ThreadPoolExecutor,
+    ) -> None:
+        # given
+        password = faker.password()
+        sut = ExecutorPasswordHasher(password_hasher, executor, max_pending=1)
+
+        # when
+        result = await sut.hash(password)
+
+        # then
+        assert result == password_hasher.hash.return_value
+        password_hasher.hash.assert_called_once_with(password)
+
+    @pytest.mark.it("Should check if needs rehash")
+    async def test_needs_rehash(
+        self,
+        faker: Faker,
+        password_hasher: MagicMock,
+        executor: ThreadPoolExecutor,
+    ) -> None:
+        # given
+        hash_ = str(faker.sha256())
+        sut = ExecutorPasswordHasher(password_hasher, executor, max_pending=1)
+
+        # when
+        result = await sut.needs_rehash(hash_)
+
+        # then
+        assert result
+        password_hasher.needs_rehash.assert_called_once_with(hash_)
+
+    @pytest.mark.it("Should reject work when the queue is full")
+    async def test_busy(
+        self,
+        faker: Faker,
+        password_hasher: MagicMock,
+        executor: ThreadPoolExecutor,
+    ) -> None:
+        # given
+        release = threading.Event()
+        password_hasher.hash.side_effect = lambda _: release.wait() and "hash"
+        sut = ExecutorPasswordHasher(password_hasher, executor, max_pending=1)
+
+        # and
+        pending = asyncio.create_task(sut.hash(faker.password()))
+        await asyncio.sleep(0)
+
+        # when/then
+        with pytest.raises(PasswordHasherBusyError):
+            await sut.hash(faker.password())
+
+        # and
+        release.set()
+        assert await pending == "hash"
+
+        # and
+        stats = sut.stats()
+        assert stats.pending == 0
+        assert stats.peak_pending == 1
+        assert stats.max_pending == 1
+        assert stats.completed == 1
+        assert stats.rejected == 1
+        assert stats.total_seconds > 0
@@ -0,0 +1,50 @@
+from uuid import UUID
+
+import pytest
+
+from tests.auth.builders.domain.entities.user_builder import UserBuilder
+
+from src.auth.adapters.lru_user_cache import LruUserCache
+from src.auth.domain.entities import User
+from src.common.lru_cache import LruCache
+
+
+@pytest.mark.describe(LruUserCache.__name__)
+class TestLruUserCache:
+    @pytest.mark.it("Should return a cached user")
+    def test_get(self) -> None:
+        # given
+        sut = LruUserCache(LruCache[UUID, User](8))
+        user = UserBuilder().build()
+        sut.set(user)
+
+        # when
+        result = sut.get(user.id)
+
+        # then
+        assert result == user
+
+    @pytest.mark.it("Should return none for an unknown user")
+    def test_get_none(self) -> None:
+        # given
+        sut = LruUserCache(LruCache[UUID, User](8))
+        user = UserBuilder().build()
+
+        # when
+        result = sut.get(user.id)
+
+        # then
+        assert result is None
+
+    @pytest.mark.it("Should not return an invalidated user")
+    def test_invalidate(self) -> None:
+        # given
+        sut = LruUserCache(LruCache[UUID, User](8))
+        user = UserBuilder().build()
+        sut.set(user)
+
+        # when
+        sut.invalidate(user.id)
+
+        # then
+        assert sut.get(user.id) is None
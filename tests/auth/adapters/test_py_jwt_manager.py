@@ -1,4 +1,6 @@
+import hashlib
 import secrets
+from datetime import UTC, datetime, timedelta
 
 import jwt
 import pytest
@@ -7,6 +9,8 @@ from faker import Faker
 from tests.auth.builders.ports.token_payload_builder import TokenPayloadBuilder
 
 from src.auth.adapters.py_jwt_manager import PyJwtManager
+from src.auth.ports.jwt_manager import TokenPayload
+from src.common.lru_cache import LruCache
 
 
 @pytest.mark.describe(PyJwtManager.__name__)
@@ -110,3 +114,69 @@ class TestPyJwtManager:
 
         # then
         assert payload is None
+
+    @pytest.mark.it("Should decode JWT from cache on repeated calls")
+    def test_decode_cached(self) -> None:
+        # given
+        payload = TokenPayloadBuilder().build()
+        token = jwt.encode(
+            payload.model_dump(exclude_none=True),
+            key=self._secret_key,
+            algorithm=self._algorithm,
+        )
+        cache = LruCache[bytes, TokenPayload](8)
+        sut = PyJwtManager(self._secret_key, self._algorithm, cache=cache)
+
+        # when
+        first_payload = sut.decode(token)
+        second_payload = sut.decode(token)
+
+        # then
+        assert first_payload == payload
+        assert second_payload is first_payload
+
+        # and
+        info = cache.info()
+        assert info.misses == 1
+        assert info.hits == 1
+        assert info.size == 1
+
+    @pytest.mark.it("Should not cache invalid JWT")
+    def test_decode_invalid_not_cached(self) -> None:
+        # given
+        token = jwt.encode(
+            TokenPayloadBuilder().build().model_dump(exclude_none=True),
+            key=secrets.token_hex(64),
+            algorithm=self._algorithm,
+        )
+        cache = LruCache[bytes, TokenPayload](8)
+        sut = PyJwtManager(self._secret_key, self._algorithm, cache=cache)
+
+        # when
+        payload = sut.decode(token)
+
+        # then
+        assert payload is None
+        assert cache.info().size == 0
+
+    @pytest.mark.it("Should not return a cached JWT after it expires")
+    def test_decode_cached_expired(self) -> None:
+        # given
+        now = datetime.now(UTC)
+        token = secrets.token_hex(32)
+        expired_payload = (
+            TokenPayloadBuilder()
+            .with_nbf(now - timedelta(minutes=2))
+            .with_exp(now - timedelta(minutes=1))
+            .build()
+        )
+        cache = LruCache[bytes, TokenPayload](8)
+        cache.set(hashlib.sha256(token.encode()).digest(), expired_payload)
+        sut = PyJwtManager(self._secret_key, self._algorithm, cache=cache)
+
+        # when
+        payload = sut.decode(token)
+
+        # then
+        assert payload is None
+        assert cache.info().size == 0
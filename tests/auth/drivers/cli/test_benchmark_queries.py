@@ -0,0 +1,56 @@
+import pytest
+from psycopg import AsyncConnection
+from psycopg.rows import DictRow
+from psycopg_pool import AsyncConnectionPool
+
+from src.auth.drivers.cli.benchmark_queries import benchmark, parse_args
+
+
+@pytest.mark.anyio(scope="class")
+@pytest.mark.describe("benchmark-queries")
+class TestBenchmarkQueries:
+    @pytest.mark.it("Should benchmark the queries with prepared statements")
+    async def test_benchmark_prepared(
+        self,
+        pool: AsyncConnectionPool[AsyncConnection[DictRow]],
+    ) -> None:
+        # given
+        iterations = 10
+
+        # when
+        result = await benchmark(
+            pool.conninfo,
+            prepared=True,
+            iterations=iterations,
+        )
+
+        # then
+        assert result.prepared
+        assert result.queries == iterations * 2
+        assert result.queries_per_second > 0
+        assert 0 < result.p50_ms <= result.p99_ms
+
+    @pytest.mark.it("Should benchmark the queries without prepared statements")
+    async def test_benchmark_not_prepared(
+        self,
+        pool: AsyncConnectionPool[AsyncConnection[DictRow]],
+    ) -> None:
+        # given
+        iterations = 10
+
+        # when
+        result = await benchmark(
+            pool.conninfo,
+            prepared=False,
+            iterations=iterations,
+        )
+
+        # then
+        assert not result.prepared
+        assert result.queries == iterations * 2
+
+    @pytest.mark.it("Should reject fewer than two iterations")
+    def test_parse_args_iterations(self) -> None:
+        # when/then
+        with pytest.raises(SystemExit):
+            parse_args(["--database-url", "postgres://", "--iterations", "1"])
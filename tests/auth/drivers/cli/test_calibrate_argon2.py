@@ -0,0 +1,58 @@
+import pytest
+
+from src.auth.drivers.cli.calibrate_argon2 import calibrate, main, parse_args
+
+
+@pytest.mark.describe("calibrate-argon2")
+class TestCalibrateArgon2:
+    @pytest.mark.it("Should benchmark a parameter set")
+    def test_calibrate(self) -> None:
+        # given
+        time_cost = 1
+        memory_cost = 1024
+        parallelism = 1
+
+        # when
+        result = calibrate(
+            time_cost,
+            memory_cost,
+            parallelism,
+            iterations=5,
+        )
+
+        # then
+        assert result.time_cost == time_cost
+        assert result.memory_cost == memory_cost
+        assert result.parallelism == parallelism
+        assert result.hashes_per_second_per_core > 0
+        assert result.hashes_per_second_per_host > 0
+        assert 0 < result.p50_ms <= result.p99_ms
+
+    @pytest.mark.it("Should report one line per candidate")
+    def test_main(self, capsys: pytest.CaptureFixture[str]) -> None:
+        # when
+        main(
+            [
+                "--time-cost",
+                "1",
+                "2",
+                "--memory-cost",
+                "1024",
+                "--parallelism",
+                "1",
+                "--iterations",
+                "3",
+            ]
+        )
+
+        # then
+        lines = capsys.readouterr().out.splitlines()
+        header, *rows = lines
+        assert "p99_ms" in header
+        assert [row.split()[0] for row in rows] == ["1", "2"]
+
+    @pytest.mark.it("Should reject fewer than two iterations")
+    def test_parse_args_iterations(self) -> None:
+        # when/then
+        with pytest.raises(SystemExit):
+            parse_args(["--iterations", "1"])
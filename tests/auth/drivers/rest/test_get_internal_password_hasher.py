@@ -0,0 +1,32 @@
+import pytest
+from fastapi import status
+
+from tests.helpers.server_test import ServerTest
+
+
+@pytest.mark.anyio(scope="class")
+@pytest.mark.describe("GET /internal/password-hasher")
+class TestGetInternalPasswordHasher:
+    @pytest.mark.it(f"Should return {status.HTTP_200_OK} OK")
+    async def test_password_hasher_ok(self) -> None:
+        env = {
+            "PASSWORD_HASHER_MAX_PENDING": "8",
+            "SERVER_INTERNAL_ENDPOINTS": "true",
+        }
+        async with ServerTest(env) as (http_client, _):
+            # when
+            response = await http_client.get("/internal/password-hasher")
+
+            # then
+            assert response.status_code == status.HTTP_200_OK
+
+            # and
+            output = response.json()
+            assert output == {
+                "pending": 0,
+                "peak_pending": 0,
+                "max_pending": 8,
+                "completed": 0,
+                "rejected": 0,
+                "total_seconds": 0.0,
+            }
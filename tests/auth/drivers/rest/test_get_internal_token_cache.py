@@ -0,0 +1,52 @@
+import secrets
+
+import pytest
+from faker import Faker
+from fastapi import status
+
+from tests.auth.builders.domain.entities.user_builder import UserBuilder
+from tests.auth.helpers.auth_database_client import AuthDatabaseClient
+from tests.auth.helpers.auth_http_client import AuthHttpClient
+from tests.auth.helpers.generate_token import generate_token
+from tests.helpers.server_test import ServerTest
+
+
+@pytest.mark.anyio(scope="class")
+@pytest.mark.describe("GET /internal/token-cache")
+class TestGetInternalTokenCache:
+    @pytest.mark.it(f"Should return {status.HTTP_200_OK} OK")
+    async def test_token_cache_ok(self, faker: Faker) -> None:
+        secret_key = secrets.token_hex(64)
+        env = {
+            "JWT_SECRET_KEY": secret_key,
+            "JWT_CACHE_MAX_SIZE": "8",
+            "SERVER_INTERNAL_ENDPOINTS": "true",
+        }
+        async with ServerTest(env) as (http_client, pool):
+            # given
+            auth_client = AuthHttpClient(http_client)
+            auth_database_client = AuthDatabaseClient(pool)
+
+            # and
+            user = UserBuilder().with_hashed_password(faker.password()).build()
+            await auth_database_client.create_user(user)
+
+            # and
+            token = generate_token(user.id, secret_key=secret_key)
+            await auth_client.get_profile(token)
+            await auth_client.get_profile(token)
+
+            # when
+            response = await http_client.get("/internal/token-cache")
+
+            # then
+            assert response.status_code == status.HTTP_200_OK
+
+            # and
+            output = response.json()
+            assert output == {
+                "hits": 1,
+                "misses": 1,
+                "size": 1,
+                "max_size": 8,
+            }
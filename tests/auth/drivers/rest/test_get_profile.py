@@ -1,4 +1,6 @@
+import asyncio
 import secrets
+from datetime import timedelta
 from uuid import uuid4
 
 import pytest
@@ -11,6 +13,8 @@ from tests.auth.helpers.auth_http_client import AuthHttpClient
 from tests.auth.helpers.generate_token import generate_token
 from tests.helpers.server_test import ServerTest
 
+from src.common.drivers.rest.etag import entity_tag
+
 
 @pytest.mark.anyio(scope="class")
 @pytest.mark.describe("GET /auth/profile")
@@ -98,3 +102,103 @@ class TestGetProfile:
 
             # then
             assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    @pytest.mark.it(
+        f"Should return {status.HTTP_304_NOT_MODIFIED} "
+        "NOT MODIFIED when If-None-Match matches the ETag"
+    )
+    async def test_profile_not_modified(self, faker: Faker) -> None:
+        secret_key = secrets.token_hex(64)
+        env = {"JWT_SECRET_KEY": secret_key}
+        async with ServerTest(env) as (http_client, pool):
+            # given
+            auth_client = AuthHttpClient(http_client)
+            auth_database_client = AuthDatabaseClient(pool)
+
+            # and
+            current_user = (
+                UserBuilder().with_hashed_password(faker.password()).build()
+            )
+            await auth_database_client.create_user(current_user)
+
+            # and
+            token = generate_token(current_user.id, secret_key=secret_key)
+            tag = entity_tag(current_user.id, current_user.updated_at)
+
+            # when
+            response = await auth_client.get_profile(token)
+
+            # then
+            assert response.status_code == status.HTTP_200_OK
+            assert response.headers["ETag"] == tag
+
+            # when
+            response = await auth_client.get_profile(
+                token,
+                headers={"If-None-Match": tag},
+            )
+
+            # then
+            assert response.status_code == status.HTTP_304_NOT_MODIFIED
+            assert response.headers["ETag"] == tag
+            assert response.content == b""
+
+    @pytest.mark.it(
+        "Should return the current version once the cached user expires "
+        "after an update made elsewhere"
+    )
+    async def test_profile_updated_elsewhere(self, faker: Faker) -> None:
+        secret_key = secrets.token_hex(64)
+        ttl = 1
+        env = {
+            "JWT_SECRET_KEY": secret_key,
+            "USER_CACHE_TTL_SECONDS": str(ttl),
+        }
+        async with ServerTest(env) as (http_client, pool):
+            # given
+            auth_client = AuthHttpClient(http_client)
+            auth_database_client = AuthDatabaseClient(pool)
+
+            # and
+            current_user = (
+                UserBuilder().with_hashed_password(faker.password()).build()
+            )
+            await auth_database_client.create_user(current_user)
+
+            # and
+            token = generate_token(current_user.id, secret_key=secret_key)
+            tag = (await auth_client.get_profile(token)).headers["ETag"]
+
+            # and
+            updated_user = current_user.model_copy(
+                update={
+                    "first_name": faker.first_name(),
+                    "updated_at": current_user.updated_at
+                    + timedelta(seconds=1),
+                },
+            )
+            await auth_database_client.update_user(updated_user)
+
+            # when
+            response = await auth_client.get_profile(
+                token,
+                headers={"If-None-Match": tag},
+            )
+
+            # then
+            assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+            # when
+            await asyncio.sleep(ttl * 2)
+            response = await auth_client.get_profile(
+                token,
+                headers={"If-None-Match": tag},
+            )
+
+            # then
+            assert response.status_code == status.HTTP_200_OK
+            assert response.json()["first_name"] == updated_user.first_name
+            assert response.headers["ETag"] == entity_tag(
+                updated_user.id,
+                updated_user.updated_at,
+            )
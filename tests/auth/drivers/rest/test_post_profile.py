@@ -1,4 +1,5 @@
 import secrets
+from datetime import timedelta
 
 import pytest
 from faker import Faker
@@ -10,6 +11,8 @@ from tests.auth.helpers.auth_http_client import AuthHttpClient
 from tests.auth.helpers.generate_token import generate_token
 from tests.helpers.server_test import ServerTest
 
+from src.common.drivers.rest.etag import entity_tag
+
 
 @pytest.mark.anyio(scope="class")
 @pytest.mark.describe("POST /auth/profile")
@@ -151,6 +154,41 @@ class TestPostProfile:
             # and
             assert set(fields) == set(output.keys())
 
+    @pytest.mark.it(
+        f"Should return {status.HTTP_200_OK} OK (profile read after update)"
+    )
+    async def test_profile_ok_read_after_update(self, faker: Faker) -> None:
+        secret_key = secrets.token_hex(64)
+        env = {"JWT_SECRET_KEY": secret_key}
+        async with ServerTest(env) as (http_client, pool):
+            # given
+            auth_database_client = AuthDatabaseClient(pool)
+            auth_client = AuthHttpClient(http_client)
+
+            # and
+            current_user = (
+                UserBuilder().with_hashed_password(faker.password()).build()
+            )
+            await auth_database_client.create_user(current_user)
+
+            # and
+            token = generate_token(current_user.id, secret_key=secret_key)
+            await auth_client.get_profile(token)
+
+            # and
+            body: dict[str, object] = {"first_name": faker.first_name()}
+
+            # when
+            await auth_client.post_profile(token, body)
+            response = await auth_client.get_profile(token)
+
+            # then
+            assert response.status_code == status.HTTP_200_OK
+
+            # and
+            output = response.json()
+            assert output["first_name"] == body["first_name"]
+
     @pytest.mark.it(
         f"Should return {status.HTTP_401_UNAUTHORIZED} UNAUTHORIZED"
     )
@@ -199,6 +237,41 @@ class TestPostProfile:
             # then
             assert response.status_code == status.HTTP_409_CONFLICT
 
+    @pytest.mark.it(
+        f"Should return {status.HTTP_401_UNAUTHORIZED} UNAUTHORIZED "
+        "when the cached user no longer exists"
+    )
+    async def test_profile_user_deleted(self, faker: Faker) -> None:
+        secret_key = secrets.token_hex(64)
+        env = {"JWT_SECRET_KEY": secret_key}
+        async with ServerTest(env) as (http_client, pool):
+            # given
+            auth_database_client = AuthDatabaseClient(pool)
+            auth_client = AuthHttpClient(http_client)
+
+            # and
+            current_user = (
+                UserBuilder().with_hashed_password(faker.password()).build()
+            )
+            await auth_database_client.create_user(current_user)
+
+            # and
+            token = generate_token(current_user.id, secret_key=secret_key)
+            await auth_client.get_profile(token)
+
+            # and
+            await auth_database_client.delete_user(current_user.id)
+
+            # when
+            response = await auth_client.post_profile(
+                token,
+                {"first_name": faker.first_name()},
+            )
+
+            # then
+            assert response.status_code == status.HTTP_401_UNAUTHORIZED
+            assert response.json() == {"detail": "Invalid token"}
+
     @pytest.mark.it(
         f"Should return {status.HTTP_422_UNPROCESSABLE_ENTITY} "
         "UNPROCESSABLE_ENTITY"
@@ -232,3 +305,87 @@ class TestPostProfile:
 
             # then
             assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+    @pytest.mark.it(
+        f"Should return {status.HTTP_200_OK} OK and the new ETag "
+        "when If-Match matches the current version"
+    )
+    async def test_profile_ok_if_match(self, faker: Faker) -> None:
+        secret_key = secrets.token_hex(64)
+        env = {"JWT_SECRET_KEY": secret_key}
+        async with ServerTest(env) as (http_client, pool):
+            # given
+            auth_database_client = AuthDatabaseClient(pool)
+            auth_client = AuthHttpClient(http_client)
+
+            # and
+            current_user = (
+                UserBuilder().with_hashed_password(faker.password()).build()
+            )
+            await auth_database_client.create_user(current_user)
+
+            # and
+            token = generate_token(current_user.id, secret_key=secret_key)
+            tag = entity_tag(current_user.id, current_user.updated_at)
+
+            # when
+            response = await auth_client.post_profile(
+                token,
+                {"first_name": faker.first_name()},
+                headers={"If-Match": tag},
+            )
+
+            # then
+            assert response.status_code == status.HTTP_200_OK
+
+            # and
+            user_from_db = await auth_database_client.select_user(
+                current_user.id
+            )
+            assert user_from_db is not None
+            assert response.headers["ETag"] == entity_tag(
+                current_user.id,
+                user_from_db.updated_at,
+            )
+
+    @pytest.mark.it(
+        f"Should return {status.HTTP_412_PRECONDITION_FAILED} "
+        "PRECONDITION FAILED when If-Match is stale"
+    )
+    async def test_profile_precondition_failed(self, faker: Faker) -> None:
+        secret_key = secrets.token_hex(64)
+        env = {"JWT_SECRET_KEY": secret_key}
+        async with ServerTest(env) as (http_client, pool):
+            # given
+            auth_database_client = AuthDatabaseClient(pool)
+            auth_client = AuthHttpClient(http_client)
+
+            # and
+            current_user = (
+                UserBuilder().with_hashed_password(faker.password()).build()
+            )
+            await auth_database_client.create_user(current_user)
+
+            # and
+            token = generate_token(current_user.id, secret_key=secret_key)
+            stale_tag = entity_tag(
+                current_user.id,
+                current_user.updated_at - timedelta(seconds=1),
+            )
+
+            # when
+            response = await auth_client.post_profile(
+                token,
+                {"first_name": faker.first_name()},
+                headers={"If-Match": stale_tag},
+            )
+
+            # then
+            assert response.status_code == status.HTTP_412_PRECONDITION_FAILED
+            assert response.json() == {"detail": "User has changed"}
+
+            # and
+            user_from_db = await auth_database_client.select_user(
+                current_user.id
+            )
+            assert user_from_db == current_user
@@ -83,6 +83,31 @@ class TestPostSignup:
             output = response.json()
             assert output == {"detail": "Email already exists"}
 
+    @pytest.mark.it("Should not hash the password when email is in use")
+    async def test_signup_email_in_use_not_hashed(self) -> None:
+        env = {"SERVER_INTERNAL_ENDPOINTS": "true"}
+        async with ServerTest(env) as (http_client, pool):
+            # given
+            auth_client = AuthHttpClient(http_client)
+            auth_database_client = AuthDatabaseClient(pool)
+
+            # and
+            user = UserBuilder().build()
+            await auth_database_client.create_user(user)
+
+            # and
+            body = CreateUserInputBuilder().with_email(user.email).build_dict()
+
+            # when
+            response = await auth_client.signup(body)
+
+            # then
+            assert response.status_code == status.HTTP_409_CONFLICT
+
+            # and
+            response = await http_client.get("/internal/password-hasher")
+            assert response.json()["completed"] == 0
+
     @pytest.mark.it(
         f"Should return {status.HTTP_422_UNPROCESSABLE_ENTITY} "
         "UNPROCESSABLE_ENTITY"
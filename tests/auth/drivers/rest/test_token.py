@@ -1,3 +1,6 @@
+import asyncio
+
+import argon2
 import pytest
 from faker import Faker
 from fastapi import status
@@ -40,6 +43,56 @@ class TestToken:
             assert "access_token" in data
             assert "token_type" in data
 
+    @pytest.mark.it(
+        f"Should return {status.HTTP_200_OK} OK and rehash outdated password"
+    )
+    async def test_token_ok_rehash(self, faker: Faker) -> None:
+        async with ServerTest() as (http_client, pool):
+            # given
+            auth_client = AuthHttpClient(http_client)
+            auth_database_client = AuthDatabaseClient(pool)
+
+            # and
+            raw_password = faker.password()
+            outdated_hasher = argon2.PasswordHasher(time_cost=1)
+            user = (
+                UserBuilder()
+                .with_password(outdated_hasher.hash(raw_password))
+                .build()
+            )
+            await auth_database_client.create_user(user)
+
+            # and
+            body: dict[str, object] = {
+                "username": user.email,
+                "password": raw_password,
+            }
+
+            # when
+            response = await auth_client.token(body)
+
+            # then
+            assert response.status_code == status.HTTP_200_OK
+
+            # and
+            user_from_db = None
+            for _ in range(50):
+                user_from_db = await auth_database_client.select_user(user.id)
+                assert user_from_db is not None
+                if user_from_db.password != user.password:
+                    break
+                await asyncio.sleep(0.1)
+
+            assert user_from_db is not None
+            assert user_from_db.password != user.password
+            assert not argon2.PasswordHasher().check_needs_rehash(
+                user_from_db.password
+            )
+            assert argon2.PasswordHasher().verify(
+                user_from_db.password,
+                raw_password,
+            )
+
     @pytest.mark.it(
         f"Should return {status.HTTP_401_UNAUTHORIZED} "
         "UNAUTHORIZED when user does not exist",
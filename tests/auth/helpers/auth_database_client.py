@@ -30,6 +30,25 @@ class AuthDatabaseClient(DatabaseClient):
             user.model_dump(),
         )
 
+    async def update_user(self, user: User) -> None:
+        await self.query(
+            """
+            UPDATE users
+            SET
+                email = %(email)s,
+                password = %(password)s,
+                first_name = %(first_name)s,
+                last_name = %(last_name)s,
+                updated_at = %(updated_at)s,
+                created_at = %(created_at)s
+            WHERE id = %(id)s;
+            """,
+            user.model_dump(),
+        )
+
+    async def delete_user(self, id_: UUID | str) -> None:
+        await self.query("DELETE FROM users WHERE id = %s;", [id_])
+
     async def select_user(self, id_: UUID | str) -> User | None:
         cursor = await self.query(
             "SELECT * FROM users WHERE id = %s;",
@@ -11,16 +11,27 @@ class AuthHttpClient:
     async def token(self, body: dict[str, object]) -> httpx.Response:
         return await self._client.post("/auth/token", data=body)
 
-    async def get_profile(self, token: str | None = None) -> httpx.Response:
-        headers = {"Authorization": f"Bearer {token}"} if token else None
+    async def get_profile(
+        self,
+        token: str | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> httpx.Response:
+        headers = {
+            **({"Authorization": f"Bearer {token}"} if token else {}),
+            **(headers or {}),
+        }
         return await self._client.get("/auth/profile", headers=headers)
 
     async def post_profile(
         self,
         token: str | None = None,
         body: dict[str, object] | None = None,
+        headers: dict[str, str] | None = None,
     ) -> httpx.Response:
-        headers = {"Authorization": f"Bearer {token}"} if token else None
+        headers = {
+            **({"Authorization": f"Bearer {token}"} if token else {}),
+            **(headers or {}),
+        }
         return await self._client.post(
             "/auth/profile",
             headers=headers,
@@ -0,0 +1,45 @@
+import pytest
+from psycopg import AsyncConnection
+from psycopg.rows import DictRow
+from psycopg_pool import AsyncConnectionPool
+
+from src.common.adapters.postgres.instrumented_async_cursor import (
+    InstrumentedAsyncCursor,
+)
+from src.common.adapters.postgres.query_recorder import (
+    current_query_name,
+    query_recorder,
+)
+
+
+@pytest.mark.anyio(scope="class")
+@pytest.mark.describe(InstrumentedAsyncCursor.__name__)
+class TestInstrumentedAsyncCursor:
+    @pytest.mark.it("Should record latency and rows of executed statements")
+    async def test_execute(
+        self,
+        pool: AsyncConnectionPool[AsyncConnection[DictRow]],
+    ) -> None:
+        # given
+        name = "TestInstrumentedAsyncCursor.test_execute"
+        token = current_query_name.set(name)
+        rows = 3
+
+        # when
+        try:
+            async with (
+                await AsyncConnection.connect(
+                    pool.conninfo,
+                    cursor_factory=InstrumentedAsyncCursor,
+                ) as connection,
+                connection.cursor() as cursor,
+            ):
+                await cursor.execute("SELECT generate_series(1, %s);", [rows])
+        finally:
+            current_query_name.reset(token)
+
+        # then
+        stats = query_recorder.stats()[name]
+        assert stats.calls == 1
+        assert stats.rows == rows
+        assert stats.total_ms > 0
@@ -0,0 +1,31 @@
+import pytest
+
+from src.common.adapters.postgres.like import escape_like, like_patterns
+
+
+@pytest.mark.describe("like")
+class TestLike:
+    @pytest.mark.it("Should escape LIKE wildcards and the escape character")
+    def test_escape_like(self) -> None:
+        # when
+        escaped = escape_like(r"50%_off\now")
+
+        # then
+        assert escaped == r"50\%\_off\\now"
+
+    @pytest.mark.it("Should build a prefix pattern")
+    def test_prefix(self) -> None:
+        # when
+        pattern, prefix = like_patterns("ab%", substring=False)
+
+        # then
+        assert pattern == prefix == r"ab\%%"
+
+    @pytest.mark.it("Should build a substring pattern")
+    def test_substring(self) -> None:
+        # when
+        pattern, prefix = like_patterns("ab", substring=True)
+
+        # then
+        assert pattern == "%ab%"
+        assert prefix == "ab%"
@@ -0,0 +1,37 @@
+import pytest
+
+from tests.auth.builders.domain.entities.user_builder import UserBuilder
+from tests.core.builders.domain.entities.note_builder import NoteBuilder
+
+from src.auth.domain.entities import User
+from src.common.adapters.postgres.model_row import model_row_maker
+from src.core.domain.entities import Note
+
+
+@pytest.mark.describe(model_row_maker.__name__)
+class TestModelRowMaker:
+    @pytest.mark.it("Should build an user from a tuple row")
+    def test_user(self) -> None:
+        # given
+        user = UserBuilder().build()
+        names = list(User.model_fields)
+        values = tuple(getattr(user, name) for name in names)
+
+        # when
+        result = model_row_maker(User, names)(values)
+
+        # then
+        assert result == user
+
+    @pytest.mark.it("Should build a note from a tuple row in any column order")
+    def test_note(self) -> None:
+        # given
+        note = NoteBuilder().build()
+        names = list(reversed(Note.model_fields))
+        values = tuple(getattr(note, name) for name in names)
+
+        # when
+        result = model_row_maker(Note, names)(values)
+
+        # then
+        assert result == note
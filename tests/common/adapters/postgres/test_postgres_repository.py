@@ -0,0 +1,132 @@
+from collections.abc import AsyncGenerator
+from uuid import UUID
+
+import pytest
+from psycopg import AsyncConnection
+from psycopg.rows import DictRow
+from psycopg_pool import AsyncConnectionPool
+
+from tests.auth.builders.domain.entities.user_builder import UserBuilder
+from tests.auth.helpers.auth_database_client import AuthDatabaseClient
+
+from src.common.adapters.postgres.postgres_repository import PostgresRepository
+
+
+class NumbersRepository(PostgresRepository):
+    async def rename(self, user_id: UUID, first_name: str) -> int:
+        return await self._execute(
+            "UPDATE users SET first_name = %s WHERE id = %s;",
+            [first_name, user_id],
+        )
+
+    async def first(self, *, exists: bool) -> DictRow | None:
+        return await self._fetch_one(
+            "SELECT 1 AS value WHERE %s;",
+            [exists],
+        )
+
+    async def series(self, total: int) -> list[DictRow]:
+        return await self._fetch_all(
+            "SELECT generate_series(1, %s) AS value;",
+            [total],
+        )
+
+    async def stream_series(
+        self,
+        total: int,
+        size: int | None = None,
+    ) -> AsyncGenerator[DictRow, None]:
+        async for row in self._stream(
+            "SELECT generate_series(1, %s) AS value;",
+            [total],
+            size=size,
+        ):
+            yield row
+
+
+@pytest.mark.anyio(scope="class")
+@pytest.mark.describe(PostgresRepository.__name__)
+class TestPostgresRepository:
+    @pytest.mark.it("Should return the number of affected rows on execute")
+    async def test_execute(
+        self,
+        pool: AsyncConnectionPool[AsyncConnection[DictRow]],
+    ) -> None:
+        # given
+        client = AuthDatabaseClient(pool)
+        sut = NumbersRepository(pool)
+
+        # and
+        user = UserBuilder().build()
+        await client.create_user(user)
+
+        # when
+        rowcount = await sut.rename(user.id, "first_name")
+
+        # then
+        assert rowcount == 1
+
+    @pytest.mark.it("Should fetch one row (return none if there is no row)")
+    async def test_fetch_one(
+        self,
+        pool: AsyncConnectionPool[AsyncConnection[DictRow]],
+    ) -> None:
+        # given
+        sut = NumbersRepository(pool)
+
+        # when
+        row = await sut.first(exists=True)
+        no_row = await sut.first(exists=False)
+
+        # then
+        assert row == {"value": 1}
+        assert no_row is None
+
+    @pytest.mark.it("Should fetch all rows")
+    async def test_fetch_all(
+        self,
+        pool: AsyncConnectionPool[AsyncConnection[DictRow]],
+    ) -> None:
+        # given
+        sut = NumbersRepository(pool)
+
+        # when
+        rows = await sut.series(3)
+
+        # then
+        assert rows == [{"value": 1}, {"value": 2}, {"value": 3}]
+
+    @pytest.mark.it("Should stream rows in batches with a server-side cursor")
+    async def test_stream(
+        self,
+        pool: AsyncConnectionPool[AsyncConnection[DictRow]],
+    ) -> None:
+        # given
+        sut = NumbersRepository(pool)
+        total = 25
+
+        # when
+        values = [
+            row["value"] async for row in sut.stream_series(total, size=10)
+        ]
+
+        # then
+        assert values == list(range(1, total + 1))
+
+    @pytest.mark.it("Should give the connection back if the stream is closed")
+    async def test_stream_closed(
+        self,
+        pool: AsyncConnectionPool[AsyncConnection[DictRow]],
+    ) -> None:
+        # given
+        sut = NumbersRepository(pool)
+        stream = sut.stream_series(100)
+
+        # when
+        async for _ in stream:
+            break
+        await stream.aclose()
+
+        # then
+        stats = pool.get_stats()
+        assert stats["pool_available"] == stats["pool_size"]
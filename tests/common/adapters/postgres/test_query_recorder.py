@@ -0,0 +1,73 @@
+import logging
+
+import pytest
+
+from src.common.adapters.postgres.query_recorder import (
+    QueryRecorder,
+    current_query_name,
+    instrumented,
+)
+
+
+@pytest.mark.anyio(scope="class")
+@pytest.mark.describe(QueryRecorder.__name__)
+class TestQueryRecorder:
+    @pytest.mark.it("Should aggregate queries by the instrumented method")
+    async def test_record_query(self) -> None:
+        # given
+        sut = QueryRecorder()
+
+        @instrumented
+        async def find() -> str:
+            sut.record_pool_wait(0.002)
+            sut.record_query(lambda: "SELECT 1;", duration=0.003, rows=1)
+            sut.record_query(lambda: "SELECT 1;", duration=0.020, rows=2)
+            return current_query_name.get()
+
+        # when
+        name = await find()
+
+        # then
+        stats = sut.stats()[name]
+        assert stats.calls == sum(stats.buckets.values())
+        assert stats.rows == sum([1, 2])
+        assert stats.total_ms == pytest.approx(23)
+        assert stats.max_ms == pytest.approx(20)
+        assert stats.pool_waits == 1
+        assert stats.pool_wait_ms == pytest.approx(2)
+        assert stats.buckets == {"le_5": 1, "le_25": 1}
+
+        # and
+        assert name.endswith("find")
+        assert current_query_name.get() == "unknown"
+
+    @pytest.mark.it("Should log queries above the slow query threshold")
+    async def test_slow_query(self, caplog: pytest.LogCaptureFixture) -> None:
+        # given
+        sut = QueryRecorder(slow_query_ms=10)
+
+        # when
+        with caplog.at_level(logging.WARNING):
+            sut.record_query(lambda: "SELECT 1;", duration=0.001, rows=1)
+            sut.record_query(lambda: "SELECT 2;", duration=0.050, rows=1)
+
+        # then
+        assert len(caplog.records) == 1
+
+        # and
+        record = caplog.records[0].__dict__
+        assert record["statement"] == "SELECT 2;"
+        assert record["query_name"] == "unknown"
+        assert record["duration_ms"] == pytest.approx(50)
+
+    @pytest.mark.it("Should not log slow queries without a threshold")
+    def test_no_threshold(self, caplog: pytest.LogCaptureFixture) -> None:
+        # given
+        sut = QueryRecorder()
+
+        # when
+        with caplog.at_level(logging.WARNING):
+            sut.record_query(lambda: "SELECT 1;", duration=10, rows=1)
+
+        # then
+        assert caplog.records == []
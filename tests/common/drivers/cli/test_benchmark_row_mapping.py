@@ -0,0 +1,30 @@
+import pytest
+
+from src.common.drivers.cli.benchmark_row_mapping import (
+    benchmark,
+    main,
+    sample_entities,
+)
+
+
+@pytest.mark.describe("benchmark-row-mapping")
+class TestBenchmarkRowMapping:
+    @pytest.mark.it("Should measure both loading paths for every entity")
+    def test_benchmark(self) -> None:
+        for entity in sample_entities():
+            # when
+            result = benchmark(entity, iterations=10)
+
+            # then
+            assert result.model == type(entity).__name__
+            assert result.validate_us > 0
+            assert result.construct_us > 0
+
+    @pytest.mark.it("Should report one line per entity")
+    def test_main(self, capsys: pytest.CaptureFixture[str]) -> None:
+        # when
+        main(["--iterations", "10"])
+
+        # then
+        lines = capsys.readouterr().out.strip().splitlines()
+        assert len(lines) == len(sample_entities()) + 1
@@ -0,0 +1,27 @@
+import pytest
+
+from src.common.drivers.cli.latency import measure
+
+
+@pytest.mark.anyio(scope="class")
+@pytest.mark.describe("measure")
+class TestMeasure:
+    @pytest.mark.it("Should report the rows and latency percentiles")
+    async def test_measure(self) -> None:
+        # given
+        iterations = 10
+        rows = 7
+        calls = 0
+
+        async def call() -> int:
+            nonlocal calls
+            calls += 1
+            return rows
+
+        # when
+        latency = await measure(call, iterations)
+
+        # then
+        assert calls == iterations
+        assert latency.rows == rows
+        assert 0 < latency.p50_ms <= latency.p99_ms
@@ -0,0 +1,83 @@
+from datetime import timedelta
+from uuid import uuid4
+
+import pytest
+
+from src.common.datetime import Datetime
+from src.common.drivers.rest.etag import (
+    entity_tag,
+    matching_versions,
+    none_match,
+)
+
+
+@pytest.mark.describe("etag")
+class TestEtag:
+    @pytest.mark.it("Should change the tag with each microsecond of a version")
+    def test_entity_tag(self) -> None:
+        # given
+        id_ = uuid4()
+        updated_at = Datetime.now()
+
+        # when
+        tag = entity_tag(id_, updated_at)
+
+        # then
+        assert tag.startswith(f'"{id_.hex}-')
+        assert tag.endswith('"')
+        assert tag == entity_tag(id_, updated_at)
+        assert tag != entity_tag(
+            id_,
+            updated_at + timedelta(microseconds=1),
+        )
+        assert tag != entity_tag(uuid4(), updated_at)
+
+    @pytest.mark.it("Should tell when If-None-Match does not match the tag")
+    @pytest.mark.parametrize(
+        ("if_none_match", "expected"),
+        [
+            (None, True),
+            ('"other"', True),
+            ("{tag}", False),
+            ('"other", {tag}', False),
+            ("W/{tag}", False),
+            ("*", False),
+        ],
+    )
+    def test_none_match(
+        self,
+        if_none_match: str | None,
+        *,
+        expected: bool,
+    ) -> None:
+        # given
+        tag = entity_tag(uuid4(), Datetime.now())
+        header = (
+            if_none_match.format(tag=tag)
+            if if_none_match is not None
+            else None
+        )
+
+        # when
+        result = none_match(header, tag)
+
+        # then
+        assert result is expected
+
+    @pytest.mark.it("Should read the versions an If-Match accepts")
+    def test_matching_versions(self) -> None:
+        # given
+        id_ = uuid4()
+        updated_at = Datetime.now() + timedelta(microseconds=42)
+        tag = entity_tag(id_, updated_at)
+
+        # when/then
+        assert matching_versions(None, id_) is None
+        assert matching_versions("*", id_) is None
+        assert matching_versions(tag, id_) == [updated_at]
+        assert matching_versions(f'"other", {tag}', id_) == [updated_at]
+
+        # and
+        assert matching_versions(f"W/{tag}", id_) == []
+        assert matching_versions(tag, uuid4()) == []
+        assert matching_versions(f'"{id_.hex}-zz"', id_) == []
@@ -0,0 +1,40 @@
+import pytest
+from fastapi import status
+
+from tests.helpers.server_test import ServerTest
+
+
+@pytest.mark.anyio(scope="class")
+@pytest.mark.describe("GET /internal/pool")
+class TestGetInternalPool:
+    @pytest.mark.it(f"Should return {status.HTTP_200_OK} OK")
+    async def test_pool_ok(self) -> None:
+        env = {
+            "DATABASE_POOL_MIN_SIZE": "2",
+            "DATABASE_POOL_MAX_SIZE": "3",
+            "SERVER_INTERNAL_ENDPOINTS": "true",
+        }
+        async with ServerTest(env) as (http_client, _pool):
+            # when
+            response = await http_client.get("/internal/pool")
+
+            # then
+            assert response.status_code == status.HTTP_200_OK
+
+            # and
+            output = response.json()
+            assert output["pool_min"] == int(env["DATABASE_POOL_MIN_SIZE"])
+            assert output["pool_max"] == int(env["DATABASE_POOL_MAX_SIZE"])
+            assert "requests_waiting" in output
+
+    @pytest.mark.it(
+        f"Should return {status.HTTP_404_NOT_FOUND} NOT FOUND "
+        "when internal endpoints are disabled"
+    )
+    async def test_pool_disabled(self) -> None:
+        async with ServerTest() as (http_client, _pool):
+            # when
+            response = await http_client.get("/internal/pool")
+
+            # then
+            assert response.status_code == status.HTTP_404_NOT_FOUND
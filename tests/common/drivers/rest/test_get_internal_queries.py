@@ -0,0 +1,34 @@
+import pytest
+from fastapi import status
+
+from tests.auth.builders.use_cases.inputs.create_user_input_builder import (
+    CreateUserInputBuilder,
+)
+from tests.auth.helpers.auth_http_client import AuthHttpClient
+from tests.helpers.server_test import ServerTest
+
+
+@pytest.mark.anyio(scope="class")
+@pytest.mark.describe("GET /internal/queries")
+class TestGetInternalQueries:
+    @pytest.mark.it(f"Should return {status.HTTP_200_OK} OK")
+    async def test_queries_ok(self) -> None:
+        env = {"SERVER_INTERNAL_ENDPOINTS": "true"}
+        async with ServerTest(env) as (http_client, _pool):
+            # given
+            auth_client = AuthHttpClient(http_client)
+            await auth_client.signup(CreateUserInputBuilder().build_dict())
+
+            # when
+            response = await http_client.get("/internal/queries")
+
+            # then
+            assert response.status_code == status.HTTP_200_OK
+
+            # and
+            output = response.json()
+            stats = output["PostgresUserRepository.create_if_not_exists"]
+            assert stats["calls"] == 1
+            assert stats["rows"] == 1
+            assert stats["pool_waits"] == 1
+            assert sum(stats["buckets"].values()) == 1
@@ -0,0 +1,47 @@
+import logging
+
+import pytest
+from psycopg import AsyncConnection
+from psycopg.rows import DictRow
+from psycopg_pool import AsyncConnectionPool
+
+from src.common.drivers.rest.lifespans import check_pool_size
+
+
+@pytest.mark.anyio(scope="class")
+@pytest.mark.describe(check_pool_size.__name__)
+class TestCheckPoolSize:
+    @pytest.mark.it("Should warn if the pools can exceed max_connections")
+    async def test_warn(
+        self,
+        pool: AsyncConnectionPool[AsyncConnection[DictRow]],
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        # given
+        workers = 100_000
+
+        # when
+        with caplog.at_level(logging.WARNING):
+            await check_pool_size(pool, workers)
+
+        # then
+        assert len(caplog.records) == 1
+
+        # and
+        record = caplog.records[0].__dict__
+        assert record["pool_max_size"] == pool.max_size
+        assert record["workers"] == workers
+        assert record["connections_per_worker"] == 0
+
+    @pytest.mark.it("Should NOT warn if the pool fits in max_connections")
+    async def test_not_warn(
+        self,
+        pool: AsyncConnectionPool[AsyncConnection[DictRow]],
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        # when
+        with caplog.at_level(logging.WARNING):
+            await check_pool_size(pool, 1)
+
+        # then
+        assert caplog.records == []
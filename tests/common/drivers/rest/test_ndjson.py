@@ -0,0 +1,98 @@
+import json
+from collections.abc import AsyncGenerator, AsyncIterator
+
+import pytest
+from pydantic import BaseModel
+
+from src.common.drivers.rest.ndjson import ndjson, ndjson_lines
+
+
+class Item(BaseModel):
+    index: int
+
+
+class Source:
+    def __init__(self, size: int | None = None) -> None:
+        self.size = size
+        self.produced = 0
+        self.closed = False
+
+    async def items(self) -> AsyncGenerator[BaseModel, None]:
+        try:
+            while self.size is None or self.produced < self.size:
+                self.produced += 1
+                yield Item(index=self.produced)
+        finally:
+            self.closed = True
+
+
+async def chunks(*values: bytes) -> AsyncIterator[bytes]:
+    for value in values:
+        yield value
+
+
+@pytest.mark.anyio(scope="class")
+@pytest.mark.describe("ndjson")
+class TestNdjson:
+    @pytest.mark.it("Should write one JSON object per line")
+    async def test_lines(self) -> None:
+        # given
+        source = Source(3)
+
+        # when
+        chunks = [chunk async for chunk in ndjson(source.items())]
+
+        # then
+        lines = b"".join(chunks).decode().splitlines()
+        assert [json.loads(line) for line in lines] == [
+            {"index": 1},
+            {"index": 2},
+            {"index": 3},
+        ]
+
+    @pytest.mark.it("Should only pull the items of the chunk being sent")
+    async def test_backpressure(self) -> None:
+        # given
+        source = Source()
+        stream = ndjson(source.items(), chunk_size=len(b'{"index":1}\n') * 2)
+
+        # when
+        chunk = await anext(stream)
+
+        # then
+        assert chunk == b'{"index":1}\n{"index":2}\n'
+        assert source.produced == len(chunk.splitlines())
+
+        # and
+        await stream.aclose()
+        assert source.closed
+
+
+@pytest.mark.anyio(scope="class")
+@pytest.mark.describe("ndjson_lines")
+class TestNdjsonLines:
+    @pytest.mark.it("Should split lines across chunks")
+    async def test_lines(self) -> None:
+        # given
+        stream = chunks(b'{"index":1}\n{"ind', b'ex":2}\n\n', b'{"index":3}')
+
+        # when
+        lines = [line async for line in ndjson_lines(stream)]
+
+        # then
+        assert lines == [b'{"index":1}', b'{"index":2}', b"", b'{"index":3}']
+
+    @pytest.mark.it("Should cut lines longer than the max line size")
+    async def test_max_line_size(self) -> None:
+        # given
+        max_line_size = 4
+        stream = chunks(b"abc", b"defgh", b"ij\nkl\n")
+
+        # when
+        lines = [
+            line
+            async for line in ndjson_lines(stream, max_line_size=max_line_size)
+        ]
+
+        # then
+        assert lines == [b"abcde", b"kl"]
@@ -0,0 +1,45 @@
+from datetime import datetime
+from uuid import UUID, uuid4
+
+import pytest
+from pydantic import BaseModel
+
+from src.common.cursor import decode_cursor, encode_cursor
+from src.common.datetime import Datetime
+
+
+class Key(BaseModel):
+    updated_at: datetime
+    id: UUID
+
+
+@pytest.mark.describe("cursor")
+class TestCursor:
+    @pytest.mark.it("Should round-trip a key through an opaque cursor")
+    def test_round_trip(self) -> None:
+        # given
+        key = Key(updated_at=Datetime.now(), id=uuid4())
+
+        # when
+        cursor = encode_cursor(key)
+
+        # then
+        assert "=" not in cursor
+        assert str(key.id) not in cursor
+
+        # and
+        assert decode_cursor(Key, cursor) == key
+
+    @pytest.mark.it("Should raise ValueError when the cursor is not valid")
+    @pytest.mark.parametrize(
+        "cursor",
+        [
+            "not a cursor",
+            "e30",
+            encode_cursor(Key(updated_at=Datetime.now(), id=uuid4()))[:-4],
+        ],
+    )
+    def test_invalid(self, cursor: str) -> None:
+        # when/then
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            decode_cursor(Key, cursor)
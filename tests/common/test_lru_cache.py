@@ -0,0 +1,109 @@
+import pytest
+from faker import Faker
+
+from src.common.lru_cache import LruCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.mark.describe(LruCache.__name__)
+class TestLruCache:
+    @pytest.mark.it("Should return a cached value (hit)")
+    def test_get_hit(self, faker: Faker) -> None:
+        # given
+        sut = LruCache[str, str](2)
+        key, value = faker.pystr(), faker.pystr()
+        sut.set(key, value)
+
+        # when
+        result = sut.get(key)
+
+        # then
+        assert result == value
+        assert sut.info().hits == 1
+        assert sut.info().misses == 0
+
+    @pytest.mark.it("Should return none for an unknown key (miss)")
+    def test_get_miss(self, faker: Faker) -> None:
+        # given
+        sut = LruCache[str, str](2)
+
+        # when
+        result = sut.get(faker.pystr())
+
+        # then
+        assert result is None
+        assert sut.info().hits == 0
+        assert sut.info().misses == 1
+
+    @pytest.mark.it("Should evict the least recently used entry")
+    def test_evict(self) -> None:
+        # given
+        max_size = 2
+        sut = LruCache[str, str](max_size)
+        sut.set("a", "1")
+        sut.set("b", "2")
+        sut.get("a")
+
+        # when
+        sut.set("c", "3")
+
+        # then
+        assert sut.get("a") == "1"
+        assert sut.get("b") is None
+        assert sut.get("c") == "3"
+        assert sut.info().size == max_size
+
+    @pytest.mark.it("Should expire entries after the ttl")
+    def test_expire(self) -> None:
+        # given
+        clock = FakeClock()
+        sut = LruCache[str, str](2, ttl=10, clock=clock)
+        sut.set("a", "1")
+        sut.set("b", "2", ttl=20)
+
+        # when
+        clock.now = 15
+
+        # then
+        assert sut.get("a") is None
+        assert sut.get("b") == "2"
+        assert sut.info().size == 1
+
+    @pytest.mark.it("Should not store anything when max size is zero")
+    def test_disabled(self) -> None:
+        # given
+        sut = LruCache[str, str](0)
+
+        # when
+        sut.set("a", "1")
+
+        # then
+        assert sut.get("a") is None
+        assert sut.info().size == 0
+
+    @pytest.mark.it("Should delete and clear entries")
+    def test_delete_clear(self) -> None:
+        # given
+        sut = LruCache[str, str](2)
+        sut.set("a", "1")
+        sut.set("b", "2")
+
+        # when
+        sut.delete("a")
+
+        # then
+        assert sut.get("a") is None
+        assert sut.get("b") == "2"
+
+        # when
+        sut.clear()
+
+        # then
+        assert sut.info().size == 0
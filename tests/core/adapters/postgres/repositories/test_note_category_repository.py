@@ -12,6 +12,7 @@ from tests.core.builders.domain.entities.note_category_builder import (
     NoteCategoryBuilder,
 )
 from tests.core.helpers.core_database_client import CoreDatabaseClient
+from tests.helpers.connection_factory import connection_factory
 
 from src.common.adapters.errors import DatabaseError
 from src.core.adapters.postgres.repositories import (
@@ -29,7 +30,7 @@ class TestPostgresNoteCategoryRepository:
         pool: AsyncConnectionPool[AsyncConnection[DictRow]],
     ) -> None:
         # given
-        sut = PostgresNoteCategoryRepository(connection)
+        sut = PostgresNoteCategoryRepository(connection_factory(connection))
         database_client = CoreDatabaseClient(pool)
 
         # and
@@ -69,7 +70,7 @@ class TestPostgresNoteCategoryRepository:
         connection: AsyncConnection[DictRow],
     ) -> None:
         # given
-        sut = PostgresNoteCategoryRepository(connection)
+        sut = PostgresNoteCategoryRepository(connection_factory(connection))
 
         # and
         note_category = NoteCategoryBuilder().build()
@@ -80,3 +81,127 @@ class TestPostgresNoteCategoryRepository:
 
         # and
         assert isinstance(exc_info.value.error, errors.ForeignKeyViolation)
+
+    @pytest.mark.it("Should create many note-categories in one statement")
+    async def test_create_many(
+        self,
+        connection: AsyncConnection[DictRow],
+        pool: AsyncConnectionPool[AsyncConnection[DictRow]],
+    ) -> None:
+        # given
+        sut = PostgresNoteCategoryRepository(connection_factory(connection))
+        database_client = CoreDatabaseClient(pool)
+
+        # and
+        user = UserBuilder().build()
+        note = NoteBuilder().with_user_id(user.id).build()
+        categories = [
+            CategoryBuilder().with_user_id(user.id).build() for _ in range(3)
+        ]
+        await database_client.create_user(user)
+        await database_client.create_note(note)
+        for category in categories:
+            await database_client.create_category(category)
+
+        # and
+        notes_categories = [
+            NoteCategoryBuilder()
+            .with_note_id(note.id)
+            .with_category_id(category.id)
+            .build()
+            for category in categories
+        ]
+
+        # when
+        await sut.create_many(notes_categories)
+
+        # and
+        await connection.commit()
+
+        # then
+        for note_category in notes_categories:
+            note_category_from_db = await database_client.select_note_category(
+                note_category.note_id,
+                note_category.category_id,
+            )
+            assert note_category_from_db == note_category
+
+    @pytest.mark.it("Should copy many note-categories")
+    async def test_copy_many(
+        self,
+        connection: AsyncConnection[DictRow],
+        pool: AsyncConnectionPool[AsyncConnection[DictRow]],
+    ) -> None:
+        # given
+        sut = PostgresNoteCategoryRepository(connection_factory(connection))
+        database_client = CoreDatabaseClient(pool)
+
+        # and
+        user = UserBuilder().build()
+        note = NoteBuilder().with_user_id(user.id).build()
+        categories = [
+            CategoryBuilder().with_user_id(user.id).build() for _ in range(3)
+        ]
+        await database_client.create_user(user)
+        await database_client.create_note(note)
+        for category in categories:
+            await database_client.create_category(category)
+
+        # and
+        notes_categories = [
+            NoteCategoryBuilder()
+            .with_note_id(note.id)
+            .with_category_id(category.id)
+            .build()
+            for category in categories
+        ]
+
+        # when
+        await sut.copy_many(notes_categories)
+
+        # and
+        await connection.commit()
+
+        # then
+        for note_category in notes_categories:
+            note_category_from_db = await database_client.select_note_category(
+                note_category.note_id,
+                note_category.category_id,
+            )
+            assert note_category_from_db == note_category
+
+    @pytest.mark.it("Should delete the note-categories of a note")
+    async def test_delete_by_note_id(
+        self,
+        connection: AsyncConnection[DictRow],
+        pool: AsyncConnectionPool[AsyncConnection[DictRow]],
+    ) -> None:
+        # given
+        sut = PostgresNoteCategoryRepository(connection_factory(connection))
+        database_client = CoreDatabaseClient(pool)
+
+        # and
+        user = UserBuilder().build()
+        note = NoteBuilder().with_user_id(user.id).build()
+        category = CategoryBuilder().with_user_id(user.id).build()
+        await database_client.create_user(user)
+        await database_client.create_note(note)
+        await database_client.create_category(category)
+
+        # and
+        await database_client.create_note_category(
+            NoteCategoryBuilder()
+            .with_note_id(note.id)
+            .with_category_id(category.id)
+            .build()
+        )
+
+        # when
+        await sut.delete_by_note_id(note.id)
+
+        # and
+        await connection.commit()
+
+        # then
+        category_ids = await database_client.select_note_category_ids(note.id)
+        assert category_ids == []
@@ -1,5 +1,6 @@
+from datetime import timedelta
 from typing import cast
-from uuid import UUID
+from uuid import UUID, uuid4
 
 import pytest
 from faker import Faker
@@ -12,11 +13,14 @@ from tests.core.builders.domain.entities.category_builder import (
     CategoryBuilder,
 )
 from tests.core.helpers.core_database_client import CoreDatabaseClient
+from tests.helpers.connection_factory import connection_factory
 
 from src.common.adapters.errors import DatabaseError
+from src.common.datetime import Datetime
 from src.core.adapters.postgres.repositories import (
     PostgresCategoryRepository,
 )
+from src.core.ports.repositories.change_key import ChangeKey
 
 
 @pytest.mark.describe(PostgresCategoryRepository.__name__)
@@ -29,7 +33,7 @@ class TestPostgresCategoryRepository:
         pool: AsyncConnectionPool[AsyncConnection[DictRow]],
     ) -> None:
         # given
-        sut = PostgresCategoryRepository(connection)
+        sut = PostgresCategoryRepository(connection_factory(connection))
         database_client = CoreDatabaseClient(pool)
 
         # and
@@ -55,7 +59,7 @@ class TestPostgresCategoryRepository:
         connection: AsyncConnection[DictRow],
     ) -> None:
         # given
-        sut = PostgresCategoryRepository(connection)
+        sut = PostgresCategoryRepository(connection_factory(connection))
 
         # and
         category = CategoryBuilder().build()
@@ -74,7 +78,7 @@ class TestPostgresCategoryRepository:
         pool: AsyncConnectionPool[AsyncConnection[DictRow]],
     ) -> None:
         # given
-        sut = PostgresCategoryRepository(connection)
+        sut = PostgresCategoryRepository(connection_factory(connection))
         database_client = CoreDatabaseClient(pool)
 
         # and
@@ -110,7 +114,7 @@ class TestPostgresCategoryRepository:
         pool: AsyncConnectionPool[AsyncConnection[DictRow]],
     ) -> None:
         # given
-        sut = PostgresCategoryRepository(connection)
+        sut = PostgresCategoryRepository(connection_factory(connection))
         database_client = CoreDatabaseClient(pool)
 
         # and
@@ -138,7 +142,7 @@ class TestPostgresCategoryRepository:
         pool: AsyncConnectionPool[AsyncConnection[DictRow]],
     ) -> None:
         # given
-        sut = PostgresCategoryRepository(connection)
+        sut = PostgresCategoryRepository(connection_factory(connection))
         database_client = CoreDatabaseClient(pool)
 
         # and
@@ -166,7 +170,7 @@ class TestPostgresCategoryRepository:
         faker: Faker,
     ) -> None:
         # given
-        sut = PostgresCategoryRepository(connection)
+        sut = PostgresCategoryRepository(connection_factory(connection))
 
         # and
         category_id = cast(UUID, faker.random_int())
@@ -177,3 +181,201 @@ class TestPostgresCategoryRepository:
 
         # and
         assert isinstance(exc_info.value.error, errors.ProgrammingError)
+
+    @pytest.mark.it("Should create a category if it does not exist")
+    async def test_create_if_not_exists(
+        self,
+        connection: AsyncConnection[DictRow],
+        pool: AsyncConnectionPool[AsyncConnection[DictRow]],
+    ) -> None:
+        # given
+        sut = PostgresCategoryRepository(connection_factory(connection))
+        database_client = CoreDatabaseClient(pool)
+
+        # and
+        user = UserBuilder().build()
+        await database_client.create_user(user)
+
+        # and
+        category = CategoryBuilder().with_user_id(user.id).build()
+
+        # when
+        created = await sut.create_if_not_exists(category)
+
+        # and
+        await connection.commit()
+
+        # then
+        assert created
+
+        # and
+        category_from_db = await database_client.select_category(category.id)
+        assert category_from_db == category
+
+    @pytest.mark.it("Should not create a category if the name is in use")
+    async def test_not_create_if_exists(
+        self,
+        connection: AsyncConnection[DictRow],
+        pool: AsyncConnectionPool[AsyncConnection[DictRow]],
+    ) -> None:
+        # given
+        sut = PostgresCategoryRepository(connection_factory(connection))
+        database_client = CoreDatabaseClient(pool)
+
+        # and
+        user = UserBuilder().build()
+        await database_client.create_user(user)
+
+        # and
+        category = CategoryBuilder().with_user_id(user.id).build()
+        await database_client.create_category(category)
+
+        # and
+        another_category = (
+            CategoryBuilder()
+            .with_user_id(user.id)
+            .with_name(category.name.upper())
+            .build()
+        )
+
+        # when
+        created = await sut.create_if_not_exists(another_category)
+
+        # and
+        await connection.commit()
+
+        # then
+        assert not created
+
+        # and
+        category_from_db = await database_client.select_category(
+            another_category.id,
+        )
+        assert category_from_db is None
+
+    @pytest.mark.it("Should keep only the category ids owned by the user")
+    async def test_filter_owned_ids(
+        self,
+        connection: AsyncConnection[DictRow],
+        pool: AsyncConnectionPool[AsyncConnection[DictRow]],
+    ) -> None:
+        # given
+        sut = PostgresCategoryRepository(connection_factory(connection))
+        database_client = CoreDatabaseClient(pool)
+
+        # and
+        user = UserBuilder().build()
+        another_user = UserBuilder().build()
+        await database_client.create_user(user)
+        await database_client.create_user(another_user)
+
+        # and
+        category = CategoryBuilder().with_user_id(user.id).build()
+        another_category = (
+            CategoryBuilder().with_user_id(another_user.id).build()
+        )
+        await database_client.create_category(category)
+        await database_client.create_category(another_category)
+
+        # when
+        result = await sut.filter_owned_ids(
+            [category.id, another_category.id, uuid4()],
+            user.id,
+        )
+
+        # then
+        assert result == [category.id]
+
+    @pytest.mark.it(
+        "Should find the changes of a user in commit order, "
+        "whatever their timestamps"
+    )
+    async def test_find_changes(
+        self,
+        connection: AsyncConnection[DictRow],
+        pool: AsyncConnectionPool[AsyncConnection[DictRow]],
+    ) -> None:
+        # given
+        sut = PostgresCategoryRepository(connection_factory(connection))
+        database_client = CoreDatabaseClient(pool)
+
+        # and
+        user = UserBuilder().build()
+        another_user = UserBuilder().build()
+        await database_client.create_user(user)
+        await database_client.create_user(another_user)
+
+        # and
+        now = Datetime.now()
+        categories = [
+            CategoryBuilder()
+            .with_user_id(user.id)
+            .with_updated_at(now - timedelta(days=index))
+            .build()
+            for index in range(5)
+        ]
+        for category in categories:
+            await database_client.create_category(category)
+        await database_client.create_category(
+            CategoryBuilder().with_user_id(another_user.id).build(),
+        )
+
+        # when
+        first_page = await sut.find_changes(user.id, 3)
+        last = first_page[-1]
+        second_page = await sut.find_changes(
+            user.id,
+            3,
+            ChangeKey(change_id=last.change_id, id=last.id),
+        )
+
+        # then
+        changes = [*first_page, *second_page]
+        assert [
+            category.model_dump(exclude={"change_id"}) for category in changes
+        ] == [category.model_dump() for category in categories]
+
+    @pytest.mark.it("Should suggest the categories of a user by name")
+    async def test_autocomplete(
+        self,
+        connection: AsyncConnection[DictRow],
+        pool: AsyncConnectionPool[AsyncConnection[DictRow]],
+    ) -> None:
+        # given
+        sut = PostgresCategoryRepository(connection_factory(connection))
+        database_client = CoreDatabaseClient(pool)
+
+        # and
+        user = UserBuilder().build()
+        another_user = UserBuilder().build()
+        await database_client.create_user(user)
+        await database_client.create_user(another_user)
+
+        # and
+        for name in ("Work", "Homework", "Workouts", "w_rk"):
+            await database_client.create_category(
+                CategoryBuilder()
+                .with_user_id(user.id)
+                .with_name(name)
+                .build(),
+            )
+        await database_client.create_category(
+            CategoryBuilder()
+            .with_user_id(another_user.id)
+            .with_name("Work")
+            .build(),
+        )
+
+        # when
+        prefix = await sut.autocomplete(user.id, "wor", 10)
+        substring = await sut.autocomplete(user.id, "work", 10, substring=True)
+        wildcard = await sut.autocomplete(user.id, "w_", 10)
+
+        # then
+        assert [category.name for category in prefix] == ["Work", "Workouts"]
+        assert [category.name for category in substring] == [
+            "Work",
+            "Workouts",
+            "Homework",
+        ]
+        assert [category.name for category in wildcard] == ["w_rk"]
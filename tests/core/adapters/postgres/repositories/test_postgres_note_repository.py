@@ -1,5 +1,6 @@
+from datetime import timedelta
 from typing import cast
-from uuid import UUID
+from uuid import UUID, uuid4
 
 import pytest
 from faker import Faker
@@ -8,13 +9,27 @@ from psycopg.rows import DictRow
 from psycopg_pool import AsyncConnectionPool
 
 from tests.auth.builders.domain.entities.user_builder import UserBuilder
+from tests.core.builders.domain.entities.category_builder import (
+    CategoryBuilder,
+)
 from tests.core.builders.domain.entities.note_builder import NoteBuilder
+from tests.core.builders.domain.entities.note_category_builder import (
+    NoteCategoryBuilder,
+)
 from tests.core.helpers.core_database_client import CoreDatabaseClient
+from tests.helpers.connection_factory import connection_factory
 
 from src.common.adapters.errors import DatabaseError
+from src.common.datetime import Datetime
 from src.core.adapters.postgres.repositories import (
     PostgresNoteRepository,
 )
+from src.core.domain.entities import Note
+from src.core.ports.repositories.change_key import ChangeKey
+from src.core.ports.repositories.note_repository import (
+    NotePageKey,
+    NoteSearchKey,
+)
 
 
 @pytest.mark.describe(PostgresNoteRepository.__name__)
@@ -27,7 +42,7 @@ class TestPostgresNoteRepository:
         pool: AsyncConnectionPool[AsyncConnection[DictRow]],
     ) -> None:
         # given
-        sut = PostgresNoteRepository(connection)
+        sut = PostgresNoteRepository(connection_factory(connection))
         database_client = CoreDatabaseClient(pool)
 
         # and
@@ -47,13 +62,47 @@ class TestPostgresNoteRepository:
         note_from_db = await database_client.select_note(note.id)
         assert note_from_db == note
 
+    @pytest.mark.it("Should copy many notes")
+    async def test_copy_many(
+        self,
+        connection: AsyncConnection[DictRow],
+        pool: AsyncConnectionPool[AsyncConnection[DictRow]],
+    ) -> None:
+        # given
+        sut = PostgresNoteRepository(connection_factory(connection))
+        database_client = CoreDatabaseClient(pool)
+
+        # and
+        user = UserBuilder().build()
+        await database_client.create_user(user)
+
+        # and
+        notes = [
+            NoteBuilder().with_user_id(user.id).build(),
+            NoteBuilder()
+            .with_user_id(user.id)
+            .with_content("tab\tnewline\nbackslash\\ \\N")
+            .build(),
+        ]
+
+        # when
+        await sut.copy_many(notes)
+
+        # and
+        await connection.commit()
+
+        # then
+        for note in notes:
+            note_from_db = await database_client.select_note(note.id)
+            assert note_from_db == note
+
     @pytest.mark.it("Should not create note if user does not exist")
     async def test_not_create_foreign_key_violation(
         self,
         connection: AsyncConnection[DictRow],
     ) -> None:
         # given
-        sut = PostgresNoteRepository(connection)
+        sut = PostgresNoteRepository(connection_factory(connection))
 
         # and
         note = NoteBuilder().build()
@@ -72,7 +121,7 @@ class TestPostgresNoteRepository:
         pool: AsyncConnectionPool[AsyncConnection[DictRow]],
     ) -> None:
         # given
-        sut = PostgresNoteRepository(connection)
+        sut = PostgresNoteRepository(connection_factory(connection))
         database_client = CoreDatabaseClient(pool)
 
         # and
@@ -105,7 +154,7 @@ class TestPostgresNoteRepository:
         pool: AsyncConnectionPool[AsyncConnection[DictRow]],
     ) -> None:
         # given
-        sut = PostgresNoteRepository(connection)
+        sut = PostgresNoteRepository(connection_factory(connection))
         database_client = CoreDatabaseClient(pool)
 
         # and
@@ -133,7 +182,7 @@ class TestPostgresNoteRepository:
         pool: AsyncConnectionPool[AsyncConnection[DictRow]],
     ) -> None:
         # given
-        sut = PostgresNoteRepository(connection)
+        sut = PostgresNoteRepository(connection_factory(connection))
         database_client = CoreDatabaseClient(pool)
 
         # and
@@ -161,7 +210,7 @@ class TestPostgresNoteRepository:
         faker: Faker,
     ) -> None:
         # given
-        sut = PostgresNoteRepository(connection)
+        sut = PostgresNoteRepository(connection_factory(connection))
 
         # and
         note_id = cast(UUID, faker.random_int())
@@ -172,3 +221,648 @@ class TestPostgresNoteRepository:
 
         # and
         assert isinstance(exc_info.value.error, errors.ProgrammingError)
+
+    @pytest.mark.it("Should find an owned note with its categories")
+    async def test_find_by_id(
+        self,
+        connection: AsyncConnection[DictRow],
+        pool: AsyncConnectionPool[AsyncConnection[DictRow]],
+    ) -> None:
+        # given
+        sut = PostgresNoteRepository(connection_factory(connection))
+        database_client = CoreDatabaseClient(pool)
+
+        # and
+        user = UserBuilder().build()
+        await database_client.create_user(user)
+
+        # and
+        note = NoteBuilder().with_user_id(user.id).build()
+        await database_client.create_note(note)
+
+        # and
+        categories = [
+            CategoryBuilder().with_user_id(user.id).build() for _ in range(2)
+        ]
+        for category in categories:
+            await database_client.create_category(category)
+            await database_client.create_note_category(
+                NoteCategoryBuilder()
+                .with_note_id(note.id)
+                .with_category_id(category.id)
+                .build()
+            )
+
+        # when
+        result = await sut.find_by_id(note.id, user.id)
+
+        # then
+        assert result is not None
+        assert Note.model_validate(result.model_dump()) == note
+
+        # and
+        assert result.category_ids == sorted(
+            category.id for category in categories
+        )
+
+    @pytest.mark.it("Should not find a note owned by another user")
+    async def test_not_find_by_id(
+        self,
+        connection: AsyncConnection[DictRow],
+        pool: AsyncConnectionPool[AsyncConnection[DictRow]],
+    ) -> None:
+        # given
+        sut = PostgresNoteRepository(connection_factory(connection))
+        database_client = CoreDatabaseClient(pool)
+
+        # and
+        user = UserBuilder().build()
+        await database_client.create_user(user)
+
+        # and
+        note = NoteBuilder().with_user_id(user.id).build()
+        await database_client.create_note(note)
+
+        # when
+        result = await sut.find_by_id(note.id, uuid4())
+
+        # then
+        assert result is None
+
+    @pytest.mark.it("Should update an owned note")
+    async def test_update_owned(
+        self,
+        connection: AsyncConnection[DictRow],
+        pool: AsyncConnectionPool[AsyncConnection[DictRow]],
+    ) -> None:
+        # given
+        sut = PostgresNoteRepository(connection_factory(connection))
+        database_client = CoreDatabaseClient(pool)
+
+        # and
+        user = UserBuilder().build()
+        await database_client.create_user(user)
+
+        # and
+        note = NoteBuilder().with_user_id(user.id).build()
+        await database_client.create_note(note)
+
+        # and
+        note_to_update = (
+            NoteBuilder().with_id(note.id).with_user_id(user.id).build()
+        )
+
+        # when
+        result = await sut.update_owned(note_to_update)
+
+        # and
+        await connection.commit()
+
+        # then
+        note_from_db = await database_client.select_note(note.id)
+        assert note_from_db is not None
+        assert result == note_from_db
+
+        # and
+        assert note_from_db.title == note_to_update.title
+        assert note_from_db.content == note_to_update.content
+        assert note_from_db.created_at == note.created_at
+
+    @pytest.mark.it("Should not update a note owned by another user")
+    async def test_not_update_owned(
+        self,
+        connection: AsyncConnection[DictRow],
+        pool: AsyncConnectionPool[AsyncConnection[DictRow]],
+    ) -> None:
+        # given
+        sut = PostgresNoteRepository(connection_factory(connection))
+        database_client = CoreDatabaseClient(pool)
+
+        # and
+        user = UserBuilder().build()
+        await database_client.create_user(user)
+
+        # and
+        note = NoteBuilder().with_user_id(user.id).build()
+        await database_client.create_note(note)
+
+        # and
+        note_to_update = NoteBuilder().with_id(note.id).build()
+
+        # when
+        result = await sut.update_owned(note_to_update)
+
+        # and
+        await connection.commit()
+
+        # then
+        assert result is None
+
+        # and
+        note_from_db = await database_client.select_note(note.id)
+        assert note_from_db == note
+
+    @pytest.mark.it("Should update an owned note at an expected version")
+    async def test_update_owned_expected_version(
+        self,
+        connection: AsyncConnection[DictRow],
+        pool: AsyncConnectionPool[AsyncConnection[DictRow]],
+    ) -> None:
+        # given
+        sut = PostgresNoteRepository(connection_factory(connection))
+        database_client = CoreDatabaseClient(pool)
+
+        # and
+        user = UserBuilder().build()
+        await database_client.create_user(user)
+
+        # and
+        note = NoteBuilder().with_user_id(user.id).build()
+        await database_client.create_note(note)
+
+        # and
+        note_to_update = (
+            NoteBuilder()
+            .with_id(note.id)
+            .with_user_id(user.id)
+            .with_updated_at(note.updated_at)
+            .build()
+        )
+
+        # when
+        result = await sut.update_owned(note_to_update, [note.updated_at])
+
+        # and
+        await connection.commit()
+
+        # then
+        note_from_db = await database_client.select_note(note.id)
+        assert note_from_db is not None
+        assert result == note_from_db
+
+        # and
+        assert note_from_db.title == note_to_update.title
+        assert note_from_db.updated_at > note.updated_at
+
+    @pytest.mark.it("Should not update a note at an unexpected version")
+    async def test_not_update_owned_unexpected_version(
+        self,
+        connection: AsyncConnection[DictRow],
+        pool: AsyncConnectionPool[AsyncConnection[DictRow]],
+    ) -> None:
+        # given
+        sut = PostgresNoteRepository(connection_factory(connection))
+        database_client = CoreDatabaseClient(pool)
+
+        # and
+        user = UserBuilder().build()
+        await database_client.create_user(user)
+
+        # and
+        note = NoteBuilder().with_user_id(user.id).build()
+        await database_client.create_note(note)
+
+        # and
+        note_to_update = (
+            NoteBuilder().with_id(note.id).with_user_id(user.id).build()
+        )
+
+        # when
+        result = await sut.update_owned(
+            note_to_update,
+            [note.updated_at - timedelta(seconds=1)],
+        )
+
+        # and
+        await connection.commit()
+
+        # then
+        assert result is None
+
+        # and
+        note_from_db = await database_client.select_note(note.id)
+        assert note_from_db == note
+
+    @pytest.mark.it("Should delete an owned note")
+    async def test_delete_owned(
+        self,
+        connection: AsyncConnection[DictRow],
+        pool: AsyncConnectionPool[AsyncConnection[DictRow]],
+    ) -> None:
+        # given
+        sut = PostgresNoteRepository(connection_factory(connection))
+        database_client = CoreDatabaseClient(pool)
+
+        # and
+        user = UserBuilder().build()
+        await database_client.create_user(user)
+
+        # and
+        note = NoteBuilder().with_user_id(user.id).build()
+        await database_client.create_note(note)
+
+        # when
+        result = await sut.delete_owned(note.id, user.id)
+
+        # and
+        await connection.commit()
+
+        # then
+        assert result is True
+
+        # and
+        note_from_db = await database_client.select_note(note.id)
+        assert note_from_db is None
+
+    @pytest.mark.it("Should not delete a note owned by another user")
+    async def test_not_delete_owned(
+        self,
+        connection: AsyncConnection[DictRow],
+        pool: AsyncConnectionPool[AsyncConnection[DictRow]],
+    ) -> None:
+        # given
+        sut = PostgresNoteRepository(connection_factory(connection))
+        database_client = CoreDatabaseClient(pool)
+
+        # and
+        user = UserBuilder().build()
+        await database_client.create_user(user)
+
+        # and
+        note = NoteBuilder().with_user_id(user.id).build()
+        await database_client.create_note(note)
+
+        # when
+        result = await sut.delete_owned(note.id, uuid4())
+
+        # and
+        await connection.commit()
+
+        # then
+        assert result is False
+
+        # and
+        note_from_db = await database_client.select_note(note.id)
+        assert note_from_db == note
+
+    @pytest.mark.it("Should page the notes of a user by (updated_at, id)")
+    async def test_find_page(
+        self,
+        connection: AsyncConnection[DictRow],
+        pool: AsyncConnectionPool[AsyncConnection[DictRow]],
+    ) -> None:
+        # given
+        sut = PostgresNoteRepository(connection_factory(connection))
+        database_client = CoreDatabaseClient(pool)
+
+        # and
+        user = UserBuilder().build()
+        another_user = UserBuilder().build()
+        await database_client.create_user(user)
+        await database_client.create_user(another_user)
+
+        # and
+        now = Datetime.now()
+        notes = [
+            NoteBuilder()
+            .with_user_id(user.id)
+            .with_updated_at(now - timedelta(minutes=index // 2))
+            .build()
+            for index in range(5)
+        ]
+        for note in notes:
+            await database_client.create_note(note)
+        await database_client.create_note(
+            NoteBuilder().with_user_id(another_user.id).build(),
+        )
+
+        # and
+        category = CategoryBuilder().with_user_id(user.id).build()
+        await database_client.create_category(category)
+        await database_client.create_note_category(
+            NoteCategoryBuilder()
+            .with_note_id(notes[0].id)
+            .with_category_id(category.id)
+            .build()
+        )
+
+        # and
+        expected = sorted(
+            notes,
+            key=lambda note: (note.updated_at, note.id),
+            reverse=True,
+        )
+
+        # when
+        first_page = await sut.find_page(user.id, 3)
+        last = first_page[-1]
+        second_page = await sut.find_page(
+            user.id,
+            3,
+            NotePageKey(updated_at=last.updated_at, id=last.id),
+        )
+
+        # then
+        pages = [*first_page, *second_page]
+        assert [note.id for note in pages] == [note.id for note in expected]
+
+        # and
+        categories_by_note = {note.id: note.category_ids for note in pages}
+        assert categories_by_note[notes[0].id] == [category.id]
+        assert categories_by_note[notes[1].id] == []
+
+    @pytest.mark.it(
+        "Should find the changes of a user in commit order, "
+        "whatever their timestamps"
+    )
+    async def test_find_changes(
+        self,
+        connection: AsyncConnection[DictRow],
+        pool: AsyncConnectionPool[AsyncConnection[DictRow]],
+    ) -> None:
+        # given
+        sut = PostgresNoteRepository(connection_factory(connection))
+        database_client = CoreDatabaseClient(pool)
+
+        # and
+        user = UserBuilder().build()
+        another_user = UserBuilder().build()
+        await database_client.create_user(user)
+        await database_client.create_user(another_user)
+
+        # and
+        now = Datetime.now()
+        notes = [
+            NoteBuilder()
+            .with_user_id(user.id)
+            .with_updated_at(now - timedelta(days=index))
+            .build()
+            for index in range(5)
+        ]
+        for note in notes:
+            await database_client.create_note(note)
+        await database_client.create_note(
+            NoteBuilder().with_user_id(another_user.id).build(),
+        )
+
+        # and
+        category = CategoryBuilder().with_user_id(user.id).build()
+        await database_client.create_category(category)
+        await database_client.create_note_category(
+            NoteCategoryBuilder()
+            .with_note_id(notes[0].id)
+            .with_category_id(category.id)
+            .build()
+        )
+
+        # when
+        first_page = await sut.find_changes(user.id, 3)
+        last = first_page[-1]
+        second_page = await sut.find_changes(
+            user.id,
+            3,
+            ChangeKey(change_id=last.change_id, id=last.id),
+        )
+
+        # then
+        changes = [*first_page, *second_page]
+        assert [note.id for note in changes] == [note.id for note in notes]
+
+        # and
+        changed = next(note for note in changes if note.id == notes[0].id)
+        assert changed.category_ids == [category.id]
+
+    @pytest.mark.it(
+        "Should hold back changes committed after an older one in flight"
+    )
+    async def test_find_changes_in_flight(
+        self,
+        connection: AsyncConnection[DictRow],
+        pool: AsyncConnectionPool[AsyncConnection[DictRow]],
+    ) -> None:
+        # given
+        sut = PostgresNoteRepository(connection_factory(connection))
+        database_client = CoreDatabaseClient(pool)
+
+        # and
+        user = UserBuilder().build()
+        await database_client.create_user(user)
+
+        # and
+        in_flight = NoteBuilder().with_user_id(user.id).build()
+        committed = NoteBuilder().with_user_id(user.id).build()
+        async with pool.connection() as writer:
+            await PostgresNoteRepository(connection_factory(writer)).create(
+                in_flight,
+            )
+            await database_client.create_note(committed)
+
+            # when
+            held_back = await sut.find_changes(user.id, 10)
+
+        # and
+        settled = await sut.find_changes(user.id, 10)
+
+        # then
+        assert held_back == []
+        assert [note.id for note in settled] == [in_flight.id, committed.id]
+
+    @pytest.mark.it("Should search the notes of a user, best matches first")
+    async def test_search(
+        self,
+        connection: AsyncConnection[DictRow],
+        pool: AsyncConnectionPool[AsyncConnection[DictRow]],
+    ) -> None:
+        # given
+        sut = PostgresNoteRepository(connection_factory(connection))
+        database_client = CoreDatabaseClient(pool)
+
+        # and
+        user = UserBuilder().build()
+        another_user = UserBuilder().build()
+        await database_client.create_user(user)
+        await database_client.create_user(another_user)
+
+        # and
+        in_title = (
+            NoteBuilder()
+            .with_user_id(user.id)
+            .with_title("Postgres tuning")
+            .with_content("Notes about indexes")
+            .build()
+        )
+        in_content = (
+            NoteBuilder()
+            .with_user_id(user.id)
+            .with_title("Database")
+            .with_content("How to tune postgres for full text search")
+            .build()
+        )
+        unrelated = (
+            NoteBuilder()
+            .with_user_id(user.id)
+            .with_title("Groceries")
+            .with_content("Milk and eggs")
+            .build()
+        )
+        another_users = (
+            NoteBuilder()
+            .with_user_id(another_user.id)
+            .with_title("Postgres")
+            .with_content("Postgres")
+            .build()
+        )
+        for note in (in_title, in_content, unrelated, another_users):
+            await database_client.create_note(note)
+
+        # when
+        first_page = await sut.search(user.id, "postgres", 1)
+        last = first_page[-1]
+        second_page = await sut.search(
+            user.id,
+            "postgres",
+            1,
+            NoteSearchKey(rank=last.rank, id=last.id),
+        )
+        third_page = await sut.search(
+            user.id,
+            "postgres",
+            1,
+            NoteSearchKey(rank=second_page[-1].rank, id=second_page[-1].id),
+        )
+
+        # then
+        assert [result.id for result in first_page] == [in_title.id]
+        assert [result.id for result in second_page] == [in_content.id]
+        assert third_page == []
+
+        # and
+        assert first_page[0].rank > second_page[0].rank
+        assert "<mark>postgres</mark>" in second_page[0].headline
+        assert second_page[0].title == in_content.title
+
+    @pytest.mark.it("Should suggest the titles of a user by prefix")
+    async def test_autocomplete_prefix(
+        self,
+        connection: AsyncConnection[DictRow],
+        pool: AsyncConnectionPool[AsyncConnection[DictRow]],
+    ) -> None:
+        # given
+        sut = PostgresNoteRepository(connection_factory(connection))
+        database_client = CoreDatabaseClient(pool)
+
+        # and
+        user = UserBuilder().build()
+        another_user = UserBuilder().build()
+        await database_client.create_user(user)
+        await database_client.create_user(another_user)
+
+        # and
+        titles = ["Postgres tuning", "post", "Compost", "100% Postgres"]
+        notes = [
+            NoteBuilder().with_user_id(user.id).with_title(title).build()
+            for title in titles
+        ]
+        for note in notes:
+            await database_client.create_note(note)
+        await database_client.create_note(
+            NoteBuilder()
+            .with_user_id(another_user.id)
+            .with_title("Post")
+            .build(),
+        )
+
+        # when
+        result = await sut.autocomplete(user.id, "POST", 10)
+
+        # then
+        assert [suggestion.title for suggestion in result] == [
+            "post",
+            "Postgres tuning",
+        ]
+
+    @pytest.mark.it("Should suggest the titles of a user by substring")
+    async def test_autocomplete_substring(
+        self,
+        connection: AsyncConnection[DictRow],
+        pool: AsyncConnectionPool[AsyncConnection[DictRow]],
+    ) -> None:
+        # given
+        sut = PostgresNoteRepository(connection_factory(connection))
+        database_client = CoreDatabaseClient(pool)
+
+        # and
+        user = UserBuilder().build()
+        await database_client.create_user(user)
+
+        # and
+        titles = ["Postgres tuning", "post", "Compost", "100% Postgres"]
+        for title in titles:
+            await database_client.create_note(
+                NoteBuilder().with_user_id(user.id).with_title(title).build(),
+            )
+
+        # when
+        result = await sut.autocomplete(user.id, "post", 3, substring=True)
+
+        # then
+        assert [suggestion.title for suggestion in result] == [
+            "post",
+            "Postgres tuning",
+            "Compost",
+        ]
+
+        # and
+        escaped = await sut.autocomplete(user.id, "0% P", 10, substring=True)
+        assert [suggestion.title for suggestion in escaped] == [
+            "100% Postgres",
+        ]
+
+    @pytest.mark.it("Should stream the notes of a user in batches")
+    async def test_stream(
+        self,
+        connection: AsyncConnection[DictRow],
+        pool: AsyncConnectionPool[AsyncConnection[DictRow]],
+    ) -> None:
+        # given
+        sut = PostgresNoteRepository(connection_factory(connection))
+        sut.stream_size = 2
+        database_client = CoreDatabaseClient(pool)
+
+        # and
+        user = UserBuilder().build()
+        another_user = UserBuilder().build()
+        await database_client.create_user(user)
+        await database_client.create_user(another_user)
+
+        # and
+        now = Datetime.now()
+        notes = [
+            NoteBuilder()
+            .with_user_id(user.id)
+            .with_updated_at(now - timedelta(minutes=index))
+            .build()
+            for index in range(5)
+        ]
+        for note in notes:
+            await database_client.create_note(note)
+        await database_client.create_note(
+            NoteBuilder().with_user_id(another_user.id).build(),
+        )
+
+        # and
+        category = CategoryBuilder().with_user_id(user.id).build()
+        await database_client.create_category(category)
+        await database_client.create_note_category(
+            NoteCategoryBuilder()
+            .with_note_id(notes[0].id)
+            .with_category_id(category.id)
+            .build()
+        )
+
+        # when
+        result = [note async for note in sut.stream(user.id)]
+
+        # then
+        assert [note.id for note in result] == [note.id for note in notes]
+        assert result[0].category_ids == [category.id]
@@ -0,0 +1,173 @@
+from datetime import timedelta
+
+import pytest
+from psycopg import AsyncConnection
+from psycopg.rows import DictRow
+from psycopg_pool import AsyncConnectionPool
+
+from tests.auth.builders.domain.entities.user_builder import UserBuilder
+from tests.core.builders.domain.entities.category_builder import (
+    CategoryBuilder,
+)
+from tests.core.builders.domain.entities.note_builder import NoteBuilder
+from tests.core.builders.domain.entities.tombstone_builder import (
+    TombstoneBuilder,
+)
+from tests.core.helpers.core_database_client import CoreDatabaseClient
+from tests.helpers.connection_factory import connection_factory
+
+from src.common.datetime import Datetime
+from src.core.adapters.postgres.repositories import (
+    PostgresTombstoneRepository,
+)
+from src.core.domain.entities import TombstoneEntityEnum
+from src.core.ports.repositories.change_key import ChangeKey
+
+
+@pytest.mark.describe(PostgresTombstoneRepository.__name__)
+@pytest.mark.anyio(scope="class")
+class TestPostgresTombstoneRepository:
+    @pytest.mark.it(
+        "Should find the deletions of a user in commit order, "
+        "whatever their timestamps"
+    )
+    async def test_find_changes(
+        self,
+        connection: AsyncConnection[DictRow],
+        pool: AsyncConnectionPool[AsyncConnection[DictRow]],
+    ) -> None:
+        # given
+        sut = PostgresTombstoneRepository(connection_factory(connection))
+        database_client = CoreDatabaseClient(pool)
+
+        # and
+        user = UserBuilder().build()
+        another_user = UserBuilder().build()
+        await database_client.create_user(user)
+        await database_client.create_user(another_user)
+
+        # and
+        now = Datetime.now()
+        tombstones = [
+            TombstoneBuilder()
+            .with_user_id(user.id)
+            .with_deleted_at(now - timedelta(days=index))
+            .build()
+            for index in range(5)
+        ]
+        for tombstone in tombstones:
+            await database_client.create_tombstone(tombstone)
+        for builder in [
+            TombstoneBuilder()
+            .with_user_id(user.id)
+            .with_entity(TombstoneEntityEnum.categories),
+            TombstoneBuilder().with_user_id(another_user.id),
+        ]:
+            await database_client.create_tombstone(builder.build())
+
+        # when
+        first_page = await sut.find_changes(
+            user.id,
+            TombstoneEntityEnum.notes,
+            3,
+        )
+        last = first_page[-1]
+        second_page = await sut.find_changes(
+            user.id,
+            TombstoneEntityEnum.notes,
+            3,
+            ChangeKey(change_id=last.change_id, id=last.id),
+        )
+
+        # then
+        changes = [*first_page, *second_page]
+        assert [
+            tombstone.model_dump(exclude={"change_id"})
+            for tombstone in changes
+        ] == [
+            tombstone.model_dump(exclude={"change_id"})
+            for tombstone in tombstones
+        ]
+
+    @pytest.mark.it("Should record a tombstone when a note is deleted")
+    async def test_record_note_tombstone(
+        self,
+        pool: AsyncConnectionPool[AsyncConnection[DictRow]],
+    ) -> None:
+        # given
+        database_client = CoreDatabaseClient(pool)
+
+        # and
+        user = UserBuilder().build()
+        note = NoteBuilder().with_user_id(user.id).build()
+        await database_client.create_user(user)
+        await database_client.create_note(note)
+
+        # when
+        await database_client.query(
+            "DELETE FROM notes WHERE id = %s;",
+            [note.id],
+        )
+
+        # then
+        tombstone = await database_client.select_tombstone(
+            TombstoneEntityEnum.notes,
+            note.id,
+        )
+        assert tombstone is not None
+        assert tombstone.user_id == user.id
+
+    @pytest.mark.it("Should record a tombstone when a category is deleted")
+    async def test_record_category_tombstone(
+        self,
+        pool: AsyncConnectionPool[AsyncConnection[DictRow]],
+    ) -> None:
+        # given
+        database_client = CoreDatabaseClient(pool)
+
+        # and
+        user = UserBuilder().build()
+        category = CategoryBuilder().with_user_id(user.id).build()
+        await database_client.create_user(user)
+        await database_client.create_category(category)
+
+        # when
+        await database_client.query(
+            "DELETE FROM categories WHERE id = %s;",
+            [category.id],
+        )
+
+        # then
+        tombstone = await database_client.select_tombstone(
+            TombstoneEntityEnum.categories,
+            category.id,
+        )
+        assert tombstone is not None
+        assert tombstone.user_id == user.id
+
+    @pytest.mark.it("Should not record tombstones when a user is deleted")
+    async def test_not_record_tombstones_of_deleted_user(
+        self,
+        pool: AsyncConnectionPool[AsyncConnection[DictRow]],
+    ) -> None:
+        # given
+        database_client = CoreDatabaseClient(pool)
+
+        # and
+        user = UserBuilder().build()
+        note = NoteBuilder().with_user_id(user.id).build()
+        await database_client.create_user(user)
+        await database_client.create_note(note)
+
+        # when
+        await database_client.query(
+            "DELETE FROM users WHERE id = %s;",
+            [user.id],
+        )
+
+        # then
+        tombstone = await database_client.select_tombstone(
+            TombstoneEntityEnum.notes,
+            note.id,
+        )
+        assert tombstone is None
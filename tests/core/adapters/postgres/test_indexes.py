@@ -0,0 +1,307 @@
+import pytest
+from psycopg import AsyncConnection, sql
+from psycopg.rows import DictRow
+
+from src.core.adapters.postgres.changes import SETTLED_CHANGES
+
+
+async def seed(connection: AsyncConnection[DictRow]) -> None:
+    await connection.execute(
+        """
+        INSERT INTO users (
+            id,
+            email,
+            password,
+            first_name,
+            last_name,
+            updated_at,
+            created_at
+        )
+        SELECT
+            gen_random_uuid(),
+            'user' || i || '@example.com',
+            'password',
+            'first_name',
+            'last_name',
+            now(),
+            now()
+        FROM generate_series(1, 200) AS i;
+
+        INSERT INTO notes (
+            id,
+            user_id,
+            title,
+            content,
+            updated_at,
+            created_at
+        )
+        SELECT
+            gen_random_uuid(),
+            users.id,
+            'title ' || i,
+            'content ' || i,
+            now() - i * interval '1 minute',
+            now()
+        FROM users, generate_series(1, 100) AS i;
+
+        INSERT INTO categories (
+            id,
+            user_id,
+            name,
+            updated_at,
+            created_at
+        )
+        SELECT
+            gen_random_uuid(),
+            users.id,
+            'category ' || i,
+            now(),
+            now()
+        FROM users, generate_series(1, 50) AS i;
+
+        INSERT INTO notes_categories (
+            note_id,
+            category_id,
+            updated_at,
+            created_at
+        )
+        SELECT DISTINCT ON (notes.id)
+            notes.id,
+            categories.id,
+            now(),
+            now()
+        FROM notes
+        JOIN categories ON categories.user_id = notes.user_id
+        ORDER BY notes.id, categories.id;
+
+        ANALYZE users, notes, categories, notes_categories;
+        """
+    )
+    await connection.commit()
+
+
+async def explain(
+    connection: AsyncConnection[DictRow],
+    query: sql.Composable,
+) -> str:
+    cursor = await connection.execute(
+        sql.SQL("EXPLAIN {}").format(query),
+    )
+    rows = await cursor.fetchall()
+    return "\n".join(row["QUERY PLAN"] for row in rows)
+
+
+@pytest.mark.anyio(scope="class")
+@pytest.mark.describe("Per-user indexes")
+class TestIndexes:
+    @pytest.mark.it("Should look up a category by user and name by index")
+    async def test_categories_user_id_name(
+        self,
+        connection: AsyncConnection[DictRow],
+    ) -> None:
+        # given
+        await seed(connection)
+        cursor = await connection.execute(
+            "SELECT user_id, name FROM categories LIMIT 1;",
+        )
+        category = await cursor.fetchone()
+        assert category is not None
+
+        # when
+        plan = await explain(
+            connection,
+            sql.SQL(
+                "SELECT name FROM categories "
+                "WHERE user_id = {} AND name = {};"
+            ).format(
+                sql.Literal(category["user_id"]),
+                sql.Literal(category["name"]),
+            ),
+        )
+
+        # then
+        assert "categories_user_id_name_key" in plan
+        assert "Seq Scan" not in plan
+
+    @pytest.mark.it("Should list the latest notes of an user by index")
+    async def test_notes_user_id_updated_at(
+        self,
+        connection: AsyncConnection[DictRow],
+    ) -> None:
+        # given
+        await seed(connection)
+        cursor = await connection.execute("SELECT user_id FROM notes LIMIT 1;")
+        note = await cursor.fetchone()
+        assert note is not None
+
+        # when
+        plan = await explain(
+            connection,
+            sql.SQL(
+                "SELECT id FROM notes WHERE user_id = {} "
+                "ORDER BY updated_at DESC, id DESC LIMIT 20;"
+            ).format(sql.Literal(note["user_id"])),
+        )
+
+        # then
+        assert "notes_user_id_updated_at_id_idx" in plan
+        assert "Seq Scan" not in plan
+        assert "Sort" not in plan
+
+    @pytest.mark.it("Should seek the next page of notes by index")
+    async def test_notes_keyset(
+        self,
+        connection: AsyncConnection[DictRow],
+    ) -> None:
+        # given
+        await seed(connection)
+        cursor = await connection.execute(
+            "SELECT user_id, updated_at, id FROM notes "
+            "ORDER BY updated_at DESC, id DESC OFFSET 50 LIMIT 1;",
+        )
+        note = await cursor.fetchone()
+        assert note is not None
+
+        # when
+        plan = await explain(
+            connection,
+            sql.SQL(
+                "SELECT id FROM notes WHERE user_id = {} "
+                "AND (updated_at, id) < ({}, {}) "
+                "ORDER BY updated_at DESC, id DESC LIMIT 20;"
+            ).format(
+                sql.Literal(note["user_id"]),
+                sql.Literal(note["updated_at"]),
+                sql.Literal(note["id"]),
+            ),
+        )
+
+        # then
+        assert "notes_user_id_updated_at_id_idx" in plan
+        assert "Index Cond" in plan
+        assert "Seq Scan" not in plan
+        assert "Sort" not in plan
+
+    @pytest.mark.it("Should seek the changes of an user by index")
+    @pytest.mark.parametrize("table", ["notes", "categories"])
+    async def test_user_id_change_id(
+        self,
+        connection: AsyncConnection[DictRow],
+        table: str,
+    ) -> None:
+        # given
+        await seed(connection)
+        cursor = await connection.execute(
+            sql.SQL("SELECT user_id, change_id, id FROM {} LIMIT 1;").format(
+                sql.Identifier(table),
+            ),
+        )
+        row = await cursor.fetchone()
+        assert row is not None
+
+        # when
+        plan = await explain(
+            connection,
+            sql.SQL(
+                "SELECT id FROM {} WHERE user_id = {} {} "
+                "AND (change_id, id) > ({}, {}) "
+                "ORDER BY change_id, id LIMIT 20;"
+            ).format(
+                sql.Identifier(table),
+                sql.Literal(row["user_id"]),
+                SETTLED_CHANGES,
+                sql.Literal(row["change_id"]),
+                sql.Literal(row["id"]),
+            ),
+        )
+
+        # then
+        assert f"{table}_user_id_change_id_id_idx" in plan
+        assert "Seq Scan" not in plan
+        assert "Sort" not in plan
+
+    @pytest.mark.it("Should find the notes of a category by index")
+    async def test_notes_categories_category_id(
+        self,
+        connection: AsyncConnection[DictRow],
+    ) -> None:
+        # given
+        await seed(connection)
+        cursor = await connection.execute(
+            "SELECT category_id FROM notes_categories LIMIT 1;",
+        )
+        note_category = await cursor.fetchone()
+        assert note_category is not None
+
+        # when
+        plan = await explain(
+            connection,
+            sql.SQL(
+                "SELECT note_id FROM notes_categories WHERE category_id = {};"
+            ).format(sql.Literal(note_category["category_id"])),
+        )
+
+        # then
+        assert "notes_categories_category_id_idx" in plan
+        assert "Seq Scan" not in plan
+
+    @pytest.mark.it("Should search the notes by index")
+    async def test_notes_user_id_search(
+        self,
+        connection: AsyncConnection[DictRow],
+    ) -> None:
+        # given
+        await seed(connection)
+
+        # when
+        plan = await explain(
+            connection,
+            sql.SQL(
+                "SELECT id FROM notes "
+                "WHERE search @@ websearch_to_tsquery('simple', {});"
+            ).format(sql.Literal("100")),
+        )
+
+        # then
+        assert "notes_user_id_search_idx" in plan
+        assert "Seq Scan" not in plan
+
+    @pytest.mark.it("Should match note titles by trigram index")
+    async def test_notes_user_id_title_trgm(
+        self,
+        connection: AsyncConnection[DictRow],
+    ) -> None:
+        # given
+        await seed(connection)
+
+        # when
+        plan = await explain(
+            connection,
+            sql.SQL(
+                "SELECT id FROM notes WHERE lower(title::TEXT) LIKE {};"
+            ).format(sql.Literal("%itle 100%")),
+        )
+
+        # then
+        assert "notes_user_id_title_trgm_idx" in plan
+        assert "Seq Scan" not in plan
+
+    @pytest.mark.it("Should match category names by trigram index")
+    async def test_categories_user_id_name_trgm(
+        self,
+        connection: AsyncConnection[DictRow],
+    ) -> None:
+        # given
+        await seed(connection)
+
+        # when
+        plan = await explain(
+            connection,
+            sql.SQL(
+                "SELECT id FROM categories WHERE lower(name::TEXT) LIKE {};"
+            ).format(sql.Literal("%gory 50%")),
+        )
+
+        # then
+        assert "categories_user_id_name_trgm_idx" in plan
+        assert "Seq Scan" not in plan
@@ -1,12 +1,19 @@
+from contextlib import aclosing
+
+import anyio
 import pytest
-from psycopg import AsyncConnection
+from psycopg import AsyncConnection, errors
 from psycopg.rows import DictRow
 from psycopg_pool import AsyncConnectionPool
 
 from tests.auth.builders.domain.entities.user_builder import UserBuilder
+from tests.core.builders.domain.entities.category_builder import (
+    CategoryBuilder,
+)
 from tests.core.builders.domain.entities.note_builder import NoteBuilder
 from tests.core.helpers.core_database_client import CoreDatabaseClient
 
+from src.common.adapters.errors import DatabaseError
 from src.core.adapters.postgres.postgres_unit_of_work import PostgresUnitOfWork
 
 
@@ -59,3 +66,147 @@ class TestPostgresUnitOfWork:
         # then
         note_from_db = await database_client.select_note(note.id)
         assert note_from_db is None
+
+    @pytest.mark.it("Should persist the pipelined operations if commited")
+    async def test_pipeline_persist(
+        self,
+        pool: AsyncConnectionPool[AsyncConnection[DictRow]],
+    ) -> None:
+        # given
+        sut = PostgresUnitOfWork(pool)
+        database_client = CoreDatabaseClient(pool)
+
+        # and
+        user = UserBuilder().build()
+        await database_client.create_user(user)
+
+        # and
+        note = NoteBuilder().with_user_id(user.id).build()
+        category = CategoryBuilder().with_user_id(user.id).build()
+
+        # when
+        async with sut, sut.pipeline():
+            await sut.note_repository.create(note)
+            await sut.category_repository.create(category)
+            await sut.commit()
+
+        # then
+        note_from_db = await database_client.select_note(note.id)
+        assert note_from_db == note
+
+        # and
+        category_from_db = await database_client.select_category(category.id)
+        assert category_from_db == category
+
+    @pytest.mark.it("Should map pipeline errors to database error")
+    async def test_pipeline_database_error(
+        self,
+        pool: AsyncConnectionPool[AsyncConnection[DictRow]],
+    ) -> None:
+        # given
+        sut = PostgresUnitOfWork(pool)
+        database_client = CoreDatabaseClient(pool)
+
+        # and
+        note = NoteBuilder().build()
+        category = CategoryBuilder().build()
+
+        # and
+        async def create() -> None:
+            async with sut, sut.pipeline():
+                await sut.note_repository.create(note)
+                await sut.category_repository.create(category)
+                await sut.commit()
+
+        # when/then
+        with pytest.raises(DatabaseError) as exc_info:
+            await create()
+
+        # and
+        error = exc_info.value
+        assert isinstance(error.__cause__, errors.ForeignKeyViolation)
+
+        # and
+        note_from_db = await database_client.select_note(note.id)
+        assert note_from_db is None
+
+    @pytest.mark.it("Should not check out a connection if it is not used")
+    async def test_lazy_connection(
+        self,
+        pool: AsyncConnectionPool[AsyncConnection[DictRow]],
+    ) -> None:
+        # given
+        sut = PostgresUnitOfWork(pool)
+        requests_before = pool.get_stats().get("requests_num", 0)
+
+        # when
+        async with sut:
+            pass
+
+        # then
+        requests_after = pool.get_stats().get("requests_num", 0)
+        assert requests_after == requests_before
+
+    @pytest.mark.it("Should give the connection back right after commit")
+    async def test_release_after_commit(
+        self,
+        pool: AsyncConnectionPool[AsyncConnection[DictRow]],
+    ) -> None:
+        # given
+        sut = PostgresUnitOfWork(pool)
+        database_client = CoreDatabaseClient(pool)
+
+        # and
+        user = UserBuilder().build()
+        await database_client.create_user(user)
+
+        # and
+        note = NoteBuilder().with_user_id(user.id).build()
+
+        async with sut:
+            await sut.note_repository.create(note)
+            await sut.commit()
+
+            # then
+            stats = pool.get_stats()
+            assert stats["pool_available"] == stats["pool_size"]
+
+        # and
+        note_from_db = await database_client.select_note(note.id)
+        assert note_from_db == note
+
+    @pytest.mark.it(
+        "Should give the connection back when cancelled mid-stream"
+    )
+    async def test_release_when_cancelled(
+        self,
+        pool: AsyncConnectionPool[AsyncConnection[DictRow]],
+    ) -> None:
+        # given
+        sut = PostgresUnitOfWork(pool)
+        database_client = CoreDatabaseClient(pool)
+
+        # and
+        user = UserBuilder().build()
+        await database_client.create_user(user)
+        for _ in range(3):
+            await database_client.create_note(
+                NoteBuilder().with_user_id(user.id).build(),
+            )
+
+        # when
+        with anyio.CancelScope() as scope:
+            async with (
+                sut,
+                aclosing(sut.note_repository.stream(user.id)) as notes,
+            ):
+                async for _ in notes:
+                    scope.cancel()
+                    await anyio.sleep(1)
+
+        # then
+        assert scope.cancelled_caught
+
+        # and
+        stats = pool.get_stats()
+        assert stats["pool_available"] == stats["pool_size"]
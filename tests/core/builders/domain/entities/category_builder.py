@@ -1,3 +1,4 @@
+from datetime import datetime
 from uuid import UUID, uuid4
 
 from tests.helpers.builder import Builder
@@ -24,5 +25,9 @@ class CategoryBuilder(Builder[Category]):
         self._data["name"] = name
         return self
 
+    def with_updated_at(self, updated_at: datetime) -> "CategoryBuilder":
+        self._data["updated_at"] = updated_at
+        return self
+
     def build(self) -> Category:
         return Category.model_validate(self._data)
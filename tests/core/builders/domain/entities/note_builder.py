@@ -1,3 +1,4 @@
+from datetime import datetime
 from uuid import UUID, uuid4
 
 from tests.helpers.builder import Builder
@@ -21,5 +22,17 @@ class NoteBuilder(Builder[Note]):
         self._data["user_id"] = user_id
         return self
 
+    def with_title(self, title: str) -> "NoteBuilder":
+        self._data["title"] = title
+        return self
+
+    def with_content(self, content: str) -> "NoteBuilder":
+        self._data["content"] = content
+        return self
+
+    def with_updated_at(self, updated_at: datetime) -> "NoteBuilder":
+        self._data["updated_at"] = updated_at
+        return self
+
     def build(self) -> Note:
         return Note.model_validate(self._data)
@@ -0,0 +1,32 @@
+from datetime import datetime
+from uuid import UUID, uuid4
+
+from tests.helpers.builder import Builder
+
+from src.common.datetime import Datetime
+from src.core.domain.entities import Tombstone, TombstoneEntityEnum
+
+
+class TombstoneBuilder(Builder[Tombstone]):
+    def __init__(self) -> None:
+        self._data = {
+            "entity": TombstoneEntityEnum.notes,
+            "id": uuid4(),
+            "user_id": uuid4(),
+            "deleted_at": Datetime.now(),
+        }
+
+    def with_entity(self, entity: TombstoneEntityEnum) -> "TombstoneBuilder":
+        self._data["entity"] = entity
+        return self
+
+    def with_user_id(self, user_id: UUID) -> "TombstoneBuilder":
+        self._data["user_id"] = user_id
+        return self
+
+    def with_deleted_at(self, deleted_at: datetime) -> "TombstoneBuilder":
+        self._data["deleted_at"] = deleted_at
+        return self
+
+    def build(self) -> Tombstone:
+        return Tombstone.model_validate(self._data)
@@ -0,0 +1,48 @@
+import pytest
+from psycopg import AsyncConnection
+from psycopg.rows import DictRow
+from psycopg_pool import AsyncConnectionPool
+
+from src.core.drivers.cli.benchmark_autocomplete import benchmark, parse_args
+
+
+@pytest.mark.anyio(scope="class")
+@pytest.mark.describe("benchmark-autocomplete")
+class TestBenchmarkAutocomplete:
+    @pytest.mark.it("Should measure the autocomplete queries")
+    async def test_benchmark(
+        self,
+        pool: AsyncConnectionPool[AsyncConnection[DictRow]],
+        connection: AsyncConnection[DictRow],
+    ) -> None:
+        # when
+        results = await benchmark(
+            pool.conninfo,
+            users=2,
+            notes=200,
+            categories=50,
+            iterations=3,
+        )
+
+        # then
+        assert {(result.table, result.mode) for result in results} == {
+            ("notes", "prefix"),
+            ("notes", "substring"),
+            ("categories", "prefix"),
+            ("categories", "substring"),
+        }
+
+        # and
+        for result in results:
+            assert 0 < result.p50_ms <= result.p99_ms
+
+        # and
+        cursor = await connection.execute("SELECT count(*) FROM categories;")
+        row = await cursor.fetchone()
+        assert row == {"count": 0}
+
+    @pytest.mark.it("Should reject fewer than two iterations")
+    def test_parse_args_iterations(self) -> None:
+        # when/then
+        with pytest.raises(SystemExit):
+            parse_args(["--iterations", "1"])
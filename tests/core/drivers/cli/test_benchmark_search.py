@@ -0,0 +1,46 @@
+import pytest
+from psycopg import AsyncConnection
+from psycopg.rows import DictRow
+from psycopg_pool import AsyncConnectionPool
+
+from src.core.drivers.cli.benchmark_search import TERMS, benchmark, parse_args
+
+
+@pytest.mark.anyio(scope="class")
+@pytest.mark.describe("benchmark-search")
+class TestBenchmarkSearch:
+    @pytest.mark.it("Should compare full-text search with an ILIKE scan")
+    async def test_benchmark(
+        self,
+        pool: AsyncConnectionPool[AsyncConnection[DictRow]],
+        connection: AsyncConnection[DictRow],
+    ) -> None:
+        # given
+        iterations = 3
+
+        # when
+        results = await benchmark(
+            pool.conninfo,
+            users=2,
+            notes=200,
+            iterations=iterations,
+        )
+
+        # then
+        assert len(results) == len(TERMS) * 2
+        assert {result.method for result in results} == {"tsvector", "ilike"}
+
+        # and
+        for result in results:
+            assert 0 < result.p50_ms <= result.p99_ms
+
+        # and
+        cursor = await connection.execute("SELECT count(*) FROM notes;")
+        row = await cursor.fetchone()
+        assert row == {"count": 0}
+
+    @pytest.mark.it("Should reject fewer than two iterations")
+    def test_parse_args_iterations(self) -> None:
+        # when/then
+        with pytest.raises(SystemExit):
+            parse_args(["--iterations", "1"])
@@ -0,0 +1,58 @@
+import pytest
+from psycopg import AsyncConnection
+from psycopg.rows import DictRow
+from psycopg_pool import AsyncConnectionPool
+
+from src.core.drivers.cli.load_test_notes import (
+    OPERATIONS,
+    load_test,
+    parse_args,
+)
+
+
+@pytest.mark.anyio(scope="class")
+@pytest.mark.describe("load-test-notes")
+class TestLoadTestNotes:
+    @pytest.mark.it("Should run every note operation with bounded statements")
+    async def test_load_test(
+        self,
+        pool: AsyncConnectionPool[AsyncConnection[DictRow]],
+    ) -> None:
+        # given
+        concurrency = 2
+        iterations = 5
+
+        # when
+        results = await load_test(
+            pool.conninfo,
+            concurrency=concurrency,
+            iterations=iterations,
+            categories=3,
+        )
+
+        # then
+        assert [result.operation for result in results] == list(OPERATIONS)
+
+        # and
+        for result in results:
+            assert result.requests == concurrency * iterations
+            assert result.requests_per_second > 0
+            assert 0 < result.p50_ms <= result.p99_ms
+
+        # and
+        statements = {
+            result.operation: result.statements_per_request
+            for result in results
+        }
+        assert statements == {
+            "create": 3,
+            "get": 1,
+            "update": 4,
+            "delete": 1,
+        }
+
+    @pytest.mark.it("Should reject fewer than two iterations")
+    def test_parse_args_iterations(self) -> None:
+        # when/then
+        with pytest.raises(SystemExit):
+            parse_args(["--iterations", "1"])
@@ -0,0 +1,76 @@
+import secrets
+
+import pytest
+from fastapi import status
+
+from tests.auth.builders.domain.entities.user_builder import UserBuilder
+from tests.auth.helpers.generate_token import generate_token
+from tests.core.builders.domain.entities.category_builder import (
+    CategoryBuilder,
+)
+from tests.core.helpers.core_database_client import CoreDatabaseClient
+from tests.core.helpers.core_http_client import CoreHttpClient
+from tests.helpers.server_test import ServerTest
+
+
+@pytest.mark.anyio(scope="class")
+@pytest.mark.describe("GET /categories/autocomplete")
+class TestAutocompleteCategories:
+    @pytest.mark.it(f"Should return {status.HTTP_200_OK} OK")
+    async def test_autocomplete_categories_ok(self) -> None:
+        secret_key = secrets.token_hex(64)
+        env = {"JWT_SECRET_KEY": secret_key}
+        async with ServerTest(env) as (http_client, pool):
+            # given
+            core_client = CoreHttpClient(http_client)
+            core_database_client = CoreDatabaseClient(pool)
+
+            # and
+            current_user = UserBuilder().build()
+            await core_database_client.create_user(current_user)
+
+            # and
+            categories = [
+                CategoryBuilder()
+                .with_user_id(current_user.id)
+                .with_name(name)
+                .build()
+                for name in ("Work", "Homework", "Travel")
+            ]
+            for category in categories:
+                await core_database_client.create_category(category)
+
+            # and
+            token = generate_token(current_user.id, secret_key=secret_key)
+
+            # when
+            response = await core_client.autocomplete_categories(
+                token,
+                {"q": "work", "mode": "substring"},
+            )
+
+            # then
+            assert response.status_code == status.HTTP_200_OK
+            assert response.json() == {
+                "items": [
+                    {"id": str(category.id), "name": category.name}
+                    for category in categories[:2]
+                ],
+            }
+
+    @pytest.mark.it(
+        f"Should return {status.HTTP_401_UNAUTHORIZED} "
+        "UNAUTHORIZED when token is missing"
+    )
+    async def test_autocomplete_categories_unauthorized(self) -> None:
+        async with ServerTest() as (http_client, _):
+            # given
+            core_client = CoreHttpClient(http_client)
+
+            # when
+            response = await core_client.autocomplete_categories(
+                params={"q": "work"},
+            )
+
+            # then
+            assert response.status_code == status.HTTP_401_UNAUTHORIZED
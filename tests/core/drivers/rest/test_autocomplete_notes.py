@@ -0,0 +1,89 @@
+import secrets
+
+import pytest
+from fastapi import status
+
+from tests.auth.builders.domain.entities.user_builder import UserBuilder
+from tests.auth.helpers.generate_token import generate_token
+from tests.core.builders.domain.entities.note_builder import NoteBuilder
+from tests.core.helpers.core_database_client import CoreDatabaseClient
+from tests.core.helpers.core_http_client import CoreHttpClient
+from tests.helpers.server_test import ServerTest
+
+
+@pytest.mark.anyio(scope="class")
+@pytest.mark.describe("GET /notes/autocomplete")
+class TestAutocompleteNotes:
+    @pytest.mark.it(f"Should return {status.HTTP_200_OK} OK")
+    async def test_autocomplete_notes_ok(self) -> None:
+        secret_key = secrets.token_hex(64)
+        env = {"JWT_SECRET_KEY": secret_key}
+        async with ServerTest(env) as (http_client, pool):
+            # given
+            core_client = CoreHttpClient(http_client)
+            core_database_client = CoreDatabaseClient(pool)
+
+            # and
+            current_user = UserBuilder().build()
+            await core_database_client.create_user(current_user)
+
+            # and
+            notes = [
+                NoteBuilder()
+                .with_user_id(current_user.id)
+                .with_title(title)
+                .build()
+                for title in ("Meeting notes", "Team meeting", "Groceries")
+            ]
+            for note in notes:
+                await core_database_client.create_note(note)
+
+            # and
+            token = generate_token(current_user.id, secret_key=secret_key)
+
+            # when
+            prefix = await core_client.autocomplete_notes(token, {"q": "mee"})
+            substring = await core_client.autocomplete_notes(
+                token,
+                {"q": "mee", "mode": "substring", "limit": 1},
+            )
+
+            # then
+            assert prefix.status_code == status.HTTP_200_OK
+            assert prefix.json() == {
+                "items": [{"id": str(notes[0].id), "title": notes[0].title}],
+            }
+
+            # and
+            assert substring.status_code == status.HTTP_200_OK
+            assert substring.json() == {
+                "items": [{"id": str(notes[0].id), "title": notes[0].title}],
+            }
+
+    @pytest.mark.it(
+        f"Should return {status.HTTP_422_UNPROCESSABLE_ENTITY} "
+        "UNPROCESSABLE ENTITY when the limit is out of range"
+    )
+    async def test_autocomplete_notes_invalid_limit(self) -> None:
+        secret_key = secrets.token_hex(64)
+        env = {"JWT_SECRET_KEY": secret_key}
+        async with ServerTest(env) as (http_client, pool):
+            # given
+            core_client = CoreHttpClient(http_client)
+            core_database_client = CoreDatabaseClient(pool)
+
+            # and
+            current_user = UserBuilder().build()
+            await core_database_client.create_user(current_user)
+
+            # and
+            token = generate_token(current_user.id, secret_key=secret_key)
+
+            # when
+            response = await core_client.autocomplete_notes(
+                token,
+                {"q": "mee", "limit": 21},
+            )
+
+            # then
+            assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
@@ -0,0 +1,80 @@
+import secrets
+
+import pytest
+from fastapi import status
+
+from tests.auth.builders.domain.entities.user_builder import UserBuilder
+from tests.auth.helpers.generate_token import generate_token
+from tests.core.builders.domain.entities.note_builder import NoteBuilder
+from tests.core.helpers.core_database_client import CoreDatabaseClient
+from tests.core.helpers.core_http_client import CoreHttpClient
+from tests.helpers.server_test import ServerTest
+
+
+@pytest.mark.anyio(scope="class")
+@pytest.mark.describe("DELETE /notes/{note_id}")
+class TestDeleteNote:
+    @pytest.mark.it(f"Should return {status.HTTP_204_NO_CONTENT} NO CONTENT")
+    async def test_delete_note_no_content(self) -> None:
+        secret_key = secrets.token_hex(64)
+        env = {"JWT_SECRET_KEY": secret_key}
+        async with ServerTest(env) as (http_client, pool):
+            # given
+            core_client = CoreHttpClient(http_client)
+            core_database_client = CoreDatabaseClient(pool)
+
+            # and
+            current_user = UserBuilder().build()
+            await core_database_client.create_user(current_user)
+
+            # and
+            note = NoteBuilder().with_user_id(current_user.id).build()
+            await core_database_client.create_note(note)
+
+            # and
+            token = generate_token(current_user.id, secret_key=secret_key)
+
+            # when
+            response = await core_client.delete_note(note.id, token)
+
+            # then
+            assert response.status_code == status.HTTP_204_NO_CONTENT
+
+            # and
+            note_from_db = await core_database_client.select_note(note.id)
+            assert note_from_db is None
+
+    @pytest.mark.it(
+        f"Should return {status.HTTP_404_NOT_FOUND} "
+        "NOT FOUND when the note belongs to another user"
+    )
+    async def test_delete_note_not_found(self) -> None:
+        secret_key = secrets.token_hex(64)
+        env = {"JWT_SECRET_KEY": secret_key}
+        async with ServerTest(env) as (http_client, pool):
+            # given
+            core_client = CoreHttpClient(http_client)
+            core_database_client = CoreDatabaseClient(pool)
+
+            # and
+            current_user = UserBuilder().build()
+            another_user = UserBuilder().build()
+            await core_database_client.create_user(current_user)
+            await core_database_client.create_user(another_user)
+
+            # and
+            note = NoteBuilder().with_user_id(another_user.id).build()
+            await core_database_client.create_note(note)
+
+            # and
+            token = generate_token(current_user.id, secret_key=secret_key)
+
+            # when
+            response = await core_client.delete_note(note.id, token)
+
+            # then
+            assert response.status_code == status.HTTP_404_NOT_FOUND
+
+            # and
+            note_from_db = await core_database_client.select_note(note.id)
+            assert note_from_db == note
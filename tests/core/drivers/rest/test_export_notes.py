@@ -0,0 +1,104 @@
+import json
+import secrets
+from datetime import timedelta
+
+import pytest
+from fastapi import status
+
+from tests.auth.builders.domain.entities.user_builder import UserBuilder
+from tests.auth.helpers.generate_token import generate_token
+from tests.core.builders.domain.entities.category_builder import (
+    CategoryBuilder,
+)
+from tests.core.builders.domain.entities.note_builder import NoteBuilder
+from tests.core.builders.domain.entities.note_category_builder import (
+    NoteCategoryBuilder,
+)
+from tests.core.helpers.core_database_client import CoreDatabaseClient
+from tests.core.helpers.core_http_client import CoreHttpClient
+from tests.helpers.server_test import ServerTest
+
+from src.common.datetime import Datetime
+
+
+@pytest.mark.anyio(scope="class")
+@pytest.mark.describe("GET /notes/export")
+class TestExportNotes:
+    @pytest.mark.it(f"Should return {status.HTTP_200_OK} OK with NDJSON")
+    async def test_export_notes_ok(self) -> None:
+        secret_key = secrets.token_hex(64)
+        env = {"JWT_SECRET_KEY": secret_key}
+        async with ServerTest(env) as (http_client, pool):
+            # given
+            core_client = CoreHttpClient(http_client)
+            core_database_client = CoreDatabaseClient(pool)
+
+            # and
+            current_user = UserBuilder().build()
+            another_user = UserBuilder().build()
+            await core_database_client.create_user(current_user)
+            await core_database_client.create_user(another_user)
+
+            # and
+            now = Datetime.now()
+            notes = [
+                NoteBuilder()
+                .with_user_id(current_user.id)
+                .with_updated_at(now - timedelta(minutes=index))
+                .build()
+                for index in range(3)
+            ]
+            for note in notes:
+                await core_database_client.create_note(note)
+            await core_database_client.create_note(
+                NoteBuilder().with_user_id(another_user.id).build(),
+            )
+
+            # and
+            category = CategoryBuilder().with_user_id(current_user.id).build()
+            await core_database_client.create_category(category)
+            await core_database_client.create_note_category(
+                NoteCategoryBuilder()
+                .with_note_id(notes[0].id)
+                .with_category_id(category.id)
+                .build()
+            )
+
+            # and
+            token = generate_token(current_user.id, secret_key=secret_key)
+
+            # when
+            response = await core_client.export_notes(token)
+
+            # then
+            assert response.status_code == status.HTTP_200_OK
+            assert response.headers["content-type"] == "application/x-ndjson"
+
+            # and
+            lines = response.text.splitlines()
+            assert [json.loads(line) for line in lines] == [
+                {
+                    **note.model_dump(mode="json", exclude={"user_id"}),
+                    "category_ids": [str(category.id)] if index == 0 else [],
+                }
+                for index, note in enumerate(notes)
+            ]
+
+            # and
+            stats = pool.get_stats()
+            assert stats["pool_available"] == stats["pool_size"]
+
+    @pytest.mark.it(
+        f"Should return {status.HTTP_401_UNAUTHORIZED} "
+        "UNAUTHORIZED when token is missing"
+    )
+    async def test_export_notes_unauthorized(self) -> None:
+        async with ServerTest() as (http_client, _):
+            # given
+            core_client = CoreHttpClient(http_client)
+
+            # when
+            response = await core_client.export_notes()
+
+            # then
+            assert response.status_code == status.HTTP_401_UNAUTHORIZED
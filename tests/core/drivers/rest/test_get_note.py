@@ -0,0 +1,161 @@
+import secrets
+
+import pytest
+from fastapi import status
+
+from tests.auth.builders.domain.entities.user_builder import UserBuilder
+from tests.auth.helpers.generate_token import generate_token
+from tests.core.builders.domain.entities.category_builder import (
+    CategoryBuilder,
+)
+from tests.core.builders.domain.entities.note_builder import NoteBuilder
+from tests.core.builders.domain.entities.note_category_builder import (
+    NoteCategoryBuilder,
+)
+from tests.core.helpers.core_database_client import CoreDatabaseClient
+from tests.core.helpers.core_http_client import CoreHttpClient
+from tests.helpers.server_test import ServerTest
+
+from src.common.drivers.rest.etag import entity_tag
+
+
+@pytest.mark.anyio(scope="class")
+@pytest.mark.describe("GET /notes/{note_id}")
+class TestGetNote:
+    @pytest.mark.it(f"Should return {status.HTTP_200_OK} OK")
+    async def test_get_note_ok(self) -> None:
+        secret_key = secrets.token_hex(64)
+        env = {"JWT_SECRET_KEY": secret_key}
+        async with ServerTest(env) as (http_client, pool):
+            # given
+            core_client = CoreHttpClient(http_client)
+            core_database_client = CoreDatabaseClient(pool)
+
+            # and
+            current_user = UserBuilder().build()
+            await core_database_client.create_user(current_user)
+
+            # and
+            note = NoteBuilder().with_user_id(current_user.id).build()
+            category = CategoryBuilder().with_user_id(current_user.id).build()
+            await core_database_client.create_note(note)
+            await core_database_client.create_category(category)
+            await core_database_client.create_note_category(
+                NoteCategoryBuilder()
+                .with_note_id(note.id)
+                .with_category_id(category.id)
+                .build()
+            )
+
+            # and
+            token = generate_token(current_user.id, secret_key=secret_key)
+
+            # when
+            response = await core_client.get_note(note.id, token)
+
+            # then
+            assert response.status_code == status.HTTP_200_OK
+
+            # and
+            assert response.json() == {
+                **note.model_dump(mode="json", exclude={"user_id"}),
+                "category_ids": [str(category.id)],
+            }
+
+    @pytest.mark.it(
+        f"Should return {status.HTTP_404_NOT_FOUND} "
+        "NOT FOUND when the note belongs to another user"
+    )
+    async def test_get_note_not_found(self) -> None:
+        secret_key = secrets.token_hex(64)
+        env = {"JWT_SECRET_KEY": secret_key}
+        async with ServerTest(env) as (http_client, pool):
+            # given
+            core_client = CoreHttpClient(http_client)
+            core_database_client = CoreDatabaseClient(pool)
+
+            # and
+            current_user = UserBuilder().build()
+            another_user = UserBuilder().build()
+            await core_database_client.create_user(current_user)
+            await core_database_client.create_user(another_user)
+
+            # and
+            note = NoteBuilder().with_user_id(another_user.id).build()
+            await core_database_client.create_note(note)
+
+            # and
+            token = generate_token(current_user.id, secret_key=secret_key)
+
+            # when
+            response = await core_client.get_note(note.id, token)
+
+            # then
+            assert response.status_code == status.HTTP_404_NOT_FOUND
+            assert response.json() == {"detail": "Note not found"}
+
+    @pytest.mark.it("Should return the note version as a strong ETag")
+    async def test_get_note_etag(self) -> None:
+        secret_key = secrets.token_hex(64)
+        env = {"JWT_SECRET_KEY": secret_key}
+        async with ServerTest(env) as (http_client, pool):
+            # given
+            core_client = CoreHttpClient(http_client)
+            core_database_client = CoreDatabaseClient(pool)
+
+            # and
+            current_user = UserBuilder().build()
+            await core_database_client.create_user(current_user)
+
+            # and
+            note = NoteBuilder().with_user_id(current_user.id).build()
+            await core_database_client.create_note(note)
+
+            # and
+            token = generate_token(current_user.id, secret_key=secret_key)
+
+            # when
+            response = await core_client.get_note(note.id, token)
+
+            # then
+            assert response.status_code == status.HTTP_200_OK
+            assert response.headers["ETag"] == entity_tag(
+                note.id,
+                note.updated_at,
+            )
+
+    @pytest.mark.it(
+        f"Should return {status.HTTP_304_NOT_MODIFIED} "
+        "NOT MODIFIED when If-None-Match matches the ETag"
+    )
+    async def test_get_note_not_modified(self) -> None:
+        secret_key = secrets.token_hex(64)
+        env = {"JWT_SECRET_KEY": secret_key}
+        async with ServerTest(env) as (http_client, pool):
+            # given
+            core_client = CoreHttpClient(http_client)
+            core_database_client = CoreDatabaseClient(pool)
+
+            # and
+            current_user = UserBuilder().build()
+            await core_database_client.create_user(current_user)
+
+            # and
+            note = NoteBuilder().with_user_id(current_user.id).build()
+            await core_database_client.create_note(note)
+
+            # and
+            token = generate_token(current_user.id, secret_key=secret_key)
+            tag = entity_tag(note.id, note.updated_at)
+
+            # when
+            response = await core_client.get_note(
+                note.id,
+                token,
+                headers={"If-None-Match": f"W/{tag}"},
+            )
+
+            # then
+            assert response.status_code == status.HTTP_304_NOT_MODIFIED
+            assert response.headers["ETag"] == tag
+            assert response.content == b""
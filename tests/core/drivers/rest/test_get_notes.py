@@ -0,0 +1,128 @@
+import secrets
+from datetime import timedelta
+
+import pytest
+from fastapi import status
+
+from tests.auth.builders.domain.entities.user_builder import UserBuilder
+from tests.auth.helpers.generate_token import generate_token
+from tests.core.builders.domain.entities.note_builder import NoteBuilder
+from tests.core.helpers.core_database_client import CoreDatabaseClient
+from tests.core.helpers.core_http_client import CoreHttpClient
+from tests.helpers.server_test import ServerTest
+
+from src.common.datetime import Datetime
+
+
+@pytest.mark.anyio(scope="class")
+@pytest.mark.describe("GET /notes/")
+class TestGetNotes:
+    @pytest.mark.it(f"Should return {status.HTTP_200_OK} OK, page by page")
+    async def test_get_notes_ok(self) -> None:
+        secret_key = secrets.token_hex(64)
+        env = {"JWT_SECRET_KEY": secret_key}
+        async with ServerTest(env) as (http_client, pool):
+            # given
+            core_client = CoreHttpClient(http_client)
+            core_database_client = CoreDatabaseClient(pool)
+
+            # and
+            current_user = UserBuilder().build()
+            await core_database_client.create_user(current_user)
+
+            # and
+            now = Datetime.now()
+            notes = [
+                NoteBuilder()
+                .with_user_id(current_user.id)
+                .with_updated_at(now - timedelta(minutes=index))
+                .build()
+                for index in range(5)
+            ]
+            for note in notes:
+                await core_database_client.create_note(note)
+
+            # and
+            token = generate_token(current_user.id, secret_key=secret_key)
+
+            # when
+            first = await core_client.get_notes(token, {"limit": 3})
+            cursor = first.json()["next_cursor"]
+            second = await core_client.get_notes(
+                token,
+                {"limit": 3, "cursor": cursor},
+            )
+
+            # then
+            assert first.status_code == status.HTTP_200_OK
+            assert second.status_code == status.HTTP_200_OK
+
+            # and
+            assert first.json()["items"] == [
+                {
+                    **note.model_dump(mode="json", exclude={"user_id"}),
+                    "category_ids": [],
+                }
+                for note in notes[:3]
+            ]
+            assert [item["id"] for item in second.json()["items"]] == [
+                str(note.id) for note in notes[3:]
+            ]
+
+            # and
+            assert isinstance(cursor, str)
+            assert second.json()["next_cursor"] is None
+
+    @pytest.mark.it(
+        f"Should return {status.HTTP_400_BAD_REQUEST} "
+        "BAD REQUEST when the cursor is not valid"
+    )
+    async def test_get_notes_invalid_cursor(self) -> None:
+        secret_key = secrets.token_hex(64)
+        env = {"JWT_SECRET_KEY": secret_key}
+        async with ServerTest(env) as (http_client, pool):
+            # given
+            core_client = CoreHttpClient(http_client)
+            core_database_client = CoreDatabaseClient(pool)
+
+            # and
+            current_user = UserBuilder().build()
+            await core_database_client.create_user(current_user)
+
+            # and
+            token = generate_token(current_user.id, secret_key=secret_key)
+
+            # when
+            response = await core_client.get_notes(
+                token,
+                {"cursor": "not-a-cursor"},
+            )
+
+            # then
+            assert response.status_code == status.HTTP_400_BAD_REQUEST
+            assert response.json() == {"detail": "Invalid cursor"}
+
+    @pytest.mark.it(
+        f"Should return {status.HTTP_422_UNPROCESSABLE_ENTITY} "
+        "UNPROCESSABLE ENTITY when the limit is out of range"
+    )
+    async def test_get_notes_invalid_limit(self) -> None:
+        secret_key = secrets.token_hex(64)
+        env = {"JWT_SECRET_KEY": secret_key}
+        async with ServerTest(env) as (http_client, pool):
+            # given
+            core_client = CoreHttpClient(http_client)
+            core_database_client = CoreDatabaseClient(pool)
+
+            # and
+            current_user = UserBuilder().build()
+            await core_database_client.create_user(current_user)
+
+            # and
+            token = generate_token(current_user.id, secret_key=secret_key)
+
+            # when
+            response = await core_client.get_notes(token, {"limit": 1000})
+
+            # then
+            assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
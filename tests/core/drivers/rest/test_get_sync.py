@@ -0,0 +1,161 @@
+import secrets
+from datetime import timedelta
+
+import pytest
+from fastapi import status
+
+from tests.auth.builders.domain.entities.user_builder import UserBuilder
+from tests.auth.helpers.generate_token import generate_token
+from tests.core.builders.domain.entities.category_builder import (
+    CategoryBuilder,
+)
+from tests.core.builders.domain.entities.note_builder import NoteBuilder
+from tests.core.builders.domain.entities.tombstone_builder import (
+    TombstoneBuilder,
+)
+from tests.core.helpers.core_database_client import CoreDatabaseClient
+from tests.core.helpers.core_http_client import CoreHttpClient
+from tests.helpers.server_test import ServerTest
+
+from src.common.datetime import Datetime
+
+
+@pytest.mark.anyio(scope="class")
+@pytest.mark.describe("GET /sync/")
+class TestGetSync:
+    @pytest.mark.it(f"Should return {status.HTTP_200_OK} OK, change by change")
+    async def test_get_sync_ok(self) -> None:
+        secret_key = secrets.token_hex(64)
+        env = {"JWT_SECRET_KEY": secret_key}
+        async with ServerTest(env) as (http_client, pool):
+            # given
+            core_client = CoreHttpClient(http_client)
+            core_database_client = CoreDatabaseClient(pool)
+
+            # and
+            current_user = UserBuilder().build()
+            await core_database_client.create_user(current_user)
+
+            # and
+            now = Datetime.now()
+            notes = [
+                NoteBuilder()
+                .with_user_id(current_user.id)
+                .with_updated_at(now - timedelta(minutes=index))
+                .build()
+                for index in range(3)
+            ]
+            for note in notes:
+                await core_database_client.create_note(note)
+
+            # and
+            category = CategoryBuilder().with_user_id(current_user.id).build()
+            await core_database_client.create_category(category)
+
+            # and
+            tombstone = (
+                TombstoneBuilder().with_user_id(current_user.id).build()
+            )
+            await core_database_client.create_tombstone(tombstone)
+
+            # and
+            token = generate_token(current_user.id, secret_key=secret_key)
+
+            # when
+            first = await core_client.sync(token, {"limit": 2})
+            second = await core_client.sync(
+                token,
+                {"limit": 2, "cursor": first.json()["next_cursor"]},
+            )
+
+            # then
+            assert first.status_code == status.HTTP_200_OK
+            assert first.json() == {
+                "notes": [
+                    {
+                        **note.model_dump(mode="json", exclude={"user_id"}),
+                        "category_ids": [],
+                    }
+                    for note in notes[:2]
+                ],
+                "categories": [
+                    category.model_dump(mode="json", exclude={"user_id"}),
+                ],
+                "deleted_note_ids": [str(tombstone.id)],
+                "deleted_category_ids": [],
+                "next_cursor": first.json()["next_cursor"],
+                "has_more": True,
+            }
+
+            # and
+            assert second.status_code == status.HTTP_200_OK
+            assert [note["id"] for note in second.json()["notes"]] == [
+                str(notes[2].id),
+            ]
+            assert second.json()["categories"] == []
+            assert second.json()["deleted_note_ids"] == []
+            assert second.json()["has_more"] is False
+
+            # when
+            # An imported note keeps its old timestamp but still syncs after
+            # the cursor.
+            imported = (
+                NoteBuilder()
+                .with_user_id(current_user.id)
+                .with_updated_at(now - timedelta(days=365))
+                .build()
+            )
+            await core_database_client.create_note(imported)
+            third = await core_client.sync(
+                token,
+                {"cursor": second.json()["next_cursor"]},
+            )
+
+            # then
+            assert third.status_code == status.HTTP_200_OK
+            assert [note["id"] for note in third.json()["notes"]] == [
+                str(imported.id),
+            ]
+
+    @pytest.mark.it(
+        f"Should return {status.HTTP_400_BAD_REQUEST} "
+        "BAD REQUEST when the cursor is not valid"
+    )
+    async def test_get_sync_invalid_cursor(self) -> None:
+        secret_key = secrets.token_hex(64)
+        env = {"JWT_SECRET_KEY": secret_key}
+        async with ServerTest(env) as (http_client, pool):
+            # given
+            core_client = CoreHttpClient(http_client)
+            core_database_client = CoreDatabaseClient(pool)
+
+            # and
+            current_user = UserBuilder().build()
+            await core_database_client.create_user(current_user)
+
+            # and
+            token = generate_token(current_user.id, secret_key=secret_key)
+
+            # when
+            response = await core_client.sync(
+                token, {"cursor": "not-a-cursor"}
+            )
+
+            # then
+            assert response.status_code == status.HTTP_400_BAD_REQUEST
+            assert response.json() == {"detail": "Invalid cursor"}
+
+    @pytest.mark.it(
+        f"Should return {status.HTTP_401_UNAUTHORIZED} "
+        "UNAUTHORIZED when token is missing"
+    )
+    async def test_get_sync_unauthorized(self) -> None:
+        async with ServerTest() as (http_client, _):
+            # given
+            core_client = CoreHttpClient(http_client)
+
+            # when
+            response = await core_client.sync()
+
+            # then
+            assert response.status_code == status.HTTP_401_UNAUTHORIZED
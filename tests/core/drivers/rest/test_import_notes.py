@@ -0,0 +1,155 @@
+import json
+import secrets
+from uuid import uuid4
+
+import pytest
+from fastapi import status
+
+from tests.auth.builders.domain.entities.user_builder import UserBuilder
+from tests.auth.helpers.generate_token import generate_token
+from tests.core.builders.domain.entities.category_builder import (
+    CategoryBuilder,
+)
+from tests.core.helpers.core_database_client import CoreDatabaseClient
+from tests.core.helpers.core_http_client import CoreHttpClient
+from tests.helpers.server_test import ServerTest
+
+
+@pytest.mark.anyio(scope="class")
+@pytest.mark.describe("POST /notes/import")
+class TestImportNotes:
+    @pytest.mark.it(
+        f"Should return {status.HTTP_200_OK} OK with the import summary"
+    )
+    async def test_import_notes_ok(self) -> None:
+        secret_key = secrets.token_hex(64)
+        env = {"JWT_SECRET_KEY": secret_key}
+        async with ServerTest(env) as (http_client, pool):
+            # given
+            core_client = CoreHttpClient(http_client)
+            core_database_client = CoreDatabaseClient(pool)
+
+            # and
+            current_user = UserBuilder().build()
+            await core_database_client.create_user(current_user)
+
+            # and
+            category = CategoryBuilder().with_user_id(current_user.id).build()
+            await core_database_client.create_category(category)
+
+            # and
+            records: list[dict[str, object]] = [
+                {
+                    "title": "Note 1",
+                    "content": "Content 1",
+                    "category_ids": [str(category.id)],
+                    "created_at": "2024-01-01T00:00:00Z",
+                    "updated_at": "2024-01-02T00:00:00Z",
+                },
+                {"title": "Note 2", "content": "Content 2"},
+                {"title": "", "content": "Content 3"},
+                {
+                    "title": "Note 4",
+                    "content": "Content 4",
+                    "category_ids": [str(uuid4())],
+                },
+            ]
+            lines = [json.dumps(record) for record in records]
+            content = "\n".join([*lines[:2], "not json", *lines[2:]]).encode()
+
+            # and
+            token = generate_token(current_user.id, secret_key=secret_key)
+
+            # when
+            response = await core_client.import_notes(token, content)
+
+            # then
+            assert response.status_code == status.HTTP_200_OK
+
+            # and
+            body = response.json()
+            assert body["imported"] == len(["Note 1", "Note 2"])
+            assert body["failed"] == len(body["errors"])
+            assert [error["line"] for error in body["errors"]] == [3, 4, 5]
+            assert body["errors"][2]["message"] == "Category not found"
+
+            # and
+            notes = await core_database_client.select_notes_by_user_id(
+                current_user.id,
+            )
+            assert [note.title for note in notes] == ["Note 1", "Note 2"]
+            assert notes[0].created_at.isoformat() == (
+                "2024-01-01T00:00:00+00:00"
+            )
+            assert notes[0].updated_at.isoformat() == (
+                "2024-01-02T00:00:00+00:00"
+            )
+
+            # and
+            category_ids = await core_database_client.select_note_category_ids(
+                notes[0].id,
+            )
+            assert category_ids == [category.id]
+
+    @pytest.mark.it(
+        f"Should return {status.HTTP_200_OK} OK with the committed chunks "
+        "when a chunk fails to load"
+    )
+    async def test_import_notes_chunk_failed(self) -> None:
+        secret_key = secrets.token_hex(64)
+        env = {"JWT_SECRET_KEY": secret_key, "IMPORT_CHUNK_SIZE": "1"}
+        async with ServerTest(env) as (http_client, pool):
+            # given
+            core_client = CoreHttpClient(http_client)
+            core_database_client = CoreDatabaseClient(pool)
+
+            # and
+            current_user = UserBuilder().build()
+            await core_database_client.create_user(current_user)
+
+            # and
+            # Postgres text cannot hold NUL, so the second chunk passes
+            # validation but fails to load.
+            records: list[dict[str, object]] = [
+                {"title": "Note 1", "content": "Content 1"},
+                {"title": "Note 2", "content": "Content\x002"},
+                {"title": "Note 3", "content": "Content 3"},
+            ]
+            content = "\n".join(json.dumps(record) for record in records)
+
+            # and
+            token = generate_token(current_user.id, secret_key=secret_key)
+
+            # when
+            response = await core_client.import_notes(token, content.encode())
+
+            # then
+            assert response.status_code == status.HTTP_200_OK
+
+            # and
+            assert response.json() == {
+                "imported": 2,
+                "failed": 1,
+                "errors": [{"line": 2, "message": "Failed to save"}],
+            }
+
+            # and
+            notes = await core_database_client.select_notes_by_user_id(
+                current_user.id,
+            )
+            assert [note.title for note in notes] == ["Note 1", "Note 3"]
+
+    @pytest.mark.it(
+        f"Should return {status.HTTP_401_UNAUTHORIZED} "
+        "UNAUTHORIZED when token is missing"
+    )
+    async def test_import_notes_unauthorized(self) -> None:
+        async with ServerTest() as (http_client, _):
+            # given
+            core_client = CoreHttpClient(http_client)
+
+            # when
+            response = await core_client.import_notes()
+
+            # then
+            assert response.status_code == status.HTTP_401_UNAUTHORIZED
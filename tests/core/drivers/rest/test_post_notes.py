@@ -0,0 +1,136 @@
+import secrets
+from uuid import UUID, uuid4
+
+import pytest
+from fastapi import status
+
+from tests.auth.builders.domain.entities.user_builder import UserBuilder
+from tests.auth.helpers.generate_token import generate_token
+from tests.core.builders.domain.entities.category_builder import (
+    CategoryBuilder,
+)
+from tests.core.builders.domain.entities.note_builder import NoteBuilder
+from tests.core.helpers.core_database_client import CoreDatabaseClient
+from tests.core.helpers.core_http_client import CoreHttpClient
+from tests.helpers.server_test import ServerTest
+
+
+@pytest.mark.anyio(scope="class")
+@pytest.mark.describe("POST /notes/")
+class TestPostNotes:
+    @pytest.mark.it(f"Should return {status.HTTP_201_CREATED} CREATED")
+    async def test_post_notes_created(self) -> None:
+        secret_key = secrets.token_hex(64)
+        env = {"JWT_SECRET_KEY": secret_key}
+        async with ServerTest(env) as (http_client, pool):
+            # given
+            core_client = CoreHttpClient(http_client)
+            core_database_client = CoreDatabaseClient(pool)
+
+            # and
+            current_user = UserBuilder().build()
+            await core_database_client.create_user(current_user)
+
+            # and
+            category = CategoryBuilder().with_user_id(current_user.id).build()
+            await core_database_client.create_category(category)
+
+            # and
+            token = generate_token(current_user.id, secret_key=secret_key)
+
+            # and
+            note = NoteBuilder().build()
+            body: dict[str, object] = {
+                "title": note.title,
+                "content": note.content,
+                "category_ids": [str(category.id)],
+            }
+
+            # when
+            response = await core_client.post_notes(token, body)
+
+            # then
+            assert response.status_code == status.HTTP_201_CREATED
+
+            # and
+            output = response.json()
+            assert set(output.keys()) == {
+                "id",
+                "title",
+                "content",
+                "category_ids",
+                "updated_at",
+                "created_at",
+            }
+            assert output["category_ids"] == [str(category.id)]
+
+            # and
+            note_from_db = await core_database_client.select_note(
+                UUID(output["id"]),
+            )
+            assert note_from_db is not None
+            assert note_from_db.user_id == current_user.id
+            assert note_from_db.title == note.title
+            assert note_from_db.content == note.content
+
+            # and
+            category_ids = await core_database_client.select_note_category_ids(
+                note_from_db.id,
+            )
+            assert category_ids == [category.id]
+
+    @pytest.mark.it(
+        f"Should return {status.HTTP_404_NOT_FOUND} "
+        "NOT FOUND when a category is not owned by the user"
+    )
+    async def test_post_notes_category_not_found(self) -> None:
+        secret_key = secrets.token_hex(64)
+        env = {"JWT_SECRET_KEY": secret_key}
+        async with ServerTest(env) as (http_client, pool):
+            # given
+            core_client = CoreHttpClient(http_client)
+            core_database_client = CoreDatabaseClient(pool)
+
+            # and
+            current_user = UserBuilder().build()
+            await core_database_client.create_user(current_user)
+
+            # and
+            token = generate_token(current_user.id, secret_key=secret_key)
+
+            # and
+            note = NoteBuilder().build()
+            body: dict[str, object] = {
+                "title": note.title,
+                "content": note.content,
+                "category_ids": [str(uuid4())],
+            }
+
+            # when
+            response = await core_client.post_notes(token, body)
+
+            # then
+            assert response.status_code == status.HTTP_404_NOT_FOUND
+            assert response.json() == {"detail": "Category not found"}
+
+    @pytest.mark.it(
+        f"Should return {status.HTTP_401_UNAUTHORIZED} "
+        "UNAUTHORIZED when token is missing"
+    )
+    async def test_post_notes_unauthorized(self) -> None:
+        async with ServerTest() as (http_client, _):
+            # given
+            core_client = CoreHttpClient(http_client)
+
+            # and
+            note = NoteBuilder().build()
+            body: dict[str, object] = {
+                "title": note.title,
+                "content": note.content,
+            }
+
+            # when
+            response = await core_client.post_notes(body=body)
+
+            # then
+            assert response.status_code == status.HTTP_401_UNAUTHORIZED
@@ -0,0 +1,231 @@
+import secrets
+from datetime import timedelta
+
+import pytest
+from fastapi import status
+
+from tests.auth.builders.domain.entities.user_builder import UserBuilder
+from tests.auth.helpers.generate_token import generate_token
+from tests.core.builders.domain.entities.category_builder import (
+    CategoryBuilder,
+)
+from tests.core.builders.domain.entities.note_builder import NoteBuilder
+from tests.core.builders.domain.entities.note_category_builder import (
+    NoteCategoryBuilder,
+)
+from tests.core.helpers.core_database_client import CoreDatabaseClient
+from tests.core.helpers.core_http_client import CoreHttpClient
+from tests.helpers.server_test import ServerTest
+
+from src.common.drivers.rest.etag import entity_tag
+
+
+@pytest.mark.anyio(scope="class")
+@pytest.mark.describe("PUT /notes/{note_id}")
+class TestPutNote:
+    @pytest.mark.it(f"Should return {status.HTTP_200_OK} OK")
+    async def test_put_note_ok(self) -> None:
+        secret_key = secrets.token_hex(64)
+        env = {"JWT_SECRET_KEY": secret_key}
+        async with ServerTest(env) as (http_client, pool):
+            # given
+            core_client = CoreHttpClient(http_client)
+            core_database_client = CoreDatabaseClient(pool)
+
+            # and
+            current_user = UserBuilder().build()
+            await core_database_client.create_user(current_user)
+
+            # and
+            note = NoteBuilder().with_user_id(current_user.id).build()
+            old_category = (
+                CategoryBuilder().with_user_id(current_user.id).build()
+            )
+            new_category = (
+                CategoryBuilder().with_user_id(current_user.id).build()
+            )
+            await core_database_client.create_note(note)
+            await core_database_client.create_category(old_category)
+            await core_database_client.create_category(new_category)
+            await core_database_client.create_note_category(
+                NoteCategoryBuilder()
+                .with_note_id(note.id)
+                .with_category_id(old_category.id)
+                .build()
+            )
+
+            # and
+            token = generate_token(current_user.id, secret_key=secret_key)
+
+            # and
+            changes = NoteBuilder().build()
+            body: dict[str, object] = {
+                "title": changes.title,
+                "content": changes.content,
+                "category_ids": [str(new_category.id)],
+            }
+
+            # when
+            response = await core_client.put_note(note.id, token, body)
+
+            # then
+            assert response.status_code == status.HTTP_200_OK
+
+            # and
+            note_from_db = await core_database_client.select_note(note.id)
+            assert note_from_db is not None
+            assert note_from_db.title == changes.title
+            assert note_from_db.content == changes.content
+            assert note_from_db.updated_at > note.updated_at
+
+            # and
+            category_ids = await core_database_client.select_note_category_ids(
+                note.id,
+            )
+            assert category_ids == [new_category.id]
+
+            # and
+            assert response.json() == {
+                **note_from_db.model_dump(mode="json", exclude={"user_id"}),
+                "category_ids": [str(new_category.id)],
+            }
+
+    @pytest.mark.it(
+        f"Should return {status.HTTP_404_NOT_FOUND} "
+        "NOT FOUND when the note belongs to another user"
+    )
+    async def test_put_note_not_found(self) -> None:
+        secret_key = secrets.token_hex(64)
+        env = {"JWT_SECRET_KEY": secret_key}
+        async with ServerTest(env) as (http_client, pool):
+            # given
+            core_client = CoreHttpClient(http_client)
+            core_database_client = CoreDatabaseClient(pool)
+
+            # and
+            current_user = UserBuilder().build()
+            another_user = UserBuilder().build()
+            await core_database_client.create_user(current_user)
+            await core_database_client.create_user(another_user)
+
+            # and
+            note = NoteBuilder().with_user_id(another_user.id).build()
+            await core_database_client.create_note(note)
+
+            # and
+            token = generate_token(current_user.id, secret_key=secret_key)
+
+            # and
+            changes = NoteBuilder().build()
+            body: dict[str, object] = {
+                "title": changes.title,
+                "content": changes.content,
+            }
+
+            # when
+            response = await core_client.put_note(note.id, token, body)
+
+            # then
+            assert response.status_code == status.HTTP_404_NOT_FOUND
+
+            # and
+            note_from_db = await core_database_client.select_note(note.id)
+            assert note_from_db == note
+
+    @pytest.mark.it(
+        "Should update the note and return its new ETag "
+        "when If-Match matches the current version"
+    )
+    async def test_put_note_if_match(self) -> None:
+        secret_key = secrets.token_hex(64)
+        env = {"JWT_SECRET_KEY": secret_key}
+        async with ServerTest(env) as (http_client, pool):
+            # given
+            core_client = CoreHttpClient(http_client)
+            core_database_client = CoreDatabaseClient(pool)
+
+            # and
+            current_user = UserBuilder().build()
+            await core_database_client.create_user(current_user)
+
+            # and
+            note = NoteBuilder().with_user_id(current_user.id).build()
+            await core_database_client.create_note(note)
+
+            # and
+            token = generate_token(current_user.id, secret_key=secret_key)
+            changes = NoteBuilder().build()
+            body: dict[str, object] = {
+                "title": changes.title,
+                "content": changes.content,
+                "category_ids": [],
+            }
+
+            # when
+            response = await core_client.put_note(
+                note.id,
+                token,
+                body,
+                headers={"If-Match": entity_tag(note.id, note.updated_at)},
+            )
+
+            # then
+            assert response.status_code == status.HTTP_200_OK
+
+            # and
+            note_from_db = await core_database_client.select_note(note.id)
+            assert note_from_db is not None
+            assert note_from_db.title == changes.title
+            assert response.headers["ETag"] == entity_tag(
+                note.id,
+                note_from_db.updated_at,
+            )
+
+    @pytest.mark.it(
+        f"Should return {status.HTTP_412_PRECONDITION_FAILED} "
+        "PRECONDITION FAILED when If-Match is stale"
+    )
+    async def test_put_note_precondition_failed(self) -> None:
+        secret_key = secrets.token_hex(64)
+        env = {"JWT_SECRET_KEY": secret_key}
+        async with ServerTest(env) as (http_client, pool):
+            # given
+            core_client = CoreHttpClient(http_client)
+            core_database_client = CoreDatabaseClient(pool)
+
+            # and
+            current_user = UserBuilder().build()
+            await core_database_client.create_user(current_user)
+
+            # and
+            note = NoteBuilder().with_user_id(current_user.id).build()
+            await core_database_client.create_note(note)
+
+            # and
+            token = generate_token(current_user.id, secret_key=secret_key)
+            stale_tag = entity_tag(
+                note.id,
+                note.updated_at - timedelta(seconds=1),
+            )
+            changes = NoteBuilder().build()
+            body: dict[str, object] = {
+                "title": changes.title,
+                "content": changes.content,
+                "category_ids": [],
+            }
+
+            # when
+            response = await core_client.put_note(
+                note.id,
+                token,
+                body,
+                headers={"If-Match": stale_tag},
+            )
+
+            # then
+            assert response.status_code == status.HTTP_412_PRECONDITION_FAILED
+            assert response.json() == {"detail": "Note has changed"}
+
+            # and
+            note_from_db = await core_database_client.select_note(note.id)
+            assert note_from_db == note
@@ -0,0 +1,109 @@
+import secrets
+
+import pytest
+from fastapi import status
+
+from tests.auth.builders.domain.entities.user_builder import UserBuilder
+from tests.auth.helpers.generate_token import generate_token
+from tests.core.builders.domain.entities.note_builder import NoteBuilder
+from tests.core.helpers.core_database_client import CoreDatabaseClient
+from tests.core.helpers.core_http_client import CoreHttpClient
+from tests.helpers.server_test import ServerTest
+
+
+@pytest.mark.anyio(scope="class")
+@pytest.mark.describe("GET /notes/search")
+class TestSearchNotes:
+    @pytest.mark.it(f"Should return {status.HTTP_200_OK} OK, page by page")
+    async def test_search_notes_ok(self) -> None:
+        secret_key = secrets.token_hex(64)
+        env = {"JWT_SECRET_KEY": secret_key}
+        async with ServerTest(env) as (http_client, pool):
+            # given
+            core_client = CoreHttpClient(http_client)
+            core_database_client = CoreDatabaseClient(pool)
+
+            # and
+            current_user = UserBuilder().build()
+            await core_database_client.create_user(current_user)
+
+            # and
+            notes = [
+                NoteBuilder()
+                .with_user_id(current_user.id)
+                .with_content(f"keyword {index}")
+                .build()
+                for index in range(3)
+            ]
+            for note in notes:
+                await core_database_client.create_note(note)
+            await core_database_client.create_note(
+                NoteBuilder()
+                .with_user_id(current_user.id)
+                .with_content("unrelated")
+                .build(),
+            )
+
+            # and
+            token = generate_token(current_user.id, secret_key=secret_key)
+
+            # when
+            first = await core_client.search_notes(
+                token,
+                {"q": "keyword", "limit": 2},
+            )
+            second = await core_client.search_notes(
+                token,
+                {
+                    "q": "keyword",
+                    "limit": 2,
+                    "cursor": first.json()["next_cursor"],
+                },
+            )
+
+            # then
+            assert first.status_code == status.HTTP_200_OK
+            assert second.status_code == status.HTTP_200_OK
+
+            # and
+            items = [*first.json()["items"], *second.json()["items"]]
+            assert {item["id"] for item in items} == {
+                str(note.id) for note in notes
+            }
+            assert second.json()["next_cursor"] is None
+
+            # and
+            item = items[0]
+            assert set(item.keys()) == {
+                "id",
+                "title",
+                "headline",
+                "rank",
+                "updated_at",
+            }
+            assert "<mark>keyword</mark>" in item["headline"]
+
+    @pytest.mark.it(
+        f"Should return {status.HTTP_422_UNPROCESSABLE_ENTITY} "
+        "UNPROCESSABLE ENTITY when the query is missing"
+    )
+    async def test_search_notes_missing_query(self) -> None:
+        secret_key = secrets.token_hex(64)
+        env = {"JWT_SECRET_KEY": secret_key}
+        async with ServerTest(env) as (http_client, pool):
+            # given
+            core_client = CoreHttpClient(http_client)
+            core_database_client = CoreDatabaseClient(pool)
+
+            # and
+            current_user = UserBuilder().build()
+            await core_database_client.create_user(current_user)
+
+            # and
+            token = generate_token(current_user.id, secret_key=secret_key)
+
+            # when
+            response = await core_client.search_notes(token)
+
+            # then
+            assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
@@ -2,7 +2,13 @@ from uuid import UUID
 
 from tests.auth.helpers.auth_database_client import AuthDatabaseClient
 
-from src.core.domain.entities import Category, Note, NoteCategory
+from src.core.domain.entities import (
+    Category,
+    Note,
+    NoteCategory,
+    Tombstone,
+    TombstoneEntityEnum,
+)
 
 
 class CoreDatabaseClient(AuthDatabaseClient):
@@ -19,6 +25,16 @@ class CoreDatabaseClient(AuthDatabaseClient):
 
         return Note.model_validate(result[0])
 
+    async def select_notes_by_user_id(self, user_id: UUID) -> list[Note]:
+        cursor = await self.query(
+            "SELECT * FROM notes WHERE user_id = %s ORDER BY title;",
+            [user_id],
+        )
+
+        result = await cursor.fetchall()
+
+        return [Note.model_validate(row) for row in result]
+
     async def create_note(self, note: Note) -> None:
         await self.query(
             """
@@ -95,3 +111,70 @@ class CoreDatabaseClient(AuthDatabaseClient):
             return None
 
         return NoteCategory.model_validate(result[0])
+
+    async def select_note_category_ids(self, note_id: UUID) -> list[UUID]:
+        cursor = await self.query(
+            """
+            SELECT category_id FROM notes_categories
+            WHERE note_id = %s
+            ORDER BY category_id;
+            """,
+            [note_id],
+        )
+
+        result = await cursor.fetchall()
+
+        return [row["category_id"] for row in result]
+
+    async def create_note_category(self, note_category: NoteCategory) -> None:
+        await self.query(
+            """
+            INSERT INTO notes_categories (
+                note_id,
+                category_id,
+                updated_at,
+                created_at
+            ) VALUES (
+                %(note_id)s,
+                %(category_id)s,
+                %(updated_at)s,
+                %(created_at)s
+            );
+            """,
+            note_category.model_dump(),
+        )
+
+    async def select_tombstone(
+        self,
+        entity: TombstoneEntityEnum,
+        id_: UUID,
+    ) -> Tombstone | None:
+        cursor = await self.query(
+            "SELECT * FROM tombstones WHERE entity = %s AND id = %s;",
+            [entity.value, id_],
+        )
+
+        result = await cursor.fetchall()
+
+        if len(result) == 0:
+            return None
+
+        return Tombstone.model_validate(result[0])
+
+    async def create_tombstone(self, tombstone: Tombstone) -> None:
+        await self.query(
+            """
+            INSERT INTO tombstones (
+                entity,
+                id,
+                user_id,
+                deleted_at
+            ) VALUES (
+                %(entity)s,
+                %(id)s,
+                %(user_id)s,
+                %(deleted_at)s
+            );
+            """,
+            tombstone.model_dump(mode="json"),
+        )
@@ -0,0 +1,132 @@
+from uuid import UUID
+
+import httpx
+
+
+class CoreHttpClient:
+    def __init__(self, client: httpx.AsyncClient) -> None:
+        self._client = client
+
+    async def post_notes(
+        self,
+        token: str | None = None,
+        body: dict[str, object] | None = None,
+    ) -> httpx.Response:
+        headers = {"Authorization": f"Bearer {token}"} if token else None
+        return await self._client.post("/notes/", headers=headers, json=body)
+
+    async def get_notes(
+        self,
+        token: str | None = None,
+        params: dict[str, str | int] | None = None,
+    ) -> httpx.Response:
+        headers = {"Authorization": f"Bearer {token}"} if token else None
+        return await self._client.get(
+            "/notes/",
+            headers=headers,
+            params=params,
+        )
+
+    async def sync(
+        self,
+        token: str | None = None,
+        params: dict[str, str | int] | None = None,
+    ) -> httpx.Response:
+        headers = {"Authorization": f"Bearer {token}"} if token else None
+        return await self._client.get(
+            "/sync/",
+            headers=headers,
+            params=params,
+        )
+
+    async def search_notes(
+        self,
+        token: str | None = None,
+        params: dict[str, str | int] | None = None,
+    ) -> httpx.Response:
+        headers = {"Authorization": f"Bearer {token}"} if token else None
+        return await self._client.get(
+            "/notes/search",
+            headers=headers,
+            params=params,
+        )
+
+    async def autocomplete_notes(
+        self,
+        token: str | None = None,
+        params: dict[str, str | int] | None = None,
+    ) -> httpx.Response:
+        headers = {"Authorization": f"Bearer {token}"} if token else None
+        return await self._client.get(
+            "/notes/autocomplete",
+            headers=headers,
+            params=params,
+        )
+
+    async def autocomplete_categories(
+        self,
+        token: str | None = None,
+        params: dict[str, str | int] | None = None,
+    ) -> httpx.Response:
+        headers = {"Authorization": f"Bearer {token}"} if token else None
+        return await self._client.get(
+            "/categories/autocomplete",
+            headers=headers,
+            params=params,
+        )
+
+    async def export_notes(self, token: str | None = None) -> httpx.Response:
+        headers = {"Authorization": f"Bearer {token}"} if token else None
+        return await self._client.get("/notes/export", headers=headers)
+
+    async def import_notes(
+        self,
+        token: str | None = None,
+        content: bytes = b"",
+    ) -> httpx.Response:
+        headers = {
+            "Content-Type": "application/x-ndjson",
+            **({"Authorization": f"Bearer {token}"} if token else {}),
+        }
+        return await self._client.post(
+            "/notes/import",
+            headers=headers,
+            content=content,
+        )
+
+    async def get_note(
+        self,
+        note_id: UUID,
+        token: str | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> httpx.Response:
+        headers = {
+            **({"Authorization": f"Bearer {token}"} if token else {}),
+            **(headers or {}),
+        }
+        return await self._client.get(f"/notes/{note_id}", headers=headers)
+
+    async def put_note(
+        self,
+        note_id: UUID,
+        token: str | None = None,
+        body: dict[str, object] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> httpx.Response:
+        headers = {
+            **({"Authorization": f"Bearer {token}"} if token else {}),
+            **(headers or {}),
+        }
+        return await self._client.put(
+            f"/notes/{note_id}",
+            headers=headers,
+            json=body,
+        )
+
+    async def delete_note(
+        self,
+        note_id: UUID,
+        token: str | None = None,
+    ) -> httpx.Response:
+        headers = {"Authorization": f"Bearer {token}"} if token else None
+        return await self._client.delete(f"/notes/{note_id}", headers=headers)
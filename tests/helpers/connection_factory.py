@@ -0,0 +1,15 @@
+from psycopg import AsyncConnection
+from psycopg.rows import DictRow
+
+from src.common.adapters.postgres.postgres_connection_repository import (
+    ConnectionFactory,
+)
+
+
+def connection_factory(
+    connection: AsyncConnection[DictRow],
+) -> ConnectionFactory:
+    async def get_connection() -> AsyncConnection[DictRow]:
+        return connection
+
+    return get_connection